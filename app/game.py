@@ -117,6 +117,18 @@ class Game:
     def pop(cls, *args, **kwargs):
         cls.registry.pop(*args, **kwargs)
 
+    @classmethod
+    def after(cls, seconds, func, *args, **kwargs):
+        return cls.registry.timers.schedule(seconds, func, *args, **kwargs)
+
+    @classmethod
+    def cancel(cls, timer):
+        return cls.registry.timers.cancel(timer)
+
+    @classmethod
+    def tween(cls, target, attribute, value, duration, easing="linear", callback=None, kind=None):
+        return cls.registry.tweens.to(target, attribute, value, duration, easing, callback, kind)
+
     @classmethod
     def run(cls, width=640, height=480, caption="Game"):
         cls.registry.window = GameWindow(cls.registry, width=width, height=height, caption=caption)
@@ -1,11 +1,15 @@
-from pybox.containers import stack
+from pybox.containers import pstack
+from pybox.containers import timerwheel
+from pybox.math import tween
 
 class Registry:
     def __init__(self):
         self._window = None
-        self._states = stack.Stack()
+        self._states = pstack.PStack()
         self._init_states = []
         self._commands = {}
+        self._timers = timerwheel.TimerWheel()
+        self._tweens = tween.TweenEngine()
 
     def add_command(self, name, command):
         command_name = command.__qualname__
@@ -32,7 +36,7 @@ class Registry:
         if from_state is not None:
             self._window.on_leave(*args, **kwargs)
 
-        self._states.push(to_state)
+        self._states = self._states.push(to_state)
 
         if to_state.__class__.__name__ not in self._init_states:
             self._window.on_load()
@@ -41,7 +45,10 @@ class Registry:
         self._window.on_enter(from_state, *args, **kwargs)
 
     def switch(self, state, *args, **kwargs):
-        self.change_state(self._states.pop(), state, *args, **kwargs)
+        from_state   = self._states.peek()
+        self._states = self._states.pop()
+
+        self.change_state(from_state, state, *args, **kwargs)
 
     def push(self, state, *args, **kwargs):
         self.change_state(self.current, state, *args, **kwargs)
@@ -51,9 +58,15 @@ class Registry:
             raise Exception("Nothing to pop!")
 
         self._window.on_leave(*args, **kwargs)
-        self._states.pop()
+        self._states = self._states.pop()
         self._window.on_resume(*args, **kwargs)
 
+    def snapshot(self):
+        return self._states
+
+    def restore(self, snapshot):
+        self._states = snapshot
+
     @property
     def current(self):
         return self._states.peek()
@@ -62,6 +75,14 @@ class Registry:
     def states(self):
         return self._states
 
+    @property
+    def timers(self):
+        return self._timers
+
+    @property
+    def tweens(self):
+        return self._tweens
+
     @property
     def commands(self):
         return self._commands
@@ -13,7 +13,7 @@ class GameStates:
         pass
 
     def pop(self, *args, **kwargs):
-        if len(self.states.elements) <= 1:
+        if len(self.states) <= 1:
             raise Exception("No states to pop!")
 
         self.window.on_leave(self.states.pop(), *args, **kwargs)
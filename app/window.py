@@ -33,6 +33,9 @@ class GameWindow(window.Window):
             func(self._registry.current)
 
     def on_update(self, dt):
+        self._registry.timers.advance(dt)
+        self._registry.tweens.advance(dt)
+
         for func in self._registry.get_command("update"):
             func(self._registry.current, dt)
 
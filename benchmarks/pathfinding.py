@@ -0,0 +1,72 @@
+"""Grid pathfinding benchmark: PQueue vs RadixHeap.
+
+Runs Dijkstra over a square grid with random integer
+step costs, once per queue type, and prints the timings.
+
+Usage:
+    python -m pybox.benchmarks.pathfinding [size] [repeat]
+"""
+
+import random
+import sys
+import time
+
+from pybox.containers.pqueue import PQueue
+from pybox.containers.radixheap import RadixHeap
+
+
+def make_grid(size, seed=1, max_cost=9):
+    rng = random.Random(seed)
+
+    return [rng.randint(1, max_cost) for i in range(size * size)]
+
+def dijkstra(grid, size, queue_class):
+    dist  = [None] * (size * size)
+    queue = queue_class([(0, 0)])
+    dist[0] = 0
+
+    while not queue.isEmpty():
+        node, cost = queue.dequeue()
+
+        if cost > dist[node]:
+            continue
+
+        x = node % size
+        y = node // size
+
+        for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+            if 0 <= nx < size and 0 <= ny < size:
+                other    = ny * size + nx
+                new_cost = cost + grid[other]
+
+                if dist[other] is None or new_cost < dist[other]:
+                    dist[other] = new_cost
+                    queue.enqueue((other, new_cost))
+
+    return dist
+
+def run(size=300, repeat=3):
+    grid    = make_grid(size)
+    results = {}
+
+    for queue_class in (PQueue, RadixHeap):
+        best = float('inf')
+
+        for i in range(repeat):
+            start = time.perf_counter()
+            dist  = dijkstra(grid, size, queue_class)
+            best  = min(best, time.perf_counter() - start)
+
+        results[queue_class.__name__] = (best, dist)
+
+    baseline = results['PQueue'][1]
+
+    print('grid {0}x{0} ({1} nodes), best of {2}'.format(size, size * size, repeat))
+
+    for name, (best, dist) in results.items():
+        assert dist == baseline, '{} disagrees with PQueue'.format(name)
+        print('  {:<10} {:8.3f}s'.format(name, best))
+
+
+if __name__ == '__main__':
+    run(*[int(arg) for arg in sys.argv[1:3]])
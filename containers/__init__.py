@@ -1,3 +1,12 @@
+from pybox.containers import csrgraph
+from pybox.containers import lrucache
+from pybox.containers import pool
 from pybox.containers import pqueue
+from pybox.containers import pstack
 from pybox.containers import queue
-from pybox.containers import stack
\ No newline at end of file
+from pybox.containers import radixheap
+from pybox.containers import ringbuffer
+from pybox.containers import sparseset
+from pybox.containers import stack
+from pybox.containers import threadsafe
+from pybox.containers import timerwheel
\ No newline at end of file
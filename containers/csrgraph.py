@@ -0,0 +1,347 @@
+import mmap
+import struct
+import sys
+import weakref
+
+from array import array
+
+_HEADER  = struct.Struct('<4sIqq')
+_MAGIC   = b'CSRG'
+_VERSION = 1
+
+
+class CSRGraph:
+    """Compressed sparse row graph data structure.
+    Stores a directed, weighted graph as three flat arrays:
+    the edges of node `n` are `targets[offsets[n]:offsets[n + 1]]`
+    with matching `weights`.
+
+    Note:
+        Nodes are integers from 0 to `len(graph) - 1`.
+        Build graphs with `CSRGraphBuilder` or `from_adjacency`.
+
+    Args:
+        offsets(array): node edge offsets, length nodes + 1
+        targets(array): edge target nodes
+        weights(array): edge weights
+
+    Examples:
+        >>> g1 = CSRGraph.from_adjacency({0: [(1, 2.0), (2, 5.0)], 1: [(2, 1.0)]})
+        >>> print(len(g1), g1.edge_count)
+        3 3
+        >>> print(list(g1.neighbours(0)))
+        [(1, 2.0), (2, 5.0)]
+    """
+
+    def __init__(self, offsets, targets, weights):
+        self._offsets = offsets
+        self._targets = targets
+        self._weights = weights
+        self._mmap    = None
+        self._exports = []
+
+    @classmethod
+    def from_adjacency(cls, adjacency, nodes=None):
+        """Build a graph from a dict of lists of (target, weight) tuples.
+
+        Args:
+            adjacency(dict): node -> list of (target, weight)
+            nodes(int): node count, inferred if omitted (optional)
+
+        Returns:
+            CSRGraph
+        """
+
+        builder = CSRGraphBuilder(nodes or 0)
+
+        for node, edges in adjacency.items():
+            for target, weight in edges:
+                builder.add_edge(node, target, weight)
+
+        return builder.build()
+
+    def neighbours(self, node):
+        """Iterate over the (target, weight) edges of a node.
+
+        Args:
+            node(int): node
+
+        Returns:
+            iterator
+        """
+
+        start = self._offsets[node]
+        end   = self._offsets[node + 1]
+
+        return zip(self._targets[start:end], self._weights[start:end])
+
+    def degree(self, node):
+        """Number of edges leaving a node.
+
+        Args:
+            node(int): node
+
+        Returns:
+            int
+        """
+
+        return self._offsets[node + 1] - self._offsets[node]
+
+    def save(self, path):
+        """Write the graph to a binary file that `load` can map.
+
+        Args:
+            path(str): file path
+        """
+
+        arrays = [array('q', self._offsets), array('q', self._targets), array('d', self._weights)]
+
+        if sys.byteorder != 'little':
+            for values in arrays:
+                values.byteswap()
+
+        with open(path, 'wb') as f:
+            f.write(_HEADER.pack(_MAGIC, _VERSION, len(self), self.edge_count))
+
+            for values in arrays:
+                values.tofile(f)
+
+    @classmethod
+    def load(cls, path, use_mmap=True):
+        """Read a graph written by `save`.
+
+        Note:
+            With `use_mmap` the arrays are read-only views into a
+            memory-mapped file, so nothing is copied up front.
+            Call `close` when done with the graph, after dropping
+            any arrays taken from `as_numpy`, which share the map.
+
+        Raises:
+            ValueError: If the file is not a saved CSRGraph.
+
+        Args:
+            path(str): file path
+            use_mmap(bool): map the file instead of reading it (optional)
+
+        Returns:
+            CSRGraph
+        """
+
+        with open(path, 'rb') as f:
+            magic, version, nodes, edges = _HEADER.unpack(f.read(_HEADER.size))
+
+            if magic != _MAGIC or version != _VERSION:
+                raise ValueError('Not a CSRGraph file: {}'.format(path))
+
+            sizes = ((nodes + 1) * 8, edges * 8, edges * 8)
+
+            if use_mmap and sys.byteorder == 'little':
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                view, views = _map_views(mapped, sizes)
+
+                graph = cls(*views)
+                graph._mmap = (mapped, view, sizes)
+
+                return graph
+
+            arrays = []
+
+            for size, typecode in zip(sizes, 'qqd'):
+                values = array(typecode)
+                values.frombytes(f.read(size))
+
+                if sys.byteorder != 'little':
+                    values.byteswap()
+
+                arrays.append(values)
+
+            return cls(*arrays)
+
+    def close(self):
+        """Release the memory-mapped file, if any.
+
+        Raises:
+            BufferError: Arrays from `as_numpy` (or other buffers
+                of the arrays) are still alive. The graph stays
+                open and usable; drop them and close again.
+        """
+
+        if self._mmap is None:
+            return
+
+        if any(ref() is not None for ref in self._exports):
+            raise BufferError('CSRGraph arrays from as_numpy are still in use; delete them before close.')
+
+        mapped, view, sizes = self._mmap
+
+        for values in (self._offsets, self._targets, self._weights):
+            values.release()
+
+        view.release()
+
+        try:
+            mapped.close()
+        except BufferError:
+            # Someone else holds a buffer of the map: reopen the views
+            view, views = _map_views(mapped, sizes)
+
+            self._mmap = (mapped, view, sizes)
+            self._offsets, self._targets, self._weights = views
+
+            raise BufferError('CSRGraph arrays are still exported; release them before close.')
+
+        self._mmap    = None
+        self._exports = []
+        self._offsets = self._targets = self._weights = None
+
+    def as_numpy(self):
+        """Zero-copy NumPy views of (offsets, targets, weights).
+
+        Note:
+            For a memory-mapped graph the arrays share the map, so
+            `close` refuses to run while any of them is alive.
+
+        Returns:
+            tuple
+        """
+
+        import numpy
+
+        arrays = (
+            numpy.frombuffer(self._offsets, dtype=numpy.int64),
+            numpy.frombuffer(self._targets, dtype=numpy.int64),
+            numpy.frombuffer(self._weights, dtype=numpy.float64)
+        )
+
+        if self._mmap is not None:
+            self._exports = [ref for ref in self._exports if ref() is not None]
+            self._exports += [weakref.ref(values) for values in arrays]
+
+        return arrays
+
+    @property
+    def offsets(self):
+        return self._offsets
+
+    @property
+    def targets(self):
+        return self._targets
+
+    @property
+    def weights(self):
+        return self._weights
+
+    @property
+    def edge_count(self):
+        return len(self._targets)
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __repr__(self):
+        return 'CSRGraph(nodes=%s, edges=%s)' % (len(self), self.edge_count)
+
+
+def _map_views(mapped, sizes):
+    view  = memoryview(mapped)
+    start = _HEADER.size
+    views = []
+
+    for size, typecode in zip(sizes, 'qqd'):
+        views.append(view[start:start + size].cast(typecode))
+        start += size
+
+    return view, views
+
+
+class CSRGraphBuilder:
+    """Collects edges and builds a `CSRGraph`.
+
+    Args:
+        nodes(int): initial node count (optional)
+
+    Examples:
+        >>> b1 = CSRGraphBuilder()
+        >>> b1.add_edge(0, 1, 2.0)
+        >>> b1.add_undirected_edge(1, 2)
+        >>> g1 = b1.build()
+        >>> print(len(g1), list(g1.neighbours(1)))
+        3 [(2, 1.0)]
+    """
+
+    def __init__(self, nodes=0):
+        self._nodes   = nodes
+        self._sources = array('q')
+        self._targets = array('q')
+        self._weights = array('d')
+
+    def add_node(self):
+        """Add a node without edges.
+
+        Returns:
+            int: new node
+        """
+
+        self._nodes += 1
+
+        return self._nodes - 1
+
+    def add_edge(self, source, target, weight=1.0):
+        """Add a directed edge.
+
+        Args:
+            source(int): source node
+            target(int): target node
+            weight(float): edge weight (optional)
+        """
+
+        self._sources.append(source)
+        self._targets.append(target)
+        self._weights.append(weight)
+
+        self._nodes = max(self._nodes, source + 1, target + 1)
+
+    def add_undirected_edge(self, a, b, weight=1.0):
+        """Add an edge in both directions.
+
+        Args:
+            a(int): first node
+            b(int): second node
+            weight(float): edge weight (optional)
+        """
+
+        self.add_edge(a, b, weight)
+        self.add_edge(b, a, weight)
+
+    def build(self):
+        """Sort the edges by source node into a `CSRGraph`.
+        Edges of a node keep the order they were added in.
+
+        Returns:
+            CSRGraph
+        """
+
+        nodes   = self._nodes
+        offsets = array('q', bytes(8 * (nodes + 1)))
+
+        for source in self._sources:
+            offsets[source + 1] += 1
+
+        for node in range(nodes):
+            offsets[node + 1] += offsets[node]
+
+        count   = len(self._sources)
+        cursor  = array('q', offsets[:-1])
+        targets = array('q', bytes(8 * count))
+        weights = array('d', bytes(8 * count))
+
+        for source, target, weight in zip(self._sources, self._targets, self._weights):
+            pos = cursor[source]
+            targets[pos] = target
+            weights[pos] = weight
+            cursor[source] = pos + 1
+
+        return CSRGraph(offsets, targets, weights)
+
+    def __len__(self):
+        return self._nodes
@@ -0,0 +1,168 @@
+from collections import OrderedDict
+
+
+class LRUCache:
+    """Least recently used cache data structure.
+    Once the total cost of the cached values exceeds
+    `capacity`, the least recently used ones are evicted.
+
+    Note:
+        Every value costs 1 unless a cost is passed to `put`,
+        so `capacity` can be an item count or, for example,
+        a texture budget in bytes. A value costing more than
+        the whole capacity is still kept until the next `put`.
+
+        `on_evict(key, value)` is called for every value the
+        cache drops by itself, including on `clear` and when
+        `put` replaces a key with a different object, but not
+        for values taken out with `remove`.
+
+    Args:
+        capacity(int): max total cost, None for no limit (optional)
+        on_evict(callable): eviction callback (optional)
+
+    Examples:
+        >>> c1 = LRUCache(2)
+        >>> c1.put('foo', 1)
+        >>> c1.put('bar', 2)
+        >>> v1 = c1.get('foo')
+        >>> c1.put('baz', 3)
+        >>> print(c1)
+        {'foo': 1, 'baz': 3}
+    """
+
+    def __init__(self, capacity=None, on_evict=None):
+        self._entries  = OrderedDict()
+        self._capacity = capacity
+        self._on_evict = on_evict
+        self._cost     = 0
+
+        self._hits   = 0
+        self._misses = 0
+
+    def clear(self):
+        """Evict all values from the cache.
+
+        Examples:
+            >>> c1 = LRUCache(2)
+            >>> c1.put('foo', 1)
+            >>> c1.clear()
+            >>> print(c1)
+            {}
+        """
+
+        while self._entries:
+            self._evict()
+
+    def get(self, key, default=None):
+        """Get a cached value and mark it as recently used.
+            Returns `default` if key is not cached.
+
+        Args:
+            key(mixed): cache key
+            default(mixed): value on a miss (optional)
+
+        Examples:
+            >>> c1 = LRUCache(2)
+            >>> c1.put('foo', 1)
+            >>> print(c1.get('foo'), c1.get('bar'))
+            1 None
+            >>> print(c1.hits, c1.misses)
+            1 1
+
+        Returns:
+            mixed: cached value or default
+        """
+
+        entry = self._entries.get(key)
+
+        if entry is None:
+            self._misses += 1
+            return default
+
+        self._hits += 1
+        self._entries.move_to_end(key)
+
+        return entry[0]
+
+    def put(self, key, value, cost=1):
+        """Cache a value and mark it as recently used.
+        Then evict least recently used values over capacity.
+
+        Args:
+            key(mixed): cache key
+            value(mixed): value to cache
+            cost(int): value cost (optional)
+        """
+
+        old = self._entries.pop(key, None)
+
+        self._entries[key] = (value, cost)
+        self._cost += cost
+
+        if old is not None:
+            self._cost -= old[1]
+
+            # The replaced value is gone from the cache, same as an eviction
+            if old[0] is not value and self._on_evict is not None:
+                self._on_evict(key, old[0])
+
+        if self._capacity is not None:
+            while self._cost > self._capacity and len(self._entries) > 1:
+                self._evict()
+
+    def remove(self, key):
+        """Take a value out of the cache without evicting it.
+            Returns None if key is not cached.
+
+        Args:
+            key(mixed): cache key
+
+        Returns:
+            mixed: removed value or None
+        """
+
+        entry = self._entries.pop(key, None)
+
+        if entry is None:
+            return None
+
+        self._cost -= entry[1]
+
+        return entry[0]
+
+    def _evict(self):
+        key, (value, cost) = self._entries.popitem(last=False)
+        self._cost -= cost
+
+        if self._on_evict is not None:
+            self._on_evict(key, value)
+
+    @property
+    def capacity(self):
+        return self._capacity
+
+    @property
+    def cost(self):
+        """Total cost of the cached values."""
+        return self._cost
+
+    @property
+    def hits(self):
+        return self._hits
+
+    @property
+    def misses(self):
+        return self._misses
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return '{}({})'.format(self.__class__, self)
+
+    def __str__(self):
+        return '{}'.format({key: entry[0] for key, entry in self._entries.items()})
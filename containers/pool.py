@@ -0,0 +1,154 @@
+class Pool:
+    """Object pool data structure.
+    Keeps released objects around so they can be handed
+    out again instead of allocating new ones.
+
+    Note:
+        `factory` is called with the arguments passed to
+        `acquire` when the pool has no idle object.
+        Otherwise an idle object is reused and `reset` is
+        called with it followed by the same arguments.
+
+    Args:
+        factory(callable): creates a new object
+        reset(callable): reinitializes a reused object (optional)
+        capacity(int): max number of idle objects kept (optional)
+
+    Examples:
+        >>> p1 = Pool(list, reset=lambda l: l.clear())
+        >>> l1 = p1.acquire()
+        >>> l1.append(1)
+        >>> p1.release(l1)
+        >>> l2 = p1.acquire()
+        >>> print(l2 is l1, l2)
+        True []
+        >>> print(p1.hits, p1.misses)
+        1 1
+    """
+
+    def __init__(self, factory, reset=None, capacity=None):
+        self._factory  = factory
+        self._reset    = reset
+        self._capacity = capacity
+        self._idle     = []
+        self._live     = set()
+
+        self._hits       = 0
+        self._misses     = 0
+        self._high_water = 0
+
+    def acquire(self, *args, **kwargs):
+        """Hand out an idle object, or create one if none are left.
+
+        Args:
+            args(mixed): passed to `reset` or `factory`
+            kwargs(mixed): passed to `reset` or `factory`
+
+        Returns:
+            mixed: ready to use object
+        """
+
+        if self._idle:
+            obj = self._idle.pop()
+            self._hits += 1
+
+            if self._reset is not None:
+                self._reset(obj, *args, **kwargs)
+        else:
+            obj = self._factory(*args, **kwargs)
+            self._misses += 1
+
+        self._live.add(id(obj))
+
+        if len(self._live) > self._high_water:
+            self._high_water = len(self._live)
+
+        return obj
+
+    def release(self, obj):
+        """Return an object to the pool.
+            Dropped if the pool already holds `capacity` idle objects.
+
+        Note:
+            The caller must not use `obj` after releasing it.
+
+        Raises:
+            AttributeError: `obj` is not in use, it was already
+                released or did not come from this pool.
+
+        Args:
+            obj(mixed): object from `acquire`
+        """
+
+        if id(obj) not in self._live:
+            raise AttributeError('Object is not in use by this pool: {}'.format(obj))
+
+        self._live.remove(id(obj))
+
+        if self._capacity is None or len(self._idle) < self._capacity:
+            self._idle.append(obj)
+
+    def clear(self):
+        """Drop all idle objects and reset the stats.
+            Objects still in use may be released afterwards.
+        """
+
+        self._idle.clear()
+
+        self._hits       = 0
+        self._misses     = 0
+        self._high_water = len(self._live)
+
+    @property
+    def capacity(self):
+        return self._capacity
+
+    @property
+    def available(self):
+        """Number of idle objects."""
+        return len(self._idle)
+
+    @property
+    def in_use(self):
+        """Number of acquired objects not yet released."""
+        return len(self._live)
+
+    @property
+    def hits(self):
+        """Number of acquires served by an idle object."""
+        return self._hits
+
+    @property
+    def misses(self):
+        """Number of acquires that called `factory`."""
+        return self._misses
+
+    @property
+    def high_water(self):
+        """Highest number of objects in use at once."""
+        return self._high_water
+
+    @property
+    def stats(self):
+        """Pool counters as a dict.
+
+        Returns:
+            dict
+        """
+
+        return {
+            'available':  self.available,
+            'in_use':     len(self._live),
+            'hits':       self._hits,
+            'misses':     self._misses,
+            'high_water': self._high_water
+        }
+
+    def __len__(self):
+        return len(self._idle)
+
+    def __repr__(self):
+        return '{}({})'.format(self.__class__, self.stats)
+
+    def __str__(self):
+        return '{}'.format(self.stats)
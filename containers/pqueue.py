@@ -1,3 +1,6 @@
+import heapq
+
+
 class PQueue:
     """Priority queue data structure.
     In a priority queue, an element with high priority
@@ -10,6 +13,10 @@ class PQueue:
         First element = value
         Second element = priority
 
+        Elements are kept in a binary heap, so `enqueue` and
+        `dequeue` run in O(log n). An insertion counter breaks
+        ties between equal priorities.
+
     Args:
         elements(list): list of elements (optional)
 
@@ -23,11 +30,23 @@ class PQueue:
     """
 
     def __init__(self, elements=None):
-        self.elements = []
+        self._heap    = []
+        self._counter = 0
 
         if elements:
             for element in elements:
-                self.enqueue(element)
+                self._heap.append(self._entry(element))
+
+            heapq.heapify(self._heap)
+
+    def _entry(self, value):
+        if type(value) != tuple:
+            raise Exception('Element must be tuple, you entered: {}'.format(value))
+
+        entry = (value[1], self._counter, value)
+        self._counter += 1
+
+        return entry
 
     def clear(self):
         """Clear all elements from the queue.
@@ -39,11 +58,11 @@ class PQueue:
             []
         """
 
-        self.elements.clear()
+        self._heap.clear()
+        self._counter = 0
 
     def enqueue(self, value):
-        """Inserts a new value to the end of the queue.
-        Then sort by priority.
+        """Inserts a new value into the queue by priority.
 
         Args:
             value(tuple): new element
@@ -55,11 +74,7 @@ class PQueue:
             [('foo', 1), ('bar', 2), ('baz', 3)]
         """
 
-        if type(value) != tuple:
-            raise Exception('Element must be tuple, you entered: {}'.format(value))
-
-        self.elements.append(value)
-        self.elements.sort(key=lambda element: element[1])
+        heapq.heappush(self._heap, self._entry(value))
 
     def dequeue(self):
         """Pop first element off queue and return.
@@ -80,7 +95,7 @@ class PQueue:
         if self.isEmpty():
             return None
 
-        return self.elements.pop(0)
+        return heapq.heappop(self._heap)[2]
 
     def peek(self):
         """Preview first element in queue.
@@ -103,7 +118,7 @@ class PQueue:
         if self.isEmpty():
             return None
 
-        return self.elements[0]
+        return self._heap[0][2]
 
     def isEmpty(self):
         """Checks if queue is empty.
@@ -124,11 +139,260 @@ class PQueue:
 
         return len(self) == 0
 
+    @property
+    def elements(self):
+        """List of elements in priority order.
+
+        Note:
+            Built on every access, so avoid it in hot loops.
+
+        Returns:
+            list
+        """
+
+        return [entry[2] for entry in sorted(self._heap)]
+
     def __len__(self):
-        return len(self.elements)
+        return len(self._heap)
 
     def __repr__(self):
         return '{}({})'.format(self.__class__, self.elements)
 
     def __str__(self):
         return '{}'.format(self.elements)
+
+
+class IndexedPQueue(PQueue):
+    """Priority queue with a key to position index.
+    Behaves like `PQueue`, but each value may only be
+    queued once and can be looked up, re-prioritized
+    or removed while it is in the queue.
+
+    Note:
+        Elements must be in the form of tuples.
+        First element = key (must be hashable)
+        Second element = priority
+
+        Enqueuing a key that is already queued updates
+        its priority instead of adding a duplicate.
+
+    Args:
+        elements(list): list of elements (optional)
+
+    Examples:
+        >>> q1 = IndexedPQueue([('baz', 3), ('foo', 1), ('bar', 2)])
+        >>> q1.update('baz', 0)
+        >>> print(q1)
+        [('baz', 0), ('foo', 1), ('bar', 2)]
+        >>> print('foo' in q1)
+        True
+    """
+
+    def __init__(self, elements=None):
+        unique = {}
+
+        if elements:
+            for element in elements:
+                if type(element) != tuple:
+                    raise Exception('Element must be tuple, you entered: {}'.format(element))
+
+                unique[element[0]] = element
+
+        super().__init__(list(unique.values()))
+
+        self._index = {entry[2][0]: pos for pos, entry in enumerate(self._heap)}
+
+    def clear(self):
+        """Clear all elements from the queue.
+
+        Examples:
+            >>> q1 = IndexedPQueue([('baz', 3), ('foo', 1), ('bar', 2)])
+            >>> q1.clear()
+            >>> print(q1)
+            []
+        """
+
+        super().clear()
+        self._index.clear()
+
+    def enqueue(self, value):
+        """Inserts a new value into the queue by priority.
+        Updates the priority if the key is already queued.
+
+        Args:
+            value(tuple): new element
+
+        Examples:
+            >>> q1 = IndexedPQueue([('baz', 3), ('foo', 1)])
+            >>> q1.enqueue(('bar', 2))
+            >>> q1.enqueue(('baz', 0))
+            >>> print(q1)
+            [('baz', 0), ('foo', 1), ('bar', 2)]
+        """
+
+        entry = self._entry(value)
+        key   = value[0]
+
+        if key in self._index:
+            self.update(key, value[1])
+            return
+
+        self._heap.append(entry)
+        self._sift_up(len(self._heap) - 1)
+
+    def dequeue(self):
+        """Pop first element off queue and return.
+            Returns None if queue is empty.
+
+        Examples:
+            >>> q1 = IndexedPQueue([('foo', 1), ('bar', 2), ('baz', 3)])
+            >>> v1 = q1.dequeue()
+            >>> print(v1)
+            ('foo', 1)
+            >>> print('foo' in q1)
+            False
+
+        Returns:
+            tuple: first element in queue or None
+        """
+
+        if self.isEmpty():
+            return None
+
+        return self._remove_at(0)
+
+    def update(self, key, priority):
+        """Change the priority of a queued key.
+
+        Raises:
+            KeyError: If `key` is not in the queue.
+
+        Args:
+            key(mixed): queued key
+            priority(mixed): new priority
+
+        Examples:
+            >>> q1 = IndexedPQueue([('foo', 1), ('bar', 2), ('baz', 3)])
+            >>> q1.update('foo', 4)
+            >>> print(q1)
+            [('bar', 2), ('baz', 3), ('foo', 4)]
+        """
+
+        pos = self._index[key]
+        old = self._heap[pos]
+        new = (priority, old[1], (key, priority))
+
+        self._heap[pos] = new
+
+        if new < old:
+            self._sift_up(pos)
+        else:
+            self._sift_down(pos)
+
+    def remove(self, key):
+        """Remove a queued key and return its element.
+
+        Raises:
+            KeyError: If `key` is not in the queue.
+
+        Args:
+            key(mixed): queued key
+
+        Examples:
+            >>> q1 = IndexedPQueue([('foo', 1), ('bar', 2), ('baz', 3)])
+            >>> v1 = q1.remove('bar')
+            >>> print(v1)
+            ('bar', 2)
+            >>> print(q1)
+            [('foo', 1), ('baz', 3)]
+
+        Returns:
+            tuple: removed element
+        """
+
+        return self._remove_at(self._index[key])
+
+    def priority(self, key):
+        """Get the priority of a queued key.
+            Returns None if key is not queued.
+
+        Args:
+            key(mixed): queued key
+
+        Returns:
+            mixed: priority or None
+        """
+
+        pos = self._index.get(key)
+
+        if pos is None:
+            return None
+
+        return self._heap[pos][0]
+
+    def _remove_at(self, pos):
+        heap  = self._heap
+        entry = heap[pos]
+        last  = heap.pop()
+
+        del self._index[entry[2][0]]
+
+        if pos < len(heap):
+            heap[pos] = last
+            self._index[last[2][0]] = pos
+
+            if last < entry:
+                self._sift_up(pos)
+            else:
+                self._sift_down(pos)
+
+        return entry[2]
+
+    def _sift_up(self, pos):
+        heap  = self._heap
+        index = self._index
+        entry = heap[pos]
+
+        while pos > 0:
+            parent = (pos - 1) >> 1
+            other  = heap[parent]
+
+            if not entry < other:
+                break
+
+            heap[pos] = other
+            index[other[2][0]] = pos
+            pos = parent
+
+        heap[pos] = entry
+        index[entry[2][0]] = pos
+
+    def _sift_down(self, pos):
+        heap  = self._heap
+        index = self._index
+        size  = len(heap)
+        entry = heap[pos]
+
+        while True:
+            child = 2 * pos + 1
+
+            if child >= size:
+                break
+
+            if child + 1 < size and heap[child + 1] < heap[child]:
+                child += 1
+
+            other = heap[child]
+
+            if not other < entry:
+                break
+
+            heap[pos] = other
+            index[other[2][0]] = pos
+            pos = child
+
+        heap[pos] = entry
+        index[entry[2][0]] = pos
+
+    def __contains__(self, key):
+        return key in self._index
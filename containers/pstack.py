@@ -0,0 +1,189 @@
+class _Cell:
+    __slots__ = ('value', 'next', 'size')
+
+    def __init__(self, value, next, size):
+        self.value = value
+        self.next  = next
+        self.size  = size
+
+
+class PStack:
+    """Persistent (immutable) stack data structure.
+    `push` and `pop` return a new PStack that shares
+    its tail with the old one, so keeping an old version
+    around is an O(1) snapshot.
+
+    Args:
+        elements(list): list of elements (optional)
+
+    Examples:
+        >>> s1 = PStack()
+        >>> s2 = PStack([1, 2, 3, 4, 5])
+        >>> print(s1)
+        []
+        >>> print(s2)
+        [5, 4, 3, 2, 1]
+    """
+
+    __slots__ = ('_head',)
+
+    def __init__(self, elements=None):
+        head = None
+
+        if elements:
+            for element in elements:
+                head = _Cell(element, head, head.size + 1 if head else 1)
+
+        self._head = head
+
+    @classmethod
+    def _from_head(cls, head):
+        stack = cls.__new__(cls)
+        stack._head = head
+
+        return stack
+
+    def clear(self):
+        """Get an empty stack.
+
+        Examples:
+            >>> s1 = PStack([1, 2, 3])
+            >>> s2 = s1.clear()
+            >>> print(s1, s2)
+            [3, 2, 1] []
+
+        Returns:
+            PStack
+        """
+
+        return self._from_head(None)
+
+    def push(self, value):
+        """Get a new stack with `value` on top.
+
+        Args:
+            value(mixed): new element
+
+        Examples:
+            >>> s1 = PStack([1, 2, 3])
+            >>> s2 = s1.push(4)
+            >>> print(s1, s2)
+            [3, 2, 1] [4, 3, 2, 1]
+
+        Returns:
+            PStack
+        """
+
+        head = self._head
+
+        return self._from_head(_Cell(value, head, head.size + 1 if head else 1))
+
+    def push_many(self, values):
+        """Get a new stack with `values` pushed in order.
+
+        Args:
+            values(iterable): new elements
+
+        Examples:
+            >>> s1 = PStack([1, 2, 3])
+            >>> s2 = s1.push_many([4, 5])
+            >>> print(s2)
+            [5, 4, 3, 2, 1]
+
+        Returns:
+            PStack
+        """
+
+        head = self._head
+
+        for value in values:
+            head = _Cell(value, head, head.size + 1 if head else 1)
+
+        return self._from_head(head)
+
+    def pop(self):
+        """Get a new stack without the top element.
+            Returns this stack if it is empty.
+
+        Examples:
+            >>> s1 = PStack([1, 2, 3])
+            >>> s2 = s1.pop()
+            >>> print(s1.peek(), s2)
+            3 [2, 1]
+
+        Returns:
+            PStack
+        """
+
+        if self._head is None:
+            return self
+
+        return self._from_head(self._head.next)
+
+    def peek(self):
+        """Preview first element in stack.
+            Only returns None if stack is empty.
+
+        Examples:
+            >>> s1 = PStack([1, 2, 3])
+            >>> v1 = s1.peek()
+            >>> print(v1)
+            3
+            >>> s2 = PStack()
+            >>> v2 = s2.peek()
+            >>> print(v2)
+            None
+
+        Returns:
+            mixed: first element in stack or None
+        """
+
+        if self._head is None:
+            return None
+
+        return self._head.value
+
+    def isEmpty(self):
+        """Checks if stack is empty.
+
+        Examples:
+            >>> s1 = PStack([1, 2, 3])
+            >>> v1 = s1.isEmpty()
+            >>> print(v1)
+            False
+            >>> s2 = PStack()
+            >>> v2 = s2.isEmpty()
+            >>> print(v2)
+            True
+
+        Returns:
+            bool: True or False
+        """
+
+        return self._head is None
+
+    @property
+    def elements(self):
+        """List of elements, top first.
+
+        Returns:
+            list
+        """
+
+        return list(self)
+
+    def __iter__(self):
+        cell = self._head
+
+        while cell is not None:
+            yield cell.value
+            cell = cell.next
+
+    def __len__(self):
+        return self._head.size if self._head else 0
+
+    def __repr__(self):
+        return '{}({})'.format(self.__class__, self.elements)
+
+    def __str__(self):
+        return '{}'.format(self.elements)
@@ -1,6 +1,13 @@
+from collections import deque
+
+
 class Queue:
     """Queue data structure.
 
+    Note:
+        Elements are kept in a `collections.deque`, so
+        `enqueue` and `dequeue` run in O(1).
+
     Args:
         elements(list): list of elements (optional)
 
@@ -14,11 +21,7 @@ class Queue:
     """
 
     def __init__(self, elements=None):
-        self.elements = []
-
-        if elements:
-            for element in elements:
-                self.enqueue(element)
+        self.elements = deque(elements or ())
 
     def clear(self):
         """Clear all elements from the queue.
@@ -47,6 +50,21 @@ class Queue:
 
         self.elements.append(value)
 
+    def enqueue_many(self, values):
+        """Inserts new values to the end of the queue.
+
+        Args:
+            values(iterable): new elements
+
+        Examples:
+            >>> q1 = Queue([1, 2, 3])
+            >>> q1.enqueue_many([4, 5])
+            >>> print(q1)
+            [1, 2, 3, 4, 5]
+        """
+
+        self.elements.extend(values)
+
     def dequeue(self):
         """Pop first element off queue and return.
             Returns None if queue is empty.
@@ -66,7 +84,50 @@ class Queue:
         if self.isEmpty():
             return None
 
-        return self.elements.pop(0)
+        return self.elements.popleft()
+
+    def dequeue_many(self, n):
+        """Pop up to `n` elements off queue and return them.
+            Returns fewer elements if the queue runs out.
+
+        Args:
+            n(int): max number of elements
+
+        Examples:
+            >>> q1 = Queue([1, 2, 3])
+            >>> v1 = q1.dequeue_many(2)
+            >>> print(v1)
+            [1, 2]
+            >>> print(q1)
+            [3]
+
+        Returns:
+            list: dequeued elements in queue order
+        """
+
+        popleft = self.elements.popleft
+
+        return [popleft() for i in range(min(n, len(self.elements)))]
+
+    def drain(self):
+        """Pop all elements off queue and return them.
+
+        Examples:
+            >>> q1 = Queue([1, 2, 3])
+            >>> v1 = q1.drain()
+            >>> print(v1)
+            [1, 2, 3]
+            >>> print(q1)
+            []
+
+        Returns:
+            list: dequeued elements in queue order
+        """
+
+        elements = list(self.elements)
+        self.elements.clear()
+
+        return elements
 
     def peek(self):
         """Preview first element in queue.
@@ -115,7 +176,7 @@ class Queue:
         return len(self.elements)
 
     def __repr__(self):
-        return '{}({})'.format(self.__class__, self.elements)
+        return '{}({})'.format(self.__class__, list(self.elements))
 
     def __str__(self):
-        return '{}'.format(self.elements)
\ No newline at end of file
+        return '{}'.format(list(self.elements))
\ No newline at end of file
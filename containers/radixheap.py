@@ -0,0 +1,195 @@
+from collections import deque
+from itertools import chain
+
+
+class RadixHeap:
+    """Monotone priority queue for integer priorities.
+    Drop-in replacement for `PQueue` in searches where
+    priorities never drop below the last one served,
+    such as Dijkstra or A* with integer edge costs.
+
+    Note:
+        Elements must be in the form of tuples.
+        First element = value
+        Second element = priority (non-negative integer)
+
+        Elements are kept in buckets by the highest bit in
+        which their priority differs from the last priority
+        served, so each element moves O(log C) times in total
+        instead of paying O(log n) comparisons per operation.
+        Equal priorities are served in insertion order.
+
+    Args:
+        elements(list): list of elements (optional)
+
+    Examples:
+        >>> q1 = RadixHeap()
+        >>> q2 = RadixHeap([('baz', 3), ('foo', 1), ('bar', 2)])
+        >>> print(q1)
+        []
+        >>> print(q2)
+        [('foo', 1), ('bar', 2), ('baz', 3)]
+    """
+
+    def __init__(self, elements=None):
+        self._buckets = [deque()]
+        self._last    = 0
+        self._size    = 0
+
+        if elements:
+            for element in elements:
+                self.enqueue(element)
+
+    def clear(self):
+        """Clear all elements from the queue.
+
+        Examples:
+            >>> q1 = RadixHeap([('baz', 3), ('foo', 1), ('bar', 2)])
+            >>> q1.clear()
+            >>> print(q1)
+            []
+        """
+
+        self._buckets = [deque()]
+        self._last    = 0
+        self._size    = 0
+
+    def enqueue(self, value):
+        """Inserts a new value into the queue by priority.
+
+        Raises:
+            Exception: If `value` is not a tuple, or its priority is
+                not an integer or is lower than the last one served.
+
+        Args:
+            value(tuple): new element
+
+        Examples:
+            >>> q1 = RadixHeap([('baz', 3), ('foo', 1)])
+            >>> q1.enqueue(('bar', 2))
+            >>> print(q1)
+            [('foo', 1), ('bar', 2), ('baz', 3)]
+        """
+
+        if type(value) != tuple:
+            raise Exception('Element must be tuple, you entered: {}'.format(value))
+
+        priority = value[1]
+
+        if type(priority) != int or priority < self._last:
+            raise Exception('Priority must be an integer no lower than {}, you entered: {}'.format(self._last, priority))
+
+        index = (priority ^ self._last).bit_length()
+
+        while index >= len(self._buckets):
+            self._buckets.append(deque())
+
+        self._buckets[index].append(value)
+        self._size += 1
+
+    def dequeue(self):
+        """Pop first element off queue and return.
+            Returns None if queue is empty.
+
+        Examples:
+            >>> q1 = RadixHeap([('foo', 1), ('bar', 2), ('baz', 3)])
+            >>> v1 = q1.dequeue()
+            >>> print(v1)
+            ('foo', 1)
+            >>> print(q1)
+            [('bar', 2), ('baz', 3)]
+
+        Returns:
+            tuple: first element in queue or None
+        """
+
+        if self._size == 0:
+            return None
+
+        buckets = self._buckets
+
+        if not buckets[0]:
+            index = 1
+
+            while not buckets[index]:
+                index += 1
+
+            bucket = buckets[index]
+            last   = min(element[1] for element in bucket)
+
+            buckets[index] = deque()
+
+            for element in bucket:
+                buckets[(element[1] ^ last).bit_length()].append(element)
+
+            self._last = last
+
+        self._size -= 1
+
+        return buckets[0].popleft()
+
+    def peek(self):
+        """Preview first element in queue.
+            Only returns None if queue is empty.
+
+        Examples:
+            >>> q1 = RadixHeap([('foo', 1), ('bar', 2), ('baz', 3)])
+            >>> v1 = q1.peek()
+            >>> print(v1)
+            ('foo', 1)
+            >>> q2 = RadixHeap()
+            >>> v2 = q2.peek()
+            >>> print(v2)
+            None
+
+        Returns:
+            mixed: first element in queue or None
+        """
+
+        if self._size == 0:
+            return None
+
+        for bucket in self._buckets:
+            if bucket:
+                return min(bucket, key=lambda element: element[1])
+
+    def isEmpty(self):
+        """Checks if queue is empty.
+
+        Examples:
+            >>> q1 = RadixHeap([('foo', 1), ('bar', 2), ('baz', 3)])
+            >>> v1 = q1.isEmpty()
+            >>> print(v1)
+            False
+            >>> q2 = RadixHeap()
+            >>> v2 = q2.isEmpty()
+            >>> print(v2)
+            True
+
+        Returns:
+            bool: True or False
+        """
+
+        return self._size == 0
+
+    @property
+    def elements(self):
+        """List of elements in priority order.
+
+        Note:
+            Built on every access, so avoid it in hot loops.
+
+        Returns:
+            list
+        """
+
+        return sorted(chain.from_iterable(self._buckets), key=lambda element: element[1])
+
+    def __len__(self):
+        return self._size
+
+    def __repr__(self):
+        return '{}({})'.format(self.__class__, self.elements)
+
+    def __str__(self):
+        return '{}'.format(self.elements)
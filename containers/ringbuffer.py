@@ -0,0 +1,236 @@
+class RingBuffer:
+    """Fixed-capacity queue data structure.
+    Storage is allocated once up front and reused, so
+    the buffer never grows past `capacity` elements.
+
+    Note:
+        `policy` decides what happens when enqueuing
+        onto a full buffer:
+          - 'overwrite': oldest element is replaced
+          - 'drop': new element is discarded
+          - 'raise': OverflowError is raised
+
+    Raises:
+        AttributeError: Invalid capacity or policy.
+
+    Args:
+        capacity(int): max number of elements
+        elements(list): list of elements (optional)
+        policy(str): full-buffer policy (optional)
+
+    Examples:
+        >>> r1 = RingBuffer(3)
+        >>> r2 = RingBuffer(3, [1, 2, 3, 4, 5])
+        >>> print(r1)
+        []
+        >>> print(r2)
+        [3, 4, 5]
+    """
+
+    POLICIES = ('overwrite', 'drop', 'raise')
+
+    def __init__(self, capacity, elements=None, policy='overwrite'):
+        if capacity < 1:
+            raise AttributeError('Capacity must be at least 1, you entered: {}'.format(capacity))
+
+        if policy not in RingBuffer.POLICIES:
+            raise AttributeError('Invalid policy: use one of {}'.format(', '.join(RingBuffer.POLICIES)))
+
+        self._buffer   = [None] * capacity
+        self._capacity = capacity
+        self._policy   = policy
+        self._head     = 0
+        self._size     = 0
+
+        if elements:
+            for element in elements:
+                self.enqueue(element)
+
+    def clear(self):
+        """Clear all elements from the buffer.
+
+        Examples:
+            >>> r1 = RingBuffer(3, [1, 2, 3])
+            >>> r1.clear()
+            >>> print(r1)
+            []
+        """
+
+        for i in range(self._capacity):
+            self._buffer[i] = None
+
+        self._head = 0
+        self._size = 0
+
+    def enqueue(self, value):
+        """Inserts a new value to the end of the buffer.
+            Applies the buffer policy if it is full.
+
+        Raises:
+            OverflowError: If buffer is full and policy is 'raise'.
+
+        Args:
+            value(mixed): new element
+
+        Examples:
+            >>> r1 = RingBuffer(3, [1, 2, 3])
+            >>> r1.enqueue(4)
+            True
+            >>> print(r1)
+            [2, 3, 4]
+            >>> r2 = RingBuffer(3, [1, 2, 3], policy='drop')
+            >>> r2.enqueue(4)
+            False
+            >>> print(r2)
+            [1, 2, 3]
+
+        Returns:
+            bool: True if value was stored
+        """
+
+        if self._size == self._capacity:
+            if self._policy == 'drop':
+                return False
+
+            if self._policy == 'raise':
+                raise OverflowError('RingBuffer is full, capacity: {}'.format(self._capacity))
+
+            self._buffer[self._head] = value
+            self._head = (self._head + 1) % self._capacity
+
+            return True
+
+        self._buffer[(self._head + self._size) % self._capacity] = value
+        self._size += 1
+
+        return True
+
+    def dequeue(self):
+        """Pop oldest element off buffer and return.
+            Returns None if buffer is empty.
+
+        Examples:
+            >>> r1 = RingBuffer(3, [1, 2, 3])
+            >>> v1 = r1.dequeue()
+            >>> print(v1)
+            1
+            >>> print(r1)
+            [2, 3]
+
+        Returns:
+            mixed: oldest element in buffer or None
+        """
+
+        if self._size == 0:
+            return None
+
+        value = self._buffer[self._head]
+
+        self._buffer[self._head] = None
+        self._head  = (self._head + 1) % self._capacity
+        self._size -= 1
+
+        return value
+
+    def peek(self):
+        """Preview oldest element in buffer.
+            Only returns None if buffer is empty.
+
+        Examples:
+            >>> r1 = RingBuffer(3, [1, 2, 3])
+            >>> v1 = r1.peek()
+            >>> print(v1)
+            1
+            >>> r2 = RingBuffer(3)
+            >>> v2 = r2.peek()
+            >>> print(v2)
+            None
+
+        Returns:
+            mixed: oldest element in buffer or None
+        """
+
+        if self._size == 0:
+            return None
+
+        return self._buffer[self._head]
+
+    def isEmpty(self):
+        """Checks if buffer is empty.
+
+        Examples:
+            >>> r1 = RingBuffer(3, [1, 2, 3])
+            >>> v1 = r1.isEmpty()
+            >>> print(v1)
+            False
+            >>> r2 = RingBuffer(3)
+            >>> v2 = r2.isEmpty()
+            >>> print(v2)
+            True
+
+        Returns:
+            bool: True or False
+        """
+
+        return self._size == 0
+
+    def isFull(self):
+        """Checks if buffer is full.
+
+        Examples:
+            >>> r1 = RingBuffer(3, [1, 2, 3])
+            >>> v1 = r1.isFull()
+            >>> print(v1)
+            True
+
+        Returns:
+            bool: True or False
+        """
+
+        return self._size == self._capacity
+
+    @property
+    def capacity(self):
+        return self._capacity
+
+    @property
+    def policy(self):
+        return self._policy
+
+    def __getitem__(self, index):
+        """Element by position, oldest first.
+            Negative indices count back from the newest.
+
+        Raises:
+            IndexError: If `index` is out of range.
+
+        Examples:
+            >>> r1 = RingBuffer(3, [1, 2, 3, 4])
+            >>> print(r1[0], r1[-1])
+            2 4
+        """
+
+        if index < 0:
+            index += self._size
+
+        if not 0 <= index < self._size:
+            raise IndexError('RingBuffer index out of range')
+
+        return self._buffer[(self._head + index) % self._capacity]
+
+    def __iter__(self):
+        buffer   = self._buffer
+        capacity = self._capacity
+        head     = self._head
+
+        for i in range(self._size):
+            yield buffer[(head + i) % capacity]
+
+    def __len__(self):
+        return self._size
+
+    def __repr__(self):
+        return '{}({})'.format(self.__class__, list(self))
+
+    def __str__(self):
+        return '{}'.format(list(self))
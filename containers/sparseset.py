@@ -0,0 +1,194 @@
+class SparseSet:
+    """Sparse set data structure.
+    Maps non-negative integer ids to values with O(1)
+    add, remove and membership, while keeping ids and
+    values packed in dense lists for fast iteration.
+
+    Note:
+        Removing swaps the last element into the hole, so
+        iteration order changes. Do not add or remove while
+        iterating over `ids` or `values`; iterate over a
+        copy or collect the changes first.
+
+    Args:
+        elements(list): list of ids (optional)
+
+    Examples:
+        >>> s1 = SparseSet()
+        >>> s2 = SparseSet([3, 1, 4])
+        >>> print(s1)
+        []
+        >>> print(s2)
+        [3, 1, 4]
+    """
+
+    def __init__(self, elements=None):
+        self._sparse = []
+        self._ids    = []
+        self._values = []
+
+        if elements:
+            for element in elements:
+                self.add(element)
+
+    def clear(self):
+        """Clear all ids from the set.
+
+        Examples:
+            >>> s1 = SparseSet([3, 1, 4])
+            >>> s1.clear()
+            >>> print(s1)
+            []
+        """
+
+        self._ids.clear()
+        self._values.clear()
+
+    def add(self, id, value=None):
+        """Add an id, or replace its value if it is present.
+
+        Raises:
+            IndexError: If `id` is negative.
+
+        Args:
+            id(int): element id
+            value(mixed): element value (optional)
+
+        Examples:
+            >>> s1 = SparseSet([3, 1])
+            >>> s1.add(4, 'foo')
+            True
+            >>> s1.add(4, 'bar')
+            False
+            >>> print(s1.get(4))
+            bar
+
+        Returns:
+            bool: True if id was added
+        """
+
+        if id < 0:
+            raise IndexError('SparseSet ids must be non-negative, you entered: {}'.format(id))
+
+        sparse = self._sparse
+
+        if id < len(sparse):
+            pos = sparse[id]
+
+            if pos < len(self._ids) and self._ids[pos] == id:
+                self._values[pos] = value
+                return False
+        else:
+            sparse.extend([0] * max(id + 1 - len(sparse), len(sparse)))
+
+        sparse[id] = len(self._ids)
+        self._ids.append(id)
+        self._values.append(value)
+
+        return True
+
+    def remove(self, id):
+        """Remove an id and return its value.
+        The last element is moved into its place.
+
+        Raises:
+            KeyError: If `id` is not in the set.
+
+        Args:
+            id(int): element id
+
+        Examples:
+            >>> s1 = SparseSet([3, 1, 4])
+            >>> s1.remove(3)
+            >>> print(s1)
+            [4, 1]
+
+        Returns:
+            mixed: removed value
+        """
+
+        if id not in self:
+            raise KeyError(id)
+
+        pos     = self._sparse[id]
+        last_id = self._ids[-1]
+        value   = self._values[pos]
+
+        self._ids[pos]    = last_id
+        self._values[pos] = self._values[-1]
+        self._sparse[last_id] = pos
+
+        self._ids.pop()
+        self._values.pop()
+
+        return value
+
+    def get(self, id, default=None):
+        """Get the value of an id.
+            Returns `default` if id is not in the set.
+
+        Args:
+            id(int): element id
+            default(mixed): value on a miss (optional)
+
+        Returns:
+            mixed: value or default
+        """
+
+        if id not in self:
+            return default
+
+        return self._values[self._sparse[id]]
+
+    def isEmpty(self):
+        """Checks if set is empty.
+
+        Examples:
+            >>> s1 = SparseSet([3, 1, 4])
+            >>> v1 = s1.isEmpty()
+            >>> print(v1)
+            False
+            >>> s2 = SparseSet()
+            >>> v2 = s2.isEmpty()
+            >>> print(v2)
+            True
+
+        Returns:
+            bool: True or False
+        """
+
+        return len(self._ids) == 0
+
+    def items(self):
+        """Iterate over (id, value) pairs in dense order."""
+        return zip(self._ids, self._values)
+
+    @property
+    def ids(self):
+        """Dense list of ids. Read only, not a copy."""
+        return self._ids
+
+    @property
+    def values(self):
+        """Dense list of values. Read only, not a copy."""
+        return self._values
+
+    def __contains__(self, id):
+        if not 0 <= id < len(self._sparse):
+            return False
+
+        pos = self._sparse[id]
+
+        return pos < len(self._ids) and self._ids[pos] == id
+
+    def __iter__(self):
+        return iter(self._ids)
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __repr__(self):
+        return '{}({})'.format(self.__class__, self._ids)
+
+    def __str__(self):
+        return '{}'.format(self._ids)
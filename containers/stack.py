@@ -1,6 +1,11 @@
 class Stack:
     """Instantiate a new Stack.
 
+    Note:
+        The top of the stack is stored at the end of the
+        underlying list, so `push`, `pop` and `peek` run in O(1).
+        Iteration and printing still go from top to bottom.
+
     Args:
         elements(list): list of elements (optional)
 
@@ -14,11 +19,7 @@ class Stack:
     """
 
     def __init__(self, elements=None):
-        self.elements = []
-
-        if elements:
-            for element in elements:
-                self.push(element)
+        self._elements = list(elements or ())
 
     def clear(self):
         """Clear all elements from the stack.
@@ -30,7 +31,7 @@ class Stack:
             []
         """
 
-        self.elements.clear()
+        self._elements.clear()
 
     def push(self, value):
         """Pushes a new value to front of stack.
@@ -45,7 +46,22 @@ class Stack:
             [4, 3, 2, 1]
         """
 
-        self.elements.insert(0, value)
+        self._elements.append(value)
+
+    def push_many(self, values):
+        """Pushes new values to front of stack, in order.
+
+        Args:
+            values(iterable): new elements
+
+        Examples:
+            >>> s1 = Stack([1, 2, 3])
+            >>> s1.push_many([4, 5])
+            >>> print(s1)
+            [5, 4, 3, 2, 1]
+        """
+
+        self._elements.extend(values)
 
     def pop(self):
         """Pop first element off stack and return.
@@ -66,7 +82,37 @@ class Stack:
         if self.isEmpty():
             return None
 
-        return self.elements.pop(0)
+        return self._elements.pop()
+
+    def pop_many(self, n):
+        """Pop up to `n` elements off stack and return them.
+            Returns fewer elements if the stack runs out.
+
+        Args:
+            n(int): max number of elements
+
+        Examples:
+            >>> s1 = Stack([1, 2, 3])
+            >>> v1 = s1.pop_many(2)
+            >>> print(v1)
+            [3, 2]
+            >>> print(s1)
+            [1]
+
+        Returns:
+            list: popped elements, top first
+        """
+
+        n = min(n, len(self._elements))
+
+        if n <= 0:
+            return []
+
+        popped = self._elements[-n:]
+        del self._elements[-n:]
+        popped.reverse()
+
+        return popped
 
     def peek(self):
         """Preview first element in stack.
@@ -89,7 +135,7 @@ class Stack:
         if self.isEmpty():
             return None
 
-        return self.elements[0]
+        return self._elements[-1]
 
     def isEmpty(self):
         """Checks if stack is empty.
@@ -110,8 +156,24 @@ class Stack:
 
         return len(self) == 0
 
+    @property
+    def elements(self):
+        """List of elements, top first.
+
+        Note:
+            Built on every access, so avoid it in hot loops.
+
+        Returns:
+            list
+        """
+
+        return self._elements[::-1]
+
+    def __iter__(self):
+        return reversed(self._elements)
+
     def __len__(self):
-        return len(self.elements)
+        return len(self._elements)
 
     def __repr__(self):
         return '{}({})'.format(self.__class__, self.elements)
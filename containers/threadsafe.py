@@ -0,0 +1,283 @@
+import asyncio
+import threading
+
+from collections import deque
+from pybox.containers.pqueue import PQueue
+from pybox.containers.queue import Queue
+
+
+class LockedQueue:
+    """Thread-safe queue data structure.
+    Wraps a `Queue` with a lock so producers and consumers
+    may live on different threads.
+
+    Args:
+        elements(list): list of elements (optional)
+
+    Examples:
+        >>> q1 = LockedQueue([1, 2, 3])
+        >>> q1.enqueue(4)
+        >>> print(q1.drain(2))
+        [1, 2]
+        >>> print(q1)
+        [3, 4]
+    """
+
+    _container_class = Queue
+
+    def __init__(self, elements=None):
+        self._container = self._container_class(elements)
+        self._lock      = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+
+    def clear(self):
+        """Clear all elements from the queue."""
+
+        with self._lock:
+            self._container.clear()
+
+    def enqueue(self, value):
+        """Inserts a new value into the queue.
+        Wakes one thread blocked in `dequeue`.
+
+        Args:
+            value(mixed): new element
+        """
+
+        with self._lock:
+            self._container.enqueue(value)
+            self._not_empty.notify()
+
+    def dequeue(self, block=False, timeout=None):
+        """Pop first element off queue and return.
+            Returns None if queue is empty.
+
+        Args:
+            block(bool): wait for an element to arrive (optional)
+            timeout(float): max seconds to wait when blocking (optional)
+
+        Returns:
+            mixed: first element in queue or None
+        """
+
+        with self._not_empty:
+            if block:
+                self._not_empty.wait_for(self._container.__len__, timeout)
+
+            return self._container.dequeue()
+
+    def drain(self, max_items=None):
+        """Pop up to `max_items` elements off queue and return them.
+            Never blocks, so it is safe to call once per frame.
+
+        Args:
+            max_items(int): max number of elements (optional)
+
+        Returns:
+            list: dequeued elements in queue order
+        """
+
+        with self._lock:
+            return _drain(self._container, max_items)
+
+    def peek(self):
+        """Preview first element in queue.
+            Only returns None if queue is empty.
+
+        Returns:
+            mixed: first element in queue or None
+        """
+
+        with self._lock:
+            return self._container.peek()
+
+    def isEmpty(self):
+        """Checks if queue is empty.
+
+        Returns:
+            bool: True or False
+        """
+
+        return len(self) == 0
+
+    def __len__(self):
+        return len(self._container)
+
+    def __repr__(self):
+        return '{}({})'.format(self.__class__, self)
+
+    def __str__(self):
+        with self._lock:
+            return str(self._container)
+
+
+class LockedPQueue(LockedQueue):
+    """Thread-safe priority queue data structure.
+    Wraps a `PQueue` with a lock so producers and consumers
+    may live on different threads.
+
+    Args:
+        elements(list): list of elements (optional)
+
+    Examples:
+        >>> q1 = LockedPQueue([('baz', 3), ('foo', 1)])
+        >>> q1.enqueue(('bar', 2))
+        >>> print(q1.drain())
+        [('foo', 1), ('bar', 2), ('baz', 3)]
+    """
+
+    _container_class = PQueue
+
+
+class AsyncQueue:
+    """asyncio-aware queue data structure.
+    `dequeue` is a coroutine that waits for an element,
+    while `enqueue` may be called from any thread.
+
+    Args:
+        elements(list): list of elements (optional)
+
+    Examples:
+        >>> q1 = AsyncQueue([1, 2])
+        >>> q1.enqueue(3)
+        >>> print(asyncio.run(q1.dequeue()))
+        1
+        >>> print(q1.drain())
+        [2, 3]
+    """
+
+    _container_class = Queue
+
+    def __init__(self, elements=None):
+        self._container = self._container_class(elements)
+        self._lock      = threading.Lock()
+        self._waiters   = deque()
+
+    def clear(self):
+        """Clear all elements from the queue."""
+
+        with self._lock:
+            self._container.clear()
+
+    def enqueue(self, value):
+        """Inserts a new value into the queue.
+        Wakes one coroutine waiting in `dequeue`.
+
+        Args:
+            value(mixed): new element
+        """
+
+        with self._lock:
+            self._container.enqueue(value)
+            self._wake_next()
+
+    async def dequeue(self):
+        """Wait for the first element of the queue and return it.
+
+        Returns:
+            mixed: first element in queue
+        """
+
+        loop = asyncio.get_running_loop()
+
+        while True:
+            with self._lock:
+                if len(self._container):
+                    return self._container.dequeue()
+
+                waiter = loop.create_future()
+                self._waiters.append(waiter)
+
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                with self._lock:
+                    if waiter in self._waiters:
+                        self._waiters.remove(waiter)
+                    elif len(self._container):
+                        # Pass the wake-up on to the next waiter
+                        self._wake_next()
+
+                raise
+
+    def drain(self, max_items=None):
+        """Pop up to `max_items` elements off queue and return them.
+            Never waits, so it is safe to call once per frame.
+
+        Args:
+            max_items(int): max number of elements (optional)
+
+        Returns:
+            list: dequeued elements in queue order
+        """
+
+        with self._lock:
+            return _drain(self._container, max_items)
+
+    def peek(self):
+        """Preview first element in queue.
+            Only returns None if queue is empty.
+
+        Returns:
+            mixed: first element in queue or None
+        """
+
+        with self._lock:
+            return self._container.peek()
+
+    def isEmpty(self):
+        """Checks if queue is empty.
+
+        Returns:
+            bool: True or False
+        """
+
+        return len(self) == 0
+
+    def _wake_next(self):
+        while self._waiters:
+            waiter = self._waiters.popleft()
+
+            if not waiter.done():
+                waiter.get_loop().call_soon_threadsafe(_resolve, waiter)
+                return
+
+    def __len__(self):
+        return len(self._container)
+
+    def __repr__(self):
+        return '{}({})'.format(self.__class__, self)
+
+    def __str__(self):
+        with self._lock:
+            return str(self._container)
+
+
+class AsyncPQueue(AsyncQueue):
+    """asyncio-aware priority queue data structure.
+    `dequeue` is a coroutine that waits for an element,
+    while `enqueue` may be called from any thread.
+
+    Args:
+        elements(list): list of elements (optional)
+
+    Examples:
+        >>> q1 = AsyncPQueue([('baz', 3), ('foo', 1)])
+        >>> print(asyncio.run(q1.dequeue()))
+        ('foo', 1)
+    """
+
+    _container_class = PQueue
+
+
+def _drain(container, max_items):
+    count = len(container)
+
+    if max_items is not None:
+        count = min(count, max_items)
+
+    return [container.dequeue() for i in range(count)]
+
+def _resolve(waiter):
+    if not waiter.done():
+        waiter.set_result(None)
@@ -0,0 +1,244 @@
+import math
+
+
+class Timer:
+    """Handle for a callback scheduled on a `TimerWheel`.
+
+    Args:
+        wheel(TimerWheel): owning wheel
+        expiry(int): tick to fire on
+        callback(callable): function to call
+        args(tuple): positional arguments for callback
+        kwargs(dict): keyword arguments for callback
+    """
+
+    __slots__ = ('_wheel', '_bucket', 'expiry', 'callback', 'args', 'kwargs')
+
+    def __init__(self, wheel, expiry, callback, args, kwargs):
+        self._wheel  = wheel
+        self._bucket = None
+
+        self.expiry   = expiry
+        self.callback = callback
+        self.args     = args
+        self.kwargs   = kwargs
+
+    def cancel(self):
+        """Alias for `TimerWheel.cancel(timer)`."""
+        return self._wheel.cancel(self)
+
+    @property
+    def active(self):
+        """True until the timer fires or is cancelled."""
+        return self._bucket is not None
+
+    def __repr__(self):
+        return 'Timer(expiry=%s, callback=%s)' % (self.expiry, self.callback)
+
+
+class TimerWheel:
+    """Hierarchical timer wheel data structure.
+    Schedules thousands of delayed callbacks with O(1)
+    `schedule` and `cancel`. Time only moves when `advance`
+    is called, and every timer due in a tick fires together.
+
+    Note:
+        Time is counted in ticks of `resolution` seconds, so
+        timers fire on the first tick at or after their delay.
+        Each level covers `slots` times the range of the one
+        below it. Timers beyond the last level are parked in
+        it and re-placed as time catches up.
+
+    Raises:
+        AttributeError: `slots` is not a power of two.
+
+    Args:
+        resolution(float): seconds per tick (optional)
+        slots(int): slots per level, a power of two (optional)
+        levels(int): number of levels (optional)
+
+    Examples:
+        >>> w1 = TimerWheel(resolution=0.1)
+        >>> t1 = w1.schedule(0.25, print, 'foo')
+        >>> t2 = w1.schedule(0.05, print, 'bar')
+        >>> w1.advance(0.2)
+        bar
+        1
+        >>> w1.advance(0.1)
+        foo
+        1
+    """
+
+    def __init__(self, resolution=0.01, slots=256, levels=4):
+        if slots < 2 or slots & (slots - 1):
+            raise AttributeError('Slots must be a power of two, you entered: {}'.format(slots))
+
+        self._resolution = resolution
+        self._bits       = slots.bit_length() - 1
+        self._mask       = slots - 1
+        self._levels     = levels
+        self._wheels     = [[{} for s in range(slots)] for l in range(levels)]
+
+        self._tick      = 0
+        self._remainder = 0.0
+        self._count     = 0
+
+    def clear(self):
+        """Cancel all pending timers."""
+
+        for wheel in self._wheels:
+            for index, bucket in enumerate(wheel):
+                if bucket:
+                    for timer in bucket:
+                        timer._bucket = None
+
+                    wheel[index] = {}
+
+        self._count = 0
+
+    def schedule(self, delay, callback, *args, **kwargs):
+        """Call `callback(*args, **kwargs)` after `delay` seconds.
+
+        Args:
+            delay(float): seconds from now
+            callback(callable): function to call
+            args(mixed): positional arguments for callback
+            kwargs(mixed): keyword arguments for callback
+
+        Returns:
+            Timer: handle for cancelling
+        """
+
+        ticks = max(1, int(math.ceil(delay / self._resolution - 1e-9)))
+        timer = Timer(self, self._tick + ticks, callback, args, kwargs)
+
+        self._place(timer)
+        self._count += 1
+
+        return timer
+
+    def cancel(self, timer):
+        """Cancel a pending timer.
+
+        Args:
+            timer(Timer): handle from `schedule`
+
+        Returns:
+            bool: False if the timer already fired or was cancelled
+        """
+
+        if timer._bucket is None:
+            return False
+
+        del timer._bucket[timer]
+        timer._bucket = None
+        self._count -= 1
+
+        return True
+
+    def advance(self, dt):
+        """Move time forward by `dt` seconds.
+        Fires every timer that comes due, in tick order.
+
+        Args:
+            dt(float): elapsed seconds
+
+        Returns:
+            int: number of timers fired
+        """
+
+        self._remainder += dt
+
+        ticks = int(self._remainder / self._resolution + 1e-9)
+
+        if ticks <= 0:
+            return 0
+
+        self._remainder -= ticks * self._resolution
+
+        if self._count == 0:
+            self._tick += ticks
+            return 0
+
+        fired = 0
+
+        for i in range(ticks):
+            fired += self._step()
+
+        return fired
+
+    def _place(self, timer):
+        bits  = self._bits
+        delta = timer.expiry - self._tick
+
+        for level in range(self._levels):
+            if delta < 1 << (bits * (level + 1)):
+                index = (timer.expiry >> (bits * level)) & self._mask
+                break
+        else:
+            expiry = self._tick + (1 << (bits * self._levels)) - 1
+            index  = (expiry >> (bits * level)) & self._mask
+
+        bucket = self._wheels[level][index]
+        bucket[timer] = None
+        timer._bucket = bucket
+
+    def _step(self):
+        self._tick += 1
+
+        tick  = self._tick
+        index = tick & self._mask
+
+        if index == 0:
+            self._cascade(tick)
+
+        bucket = self._wheels[0][index]
+
+        if not bucket:
+            return 0
+
+        self._wheels[0][index] = {}
+
+        fired = 0
+
+        for timer in list(bucket):
+            # Skip timers cancelled by an earlier callback
+            if timer._bucket is not bucket:
+                continue
+
+            timer._bucket = None
+            self._count  -= 1
+            fired        += 1
+
+            timer.callback(*timer.args, **timer.kwargs)
+
+        return fired
+
+    def _cascade(self, tick):
+        for level in range(1, self._levels):
+            index  = (tick >> (self._bits * level)) & self._mask
+            bucket = self._wheels[level][index]
+
+            if bucket:
+                self._wheels[level][index] = {}
+
+                for timer in bucket:
+                    self._place(timer)
+
+            if index != 0:
+                break
+
+    @property
+    def resolution(self):
+        return self._resolution
+
+    @property
+    def time(self):
+        """Seconds elapsed, in whole ticks."""
+        return self._tick * self._resolution
+
+    def __len__(self):
+        return self._count
+
+    def __repr__(self):
+        return 'TimerWheel(resolution=%s, pending=%s)' % (self._resolution, self._count)
@@ -28,7 +28,7 @@ class Entity2D:
     def _update_position(self, dt):
         self._update_velocity(dt)
 
-        self._pos += self._vel * dt
+        self._pos.add_scaled(self._vel, dt)
         self._rot += self._av * dt
 
     def _update_velocity(self, dt):
@@ -39,7 +39,7 @@ class Entity2D:
         # self.apply_drag(self._cell.drag)
 
         # Velocity
-        self._vel += (self._forces / self._mass) * dt
+        self._vel.add_scaled(self._forces, dt / self._mass)
         self._vel.limit(self._max_vel)
 
         # Angular velocity
@@ -50,23 +50,24 @@ class Entity2D:
         self._torque = 0.0
 
     def apply_force(self, force, point=(0, 0)):
-        point  = vec2d.Vec2D(point[0], point[1])
-        point -= self._cog
+        px = point[0] - self._cog.x
+        py = point[1] - self._cog.y
+        fx = force[0]
+        fy = force[1]
 
-        force = vec2d.Vec2D(force[0], force[1])
-
-        self._forces += force
-        self._torque += point.cross(force)
+        self._forces.x += fx
+        self._forces.y += fy
+        self._torque   += px * fy - py * fx
 
     def apply_impulse(self, impulse, point=(0, 0)):
-        point  = vec2d.Vec2D(point[0], point[1])
-        point -= self._cog
-
-        impulse  = vec2d.Vec2D(impulse[0], impulse[1])
-        impulse /= self._mass
+        px = point[0] - self._cog.x
+        py = point[1] - self._cog.y
+        ix = impulse[0] / self._mass
+        iy = impulse[1] / self._mass
 
-        self._vel += impulse
-        self._av  += point.cross(impulse) / self._inertia
+        self._vel.x += ix
+        self._vel.y += iy
+        self._av    += (px * iy - py * ix) / self._inertia
 
     def apply_friction(self, coefficent):
         force = self._vel.copy()
@@ -85,11 +86,16 @@ class Entity2D:
 
     @property
     def position(self):
+        """Live Vec2D, moved in place every update. Copy it to keep a snapshot."""
         return self._pos
 
     @position.setter
     def position(self, value):
-        self._pos = value
+        # Copy, so the entity never moves a Vec2D the caller still holds
+        if isinstance(value, vec2d.Vec2D):
+            self._pos.set(value.x, value.y)
+        else:
+            self._pos.set(value[0], value[1])
 
     @property
     def x(self):
@@ -4,6 +4,7 @@ from pyglet.gl import gl
 from app.variables import *
 from pybox.graphics.drawables import fixture2d
 from pybox.graphics.groups import transform, blend, line
+from pybox.math import geometry, triangulate
 from pybox.physics.aabb import AABB
 
 # ---------------------------
@@ -16,6 +17,7 @@ class Shape2D(fixture2d.Fixture2D):
 
         self._vertex_list   = None
         self._vertex_groups = {}
+        self._aabb_cache    = None
         self._vertex_mode   = vertex_mode
         self._vertex_color  = (255, 255, 255, 255)
 
@@ -25,16 +27,36 @@ class Shape2D(fixture2d.Fixture2D):
         self._create_vertex_list_data()
 
     def _create_vertex_list_data(self):
-        self._vertex_list = self._batch.add(
-            len(self._vertices),                     # Vertex count
-            self._vertex_mode,                       # Vertex draw mode
-            list(self._vertex_groups.values())[-1],  # Vertex group
-            "v2f", "c4B", "t3f"
-        )
+        indices = self._create_vertex_indices()
+        group   = list(self._vertex_groups.values())[-1]
+
+        if indices is None:
+            self._vertex_list = self._batch.add(
+                len(self._vertices),  # Vertex count
+                self._vertex_mode,    # Vertex draw mode
+                group,                # Vertex group
+                "v2f", "c4B", "t3f"
+            )
+        else:
+            # Indexed triangles share one draw call with the rest of the batch
+            self._vertex_list = self._batch.add_indexed(
+                len(self._vertices),  # Vertex count
+                self._vertex_mode,    # Vertex draw mode
+                group,                # Vertex group
+                indices,              # Triangle indices
+                "v2f", "c4B", "t3f"
+            )
 
         self._update_vertex_vertices()
         self._update_vertex_color()
 
+    """
+        Triangle indices for filled shapes, None to draw
+            the vertices as they are.
+    """
+    def _create_vertex_indices(self):
+        return None
+
     def _create_vertex_groups(self):
         transformGroup = transform.TransformGroup(self._pos.x, self._pos.y, self._rot, self._sx, self._sy)
         blendGroup     = blend.BlendGroup(parent=transformGroup)
@@ -48,6 +70,12 @@ class Shape2D(fixture2d.Fixture2D):
         Update vertex list vertices.
     """
     def _update_vertex_vertices(self):
+        if len(self._vertices) != self._vertex_list.get_size():
+            # Vertex count changed, so the list and its indices are rebuilt
+            self._vertex_list.delete()
+            self._create_vertex_list_data()
+            return
+
         self._vertex_list.vertices = list(chain.from_iterable(self._vertices))
 
     """
@@ -76,6 +104,16 @@ class Shape2D(fixture2d.Fixture2D):
         return pymunk.moment_for_poly(self._mass, self._vertices)
 
     def _get_bounding_box(self):
+        version = self._vertex_groups["transform"].version
+        cache   = self._aabb_cache
+
+        # Reuse the last box until the transform or vertices change
+        if cache is None or cache[0] != version or cache[1] is not self._vertices:
+            cache = self._aabb_cache = (version, self._vertices, self._compute_bounding_box())
+
+        return cache[2]
+
+    def _compute_bounding_box(self):
         return AABB.compute(self._vertices, self._vertex_groups["transform"].matrix)
 
     """
@@ -164,7 +202,7 @@ class Rectangle(Shape2D):
 class Polygon(Shape2D):
     def __init__(self, vertices, mode="line", batch=default_batch):
         cx, cy, width, height, vertices = self._create_vertex_vertices(vertices)
-        vertex_mode    = gl.GL_LINE_LOOP if mode == "line" else gl.GL_POLYGON
+        vertex_mode    = gl.GL_LINE_LOOP if mode == "line" else gl.GL_TRIANGLES
 
         self._cx = cx
         self._cy = cy
@@ -174,38 +212,25 @@ class Polygon(Shape2D):
         super().__init__(cx, cy, vertices, vertex_mode, batch)
 
     def _create_vertex_vertices(self, vertices):
-        signed_area = 0
-        cx = 0
-        cy = 0
-        xmin = float('inf')
-        ymin = float('inf')
-        xmax = 0
-        ymax = 0
-
-        for i in range(len(vertices)):
-            vertex       = (vertices[i], vertices[(i+1) % len(vertices)])
-            area         = vertex[0][0] * vertex[1][1] - vertex[1][0] * vertex[0][1]
-            signed_area += area
-            cx          += (vertex[0][0] + vertex[1][0]) * area
-            cy          += (vertex[0][1] + vertex[1][1]) * area
-
-        signed_area /= 2
-        cx          /= 6 * signed_area
-        cy          /= 6 * signed_area
-
-        adjusted_vertices = []
-        for i in range(len(vertices)):
-            x = vertices[i][0]
-            y = vertices[i][1]
-
-            xmin = min(xmin, x)
-            ymin = min(ymin, y)
-            xmax = max(xmax, x)
-            ymax = max(ymax, y)
-
-            adjusted_vertices.append((x - cx, y - cy))
-
-        return cx, cy, xmax-xmin, ymax-ymin, adjusted_vertices
+        cx, cy = geometry.centroid(vertices).tolist()
+
+        xs = [x for x, y in vertices]
+        ys = [y for x, y in vertices]
+
+        adjusted_vertices = [(x - cx, y - cy) for x, y in vertices]
+
+        return cx, cy, max(xs) - min(xs), max(ys) - min(ys), adjusted_vertices
+
+    def _create_vertex_indices(self):
+        if self._vertex_mode != gl.GL_TRIANGLES:
+            return None
+
+        return triangulate.triangulate(self._vertices)
+
+    @property
+    def convex_parts(self):
+        """Convex pieces of the outline, relative to the centroid."""
+        return triangulate.decompose(self._vertices)
 
     @property
     def cx(self):
@@ -284,7 +309,7 @@ class Ellipse(Shape2D):
         self._segments = segments
 
         vertices    = self._create_vertex_vertices()
-        vertex_mode = gl.GL_LINE_LOOP if mode == "line" else gl.GL_TRIANGLE_FAN
+        vertex_mode = gl.GL_LINE_LOOP if mode == "line" else gl.GL_TRIANGLES
 
         super().__init__(x, y, vertices, vertex_mode, batch)
 
@@ -300,7 +325,13 @@ class Ellipse(Shape2D):
 
         return vertices
 
-    def _get_bounding_box(self):
+    def _create_vertex_indices(self):
+        if self._vertex_mode != gl.GL_TRIANGLES:
+            return None
+
+        return triangulate.fan(len(self._vertices))
+
+    def _compute_bounding_box(self):
         return AABB.compute([
             (-self._radiusX,  self._radiusY),
             ( self._radiusX,  self._radiusY),
@@ -372,7 +403,7 @@ class Arc(Shape2D):
         self._segments = segments
 
         vertices = self._create_vertex_vertices()
-        vertex_mode = gl.GL_LINE_LOOP if mode == "line" else gl.GL_TRIANGLE_FAN
+        vertex_mode = gl.GL_LINE_LOOP if mode == "line" else gl.GL_TRIANGLES
 
         super().__init__(x, y, vertices, vertex_mode, batch)
 
@@ -389,6 +420,12 @@ class Arc(Shape2D):
 
         return vertices
 
+    def _create_vertex_indices(self):
+        if self._vertex_mode != gl.GL_TRIANGLES:
+            return None
+
+        return triangulate.fan(len(self._vertices))
+
     @property
     def radius(self):
         return self._radius
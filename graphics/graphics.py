@@ -1,9 +1,9 @@
 from math import degrees
 from pyglet.gl import *
 from pybox.containers.stack import Stack
-from pybox.math.transform import Transform
+from pybox.math.affine2d import Affine2D
 
-transformations = Stack([Transform()])
+transformations = Stack([Affine2D()])
 color = (255, 255, 255, 255)
 lineWidth = 1
 
@@ -94,17 +94,14 @@ def scale(sx, sy, sz = 1.0):
     glScalef(sx, sy, sz)
 
 def applyTransform(trans):
-    current = transformations.pop()
-    current.apply(trans)
-
-    transformations.push(current)
+    transformations.peek().apply(trans)
 
 def newTransform(x, y, angle, sx, sy, ox, oy, kx, ky):
-    transformations.push(Transform(x, y, angle, sx, sy, ox, oy, kx, ky))
+    transformations.push(Affine2D.from_trs(x, y, angle, sx, sy, ox, oy, kx, ky))
 
 def replaceTransform(trans):
-    if type(trans) != Transform:
-        raise AttributeError('Argument must be of type Transform.')
+    if type(trans) != Affine2D:
+        raise AttributeError('Argument must be of type Affine2D.')
 
     transformations.pop()
     transformations.push(trans)
@@ -113,6 +110,6 @@ def currentTransform():
     trans = transformations.peek()
 
     if not trans:
-        trans = Transform()
+        trans = Affine2D()
 
     return trans
@@ -1,7 +1,8 @@
 import pyglet
-import pybox
 import pyglet.gl as gl
 
+from pybox.math.affine2d import Affine2D
+
 class TransformGroup(pyglet.graphics.Group):
     def __init__(self, x=0, y=0, rotation=0, sx=1, sy=1, kx=0, ky=0, parent=None):
         super().__init__(parent=parent)
@@ -14,13 +15,27 @@ class TransformGroup(pyglet.graphics.Group):
         self._ky  = ky
         self._rot = rotation
 
+        self._matrix  = None
+        self._inverse = None
+        self._buffer  = None
+        self._version = 0
+
+    def _set(self, name, value):
+        if getattr(self, name) != value:
+            setattr(self, name, value)
+
+            self._matrix   = None
+            self._inverse  = None
+            self._buffer   = None
+            self._version += 1
+
     @property
     def x(self):
         return self._x
 
     @x.setter
     def x(self, value):
-        self._x = value
+        self._set('_x', value)
 
     @property
     def y(self):
@@ -28,7 +43,7 @@ class TransformGroup(pyglet.graphics.Group):
 
     @y.setter
     def y(self, value):
-        self._y = value
+        self._set('_y', value)
 
     @property
     def sx(self):
@@ -36,7 +51,7 @@ class TransformGroup(pyglet.graphics.Group):
 
     @sx.setter
     def sx(self, value):
-        self._sx = value
+        self._set('_sx', value)
 
     @property
     def sy(self):
@@ -44,7 +59,7 @@ class TransformGroup(pyglet.graphics.Group):
 
     @sy.setter
     def sy(self, value):
-        self._sy = value
+        self._set('_sy', value)
 
     @property
     def kx(self):
@@ -52,7 +67,7 @@ class TransformGroup(pyglet.graphics.Group):
 
     @kx.setter
     def kx(self, value):
-        self._kx = value
+        self._set('_kx', value)
 
     @property
     def ky(self):
@@ -60,7 +75,7 @@ class TransformGroup(pyglet.graphics.Group):
 
     @ky.setter
     def ky(self, value):
-        self._ky = value
+        self._set('_ky', value)
 
     @property
     def rotation(self):
@@ -68,30 +83,43 @@ class TransformGroup(pyglet.graphics.Group):
 
     @rotation.setter
     def rotation(self, value):
-        self._rot = value
+        self._set('_rot', value)
+
+    @property
+    def version(self):
+        """Goes up each time a component changes."""
+        return self._version
 
     @property
     def matrix(self):
-        matrix = pybox.math.matrix.Matrix()
-        matrix.translate(self._x, self._y)
-        matrix.rotate(self._rot)
-        matrix.scale(self._sx, self._sy)
-        matrix.shear(self._kx, self._ky)
+        """Composed transform. Read only, not a copy."""
+
+        if self._matrix is None:
+            self._matrix = Affine2D.from_trs(self._x, self._y, self._rot, self._sx, self._sy, kx=self._kx, ky=self._ky)
 
-        return matrix
+        return self._matrix
+
+    @property
+    def inverse(self):
+        """Inverse of `matrix`, for mapping screen points into
+        local space. Read only, not a copy.
+
+        Raises:
+            ArithmeticError: Transform is singular.
+        """
+
+        if self._inverse is None:
+            self._inverse = self.matrix.invert()
+
+        return self._inverse
 
     def set_state(self):
         gl.glPushMatrix()
 
-        gl.glLoadMatrixf(
-            (gl.GLfloat * 16)
-            (*(
-                self.matrix.getColumn(0) +
-                self.matrix.getColumn(1) +
-                self.matrix.getColumn(2) +
-                self.matrix.getColumn(3)
-            ))
-        )
+        if self._buffer is None:
+            self._buffer = self.matrix.as_ctypes()
+
+        gl.glLoadMatrixf(self._buffer)
 
     def unset_state(self):
         gl.glPopMatrix()
\ No newline at end of file
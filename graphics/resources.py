@@ -1,31 +1,58 @@
 import pyglet
 
 from pyglet.resource import ResourceNotFoundException
+from pybox.containers.lrucache import LRUCache
 
 class ResourceManager:
-    def __init__(self, path=None):
+    def __init__(self, path=None, capacity=None, on_evict=None):
+        """
+            `capacity` caps the loaded images by texture bytes.
+            Evicted images are reloaded on their next `get_image`.
+        """
+
         self._resource = pyglet.resource
-        self._images = {}
+        self._images   = LRUCache(capacity, on_evict)
+        self._sources  = {}
 
         self.path = path
 
     def add_image(self, name, index, flip_x=False, flip_y=False, rotate=0, atlas=True):
-        try:
-            image = self._resource.image(name, flip_x, flip_y, rotate, atlas)
+        source = (name, flip_x, flip_y, rotate, atlas)
 
-            image.anchor_x = image.width // 2
-            image.anchor_y = image.height // 2
-
-            self._images[index] = image
+        try:
+            self._load_image(index, source)
 
         except ResourceNotFoundException as err:
+            # Keep whatever source the index had, so it still reloads
             print("Resource Not Found: {0}".format(err))
+            return
+
+        self._sources[index] = source
+
+    def _load_image(self, index, source=None):
+        image = self._resource.image(*(source or self._sources[index]))
+
+        image.anchor_x = image.width // 2
+        image.anchor_y = image.height // 2
+
+        self._images.put(index, image, image.width * image.height * 4)
+
+        return image
 
     def get_image(self, index):
-        return self._images[index]
+        image = self._images.get(index)
+
+        if image is None:
+            image = self._load_image(index)
+
+        return image
 
     def get_image_texture(self, index, rectangle=False, force_rectangle=False):
-        return self._images[index].get_texture(rectangle, forece_rectangle)
+        return self.get_image(index).get_texture(rectangle, force_rectangle)
+
+    @property
+    def images(self):
+        return self._images
 
     @property
     def path(self):
@@ -1,3 +1,5 @@
+from pybox.math import backend
 from pybox.math import vec2d
 from pybox.math import matrix
+from pybox.math import affine2d
 from pybox.math import transform
\ No newline at end of file
@@ -0,0 +1,209 @@
+/*
+ * Compiled math kernels for pybox.math.backend.
+ *
+ * Mirrors the pure Python kernels in backend.py, computing in
+ * doubles. Build with:
+ *
+ *     python -m pybox.math.build_ckernels
+ */
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+static int
+read_doubles(PyObject *seq, double *out, Py_ssize_t count, const char *name)
+{
+    PyObject *fast = PySequence_Fast(seq, name);
+
+    if (fast == NULL)
+        return -1;
+
+    if (PySequence_Fast_GET_SIZE(fast) != count) {
+        PyErr_Format(PyExc_ValueError, "%s must have %zd values", name, count);
+        Py_DECREF(fast);
+        return -1;
+    }
+
+    PyObject **items = PySequence_Fast_ITEMS(fast);
+
+    for (Py_ssize_t i = 0; i < count; i++) {
+        out[i] = PyFloat_AsDouble(items[i]);
+
+        if (out[i] == -1.0 && PyErr_Occurred()) {
+            Py_DECREF(fast);
+            return -1;
+        }
+    }
+
+    Py_DECREF(fast);
+    return 0;
+}
+
+static PyObject *
+dot(PyObject *self, PyObject *args)
+{
+    PyObject *a, *b;
+
+    if (!PyArg_ParseTuple(args, "OO", &a, &b))
+        return NULL;
+
+    PyObject *fa = PySequence_Fast(a, "dot expects sequences");
+
+    if (fa == NULL)
+        return NULL;
+
+    PyObject *fb = PySequence_Fast(b, "dot expects sequences");
+
+    if (fb == NULL) {
+        Py_DECREF(fa);
+        return NULL;
+    }
+
+    Py_ssize_t n = PySequence_Fast_GET_SIZE(fa);
+
+    if (PySequence_Fast_GET_SIZE(fb) < n)
+        n = PySequence_Fast_GET_SIZE(fb);
+
+    PyObject **ia = PySequence_Fast_ITEMS(fa);
+    PyObject **ib = PySequence_Fast_ITEMS(fb);
+    double total = 0.0;
+
+    for (Py_ssize_t i = 0; i < n; i++) {
+        double x = PyFloat_AsDouble(ia[i]);
+        double y = PyFloat_AsDouble(ib[i]);
+
+        if (PyErr_Occurred()) {
+            Py_DECREF(fa);
+            Py_DECREF(fb);
+            return NULL;
+        }
+
+        total += x * y;
+    }
+
+    Py_DECREF(fa);
+    Py_DECREF(fb);
+
+    return PyFloat_FromDouble(total);
+}
+
+static PyObject *
+clamp(PyObject *self, PyObject *args)
+{
+    double value, low, high;
+
+    if (!PyArg_ParseTuple(args, "ddd", &value, &low, &high))
+        return NULL;
+
+    if (low > high) {
+        double swap = low;
+        low  = high;
+        high = swap;
+    }
+
+    return PyFloat_FromDouble(value < low ? low : (value > high ? high : value));
+}
+
+static PyObject *
+mat4_mul(PyObject *self, PyObject *args)
+{
+    PyObject *sa, *sb;
+    double a[16], b[16];
+
+    if (!PyArg_ParseTuple(args, "OO", &sa, &sb))
+        return NULL;
+
+    if (read_doubles(sa, a, 16, "mat4_mul expects 16 values") < 0 ||
+        read_doubles(sb, b, 16, "mat4_mul expects 16 values") < 0)
+        return NULL;
+
+    PyObject *result = PyList_New(16);
+
+    if (result == NULL)
+        return NULL;
+
+    for (int r = 0; r < 4; r++) {
+        for (int c = 0; c < 4; c++) {
+            double v = a[r * 4]     * b[c]
+                     + a[r * 4 + 1] * b[4 + c]
+                     + a[r * 4 + 2] * b[8 + c]
+                     + a[r * 4 + 3] * b[12 + c];
+
+            PyObject *item = PyFloat_FromDouble(v);
+
+            if (item == NULL) {
+                Py_DECREF(result);
+                return NULL;
+            }
+
+            PyList_SET_ITEM(result, r * 4 + c, item);
+        }
+    }
+
+    return result;
+}
+
+static PyObject *
+transform_points(PyObject *self, PyObject *args)
+{
+    PyObject *saffine, *points;
+    double t[6];
+
+    if (!PyArg_ParseTuple(args, "OO", &saffine, &points))
+        return NULL;
+
+    if (read_doubles(saffine, t, 6, "transform_points expects 6 affine values") < 0)
+        return NULL;
+
+    PyObject *fast = PySequence_Fast(points, "transform_points expects a sequence of points");
+
+    if (fast == NULL)
+        return NULL;
+
+    Py_ssize_t n = PySequence_Fast_GET_SIZE(fast);
+    PyObject **items = PySequence_Fast_ITEMS(fast);
+    PyObject *result = PyList_New(n);
+
+    if (result == NULL) {
+        Py_DECREF(fast);
+        return NULL;
+    }
+
+    for (Py_ssize_t i = 0; i < n; i++) {
+        double p[2];
+        PyObject *point;
+
+        if (read_doubles(items[i], p, 2, "points must be (x, y) pairs") < 0 ||
+            (point = Py_BuildValue("(dd)",
+                                   t[0] * p[0] + t[2] * p[1] + t[4],
+                                   t[1] * p[0] + t[3] * p[1] + t[5])) == NULL) {
+            Py_DECREF(result);
+            Py_DECREF(fast);
+            return NULL;
+        }
+
+        PyList_SET_ITEM(result, i, point);
+    }
+
+    Py_DECREF(fast);
+
+    return result;
+}
+
+static PyMethodDef methods[] = {
+    {"dot", dot, METH_VARARGS, "Dot product of two sequences."},
+    {"clamp", clamp, METH_VARARGS, "Clamp a value between two bounds."},
+    {"mat4_mul", mat4_mul, METH_VARARGS, "Multiply two flat row-major 4x4 matrices."},
+    {"transform_points", transform_points, METH_VARARGS, "Map (x, y) points by an affine transform."},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef module = {
+    PyModuleDef_HEAD_INIT, "_ckernels", "Compiled pybox.math kernels.", -1, methods
+};
+
+PyMODINIT_FUNC
+PyInit__ckernels(void)
+{
+    return PyModule_Create(&module);
+}
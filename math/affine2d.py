@@ -0,0 +1,267 @@
+import ctypes
+import math
+
+from pybox.math import backend, vec2d
+
+
+class Affine2D:
+    """2D affine transform, stored as six floats.
+    Maps a point as:
+        x' = a * x + c * y + tx
+        y' = b * x + d * y + ty
+
+    Note:
+        `translate`, `rotate`, `scale` and `shear` update the
+        transform in place and return it, in the same order and
+        units (degrees) as `Matrix`.
+
+    Args:
+        a(float): x-axis x component (optional)
+        b(float): x-axis y component (optional)
+        c(float): y-axis x component (optional)
+        d(float): y-axis y component (optional)
+        tx(float): x translation (optional)
+        ty(float): y translation (optional)
+
+    Examples:
+        >>> t1 = Affine2D().translate(10, 20).scale(2, 3)
+        >>> print(t1)
+        Affine2D(2, 0, 0, 3, 10, 20)
+        >>> print(t1.transform_point(1, 1))
+        (12, 23)
+    """
+
+    __slots__ = ('a', 'b', 'c', 'd', 'tx', 'ty')
+
+    def __init__(self, a=1, b=0, c=0, d=1, tx=0, ty=0):
+        self.a  = a
+        self.b  = b
+        self.c  = c
+        self.d  = d
+        self.tx = tx
+        self.ty = ty
+
+    @classmethod
+    def from_trs(cls, x=0, y=0, angle=0, sx=1, sy=1, ox=0, oy=0, kx=0, ky=0):
+        """Build a transform from position, rotation, scale,
+        origin offset and shear, applied in that order.
+
+        Args:
+            x(float): x-coordinate (optional)
+            y(float): y-coordinate (optional)
+            angle(float): rotation in degrees (optional)
+            sx(float): x scale (optional)
+            sy(float): y scale (optional)
+            ox(float): x origin offset (optional)
+            oy(float): y origin offset (optional)
+            kx(float): x shear (optional)
+            ky(float): y shear (optional)
+
+        Returns:
+            Affine2D
+        """
+
+        return cls(tx=x, ty=y).rotate(angle).scale(sx, sy).shear(kx, ky).translate(-ox, -oy)
+
+    def clone(self):
+        """Copy object.
+
+        Returns:
+            Affine2D: copy of this Affine2D
+        """
+
+        return Affine2D(self.a, self.b, self.c, self.d, self.tx, self.ty)
+
+    def reset(self):
+        """Reset to the identity transform.
+
+        Returns:
+            Affine2D
+        """
+
+        self.a, self.b, self.c, self.d, self.tx, self.ty = 1, 0, 0, 1, 0, 0
+
+        return self
+
+    def translate(self, tx, ty):
+        self.tx += self.a * tx + self.c * ty
+        self.ty += self.b * tx + self.d * ty
+
+        return self
+
+    def rotate(self, angle):
+        r = math.radians(angle)
+        cs = math.cos(r)
+        sn = math.sin(r)
+
+        a, b, c, d = self.a, self.b, self.c, self.d
+
+        self.a = a * cs + c * sn
+        self.b = b * cs + d * sn
+        self.c = c * cs - a * sn
+        self.d = d * cs - b * sn
+
+        return self
+
+    def scale(self, sx, sy):
+        self.a *= sx
+        self.b *= sx
+        self.c *= sy
+        self.d *= sy
+
+        return self
+
+    def shear(self, kx, ky):
+        a, b, c, d = self.a, self.b, self.c, self.d
+
+        self.a = a + c * ky
+        self.b = b + d * ky
+        self.c = a * kx + c
+        self.d = b * kx + d
+
+        return self
+
+    def compose(self, other):
+        """Product of this transform and another.
+        The result applies `other` first, then this one.
+
+        Args:
+            other(Affine2D): transform to apply first
+
+        Returns:
+            Affine2D: new Affine2D
+        """
+
+        return Affine2D(
+            self.a * other.a  + self.c * other.b,
+            self.b * other.a  + self.d * other.b,
+            self.a * other.c  + self.c * other.d,
+            self.b * other.c  + self.d * other.d,
+            self.a * other.tx + self.c * other.ty + self.tx,
+            self.b * other.tx + self.d * other.ty + self.ty
+        )
+
+    def apply(self, other):
+        """Compose with another transform, in place.
+
+        Args:
+            other(Affine2D): transform to apply first
+
+        Returns:
+            Affine2D
+        """
+
+        self.a, self.b, self.c, self.d, self.tx, self.ty = self.compose(other).values
+
+        return self
+
+    def determinant(self):
+        return self.a * self.d - self.b * self.c
+
+    def invert(self):
+        """Inverse transform.
+
+        Raises:
+            ArithmeticError: Transform is singular.
+
+        Returns:
+            Affine2D: new Affine2D
+        """
+
+        det = self.determinant()
+
+        if det == 0:
+            raise ArithmeticError('Transform is singular and cannot be inverted.')
+
+        a =  self.d / det
+        b = -self.b / det
+        c = -self.c / det
+        d =  self.a / det
+
+        return Affine2D(a, b, c, d, -(a * self.tx + c * self.ty), -(b * self.tx + d * self.ty))
+
+    def transform_point(self, x, y):
+        """Map a single point.
+
+        Args:
+            x(float): x-coordinate
+            y(float): y-coordinate
+
+        Returns:
+            tuple
+        """
+
+        return (self.a * x + self.c * y + self.tx, self.b * x + self.d * y + self.ty)
+
+    def transform_points(self, points):
+        """Map a list of (x, y) points.
+
+        Args:
+            points(iterable): (x, y) points
+
+        Examples:
+            >>> t1 = Affine2D().translate(1, 1)
+            >>> print(t1.transform_points([(0, 0), (2, 3)]))
+            [(1, 1), (3, 4)]
+
+        Returns:
+            list
+        """
+
+        return backend.transform_points(self.values, points)
+
+    def to_matrix(self):
+        """Equivalent 4x4 `Matrix`.
+
+        Returns:
+            Matrix
+        """
+
+        from pybox.math.matrix import Matrix
+
+        matrix = Matrix()
+        matrix[0, 0], matrix[0, 1], matrix[0, 3] = self.a, self.c, self.tx
+        matrix[1, 0], matrix[1, 1], matrix[1, 3] = self.b, self.d, self.ty
+
+        return matrix
+
+    def as_ctypes(self):
+        """Copy into a new 4x4 ctypes float array,
+        in the column-major order OpenGL expects.
+
+        Return:
+            ctypes.Array
+        """
+
+        return (ctypes.c_float * 16)(
+            self.a,  self.b,  0, 0,
+            self.c,  self.d,  0, 0,
+            0,       0,       1, 0,
+            self.tx, self.ty, 0, 1
+        )
+
+    @property
+    def values(self):
+        """(a, b, c, d, tx, ty) tuple."""
+        return (self.a, self.b, self.c, self.d, self.tx, self.ty)
+
+    def __mul__(self, other):
+        if isinstance(other, Affine2D):
+            return self.compose(other)
+
+        if isinstance(other, vec2d.Vec2D):
+            return vec2d.Vec2D(*self.transform_point(other.x, other.y))
+
+        raise AttributeError('Attribute either must be a Vec2D or another Affine2D.')
+
+    def __eq__(self, other):
+        return isinstance(other, Affine2D) and self.values == other.values
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        return 'Affine2D(%s, %s, %s, %s, %s, %s)' % self.values
+
+    def __str__(self):
+        return repr(self)
@@ -0,0 +1,198 @@
+"""Math kernel backends.
+The kernels below are rebound by `use`, so callers that go
+through this module (`backend.dot(...)`) always hit the selected
+implementation with no dispatch overhead.
+
+Backends:
+    python:   pure Python, always available
+    numpy:    NumPy, pays off for long inputs
+    compiled: C extension `pybox.math._ckernels`, available once
+              built with `python -m pybox.math.build_ckernels`
+
+Other implementations exposing the functions named in `KERNELS`
+can be added with `register`.
+
+The backend is picked at import time from the
+`PYBOX_MATH_BACKEND` environment variable, falling back to
+`python`, and can be switched at runtime with `use`.
+
+Examples:
+    >>> use('python')
+    >>> print(dot([1, 2, 3], [3, 4, 6]), current())
+    29 python
+"""
+
+import importlib
+import operator
+import os
+import warnings
+
+ENV_VAR = 'PYBOX_MATH_BACKEND'
+KERNELS = ('dot', 'clamp', 'mat4_mul', 'transform_points')
+
+_loaders = {}
+_current = None
+
+
+def register(name, loader):
+    """Register a backend.
+
+    Args:
+        name(str): backend name
+        loader(callable): returns an object or module with every
+            function in `KERNELS`, or raises ImportError
+    """
+
+    _loaders[name] = loader
+
+
+def available():
+    """Names of the backends that can be loaded.
+
+    Returns:
+        list
+    """
+
+    names = []
+
+    for name, loader in _loaders.items():
+        try:
+            loader()
+        except ImportError:
+            continue
+
+        names.append(name)
+
+    return names
+
+
+def current():
+    """Name of the selected backend.
+
+    Returns:
+        str
+    """
+
+    return _current
+
+
+def use(name):
+    """Select the backend every kernel dispatches to.
+
+    Raises:
+        AttributeError: Backend is unknown or is missing kernels.
+        ImportError: Backend is not installed.
+
+    Args:
+        name(str): backend name
+    """
+
+    global _current
+
+    if name not in _loaders:
+        raise AttributeError('Unknown math backend: {}'.format(name))
+
+    kernels = _loaders[name]()
+    missing = [kernel for kernel in KERNELS if not hasattr(kernels, kernel)]
+
+    if missing:
+        raise AttributeError('Math backend {} is missing kernels: {}'.format(name, missing))
+
+    namespace = globals()
+
+    for kernel in KERNELS:
+        namespace[kernel] = getattr(kernels, kernel)
+
+    _current = name
+
+
+class _PythonKernels:
+    @staticmethod
+    def dot(a, b):
+        return sum(map(operator.mul, a, b))
+
+    @staticmethod
+    def clamp(value, low, high):
+        return max(min(low, high), min(value, max(low, high)))
+
+    @staticmethod
+    def mat4_mul(a, b):
+        a00, a01, a02, a03, a10, a11, a12, a13, a20, a21, a22, a23, a30, a31, a32, a33 = a
+        b00, b01, b02, b03, b10, b11, b12, b13, b20, b21, b22, b23, b30, b31, b32, b33 = b
+
+        return [
+            a00 * b00 + a01 * b10 + a02 * b20 + a03 * b30,
+            a00 * b01 + a01 * b11 + a02 * b21 + a03 * b31,
+            a00 * b02 + a01 * b12 + a02 * b22 + a03 * b32,
+            a00 * b03 + a01 * b13 + a02 * b23 + a03 * b33,
+
+            a10 * b00 + a11 * b10 + a12 * b20 + a13 * b30,
+            a10 * b01 + a11 * b11 + a12 * b21 + a13 * b31,
+            a10 * b02 + a11 * b12 + a12 * b22 + a13 * b32,
+            a10 * b03 + a11 * b13 + a12 * b23 + a13 * b33,
+
+            a20 * b00 + a21 * b10 + a22 * b20 + a23 * b30,
+            a20 * b01 + a21 * b11 + a22 * b21 + a23 * b31,
+            a20 * b02 + a21 * b12 + a22 * b22 + a23 * b32,
+            a20 * b03 + a21 * b13 + a22 * b23 + a23 * b33,
+
+            a30 * b00 + a31 * b10 + a32 * b20 + a33 * b30,
+            a30 * b01 + a31 * b11 + a32 * b21 + a33 * b31,
+            a30 * b02 + a31 * b12 + a32 * b22 + a33 * b32,
+            a30 * b03 + a31 * b13 + a32 * b23 + a33 * b33
+        ]
+
+    @staticmethod
+    def transform_points(affine, points):
+        a, b, c, d, tx, ty = affine
+
+        return [(a * x + c * y + tx, b * x + d * y + ty) for x, y in points]
+
+
+def _load_python():
+    return _PythonKernels
+
+
+def _load_numpy():
+    import numpy as np
+
+    class _NumpyKernels:
+        @staticmethod
+        def dot(a, b):
+            return np.dot(a, b).item()
+
+        @staticmethod
+        def clamp(value, low, high):
+            result = np.clip(value, min(low, high), max(low, high))
+
+            return result.item() if np.ndim(result) == 0 else result
+
+        @staticmethod
+        def mat4_mul(a, b):
+            return np.matmul(np.reshape(a, (4, 4)), np.reshape(b, (4, 4))).ravel().tolist()
+
+        @staticmethod
+        def transform_points(affine, points):
+            a, b, c, d, tx, ty = affine
+            result = np.asarray(points, dtype=float).reshape(-1, 2) @ np.array([[a, b], [c, d]]) + (tx, ty)
+
+            return list(map(tuple, result.tolist()))
+
+    return _NumpyKernels
+
+
+def _load_compiled():
+    return importlib.import_module('pybox.math._ckernels')
+
+
+register('python', _load_python)
+register('numpy', _load_numpy)
+register('compiled', _load_compiled)
+
+use('python')
+
+if os.environ.get(ENV_VAR):
+    try:
+        use(os.environ[ENV_VAR])
+    except (AttributeError, ImportError) as e:
+        warnings.warn('{}, using the python math backend.'.format(e))
@@ -0,0 +1,29 @@
+"""Build the compiled math kernels in place.
+
+Compiles `_ckernels.c` next to this file, so the `compiled`
+backend of `pybox.math.backend` becomes available. Needs a C
+compiler and the Python headers.
+
+Usage:
+    python -m pybox.math.build_ckernels
+"""
+
+import os
+import tempfile
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def build():
+    from setuptools import Extension, setup
+
+    with tempfile.TemporaryDirectory() as temp:
+        setup(
+            name='pybox-ckernels',
+            ext_modules=[Extension('_ckernels', [os.path.join(HERE, '_ckernels.c')])],
+            script_args=['build_ext', '--build-lib', HERE, '--build-temp', temp],
+        )
+
+
+if __name__ == '__main__':
+    build()
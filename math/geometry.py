@@ -0,0 +1,212 @@
+"""Vectorized 2D geometry kernels.
+Points are (..., 2) arrays, segments are (..., 2, 2) arrays of
+(start, end) and polygons are (..., K, 2) arrays of vertices.
+Anything array-like is accepted; results are NumPy arrays or
+floats for single inputs.
+"""
+
+import numpy as np
+
+
+def signed_area(polygons):
+    """Signed area, positive for counter-clockwise vertices.
+
+    Args:
+        polygons(array): (K, 2) polygon or (P, K, 2) polygons
+
+    Examples:
+        >>> print(signed_area([(0, 0), (2, 0), (2, 1), (0, 1)]))
+        2.0
+
+    Returns:
+        float or array: (P,) areas
+    """
+
+    p = np.asarray(polygons, dtype=float)
+    x = p[..., 0]
+    y = p[..., 1]
+
+    area = (x * np.roll(y, -1, axis=-1) - np.roll(x, -1, axis=-1) * y).sum(axis=-1) / 2
+
+    return area.item() if area.ndim == 0 else area
+
+
+def centroid(polygons):
+    """Centroid of the polygon area.
+    Degenerate (zero area) polygons use the vertex mean.
+
+    Args:
+        polygons(array): (K, 2) polygon or (P, K, 2) polygons
+
+    Examples:
+        >>> print(centroid([(0, 0), (2, 0), (2, 1), (0, 1)]).tolist())
+        [1.0, 0.5]
+
+    Returns:
+        array: (2,) or (P, 2) centroids
+    """
+
+    p  = np.asarray(polygons, dtype=float)
+    x  = p[..., 0]
+    y  = p[..., 1]
+    nx = np.roll(x, -1, axis=-1)
+    ny = np.roll(y, -1, axis=-1)
+
+    cross = x * ny - nx * y
+    area  = cross.sum(axis=-1) / 2
+    cx    = ((x + nx) * cross).sum(axis=-1)
+    cy    = ((y + ny) * cross).sum(axis=-1)
+
+    degenerate = area == 0
+    safe       = np.where(degenerate, 1, 6 * area)
+
+    result = np.stack([cx / safe, cy / safe], axis=-1)
+
+    if np.any(degenerate):
+        result = np.where(degenerate[..., None], p.mean(axis=-2), result)
+
+    return result
+
+
+def points_in_polygon(points, polygon):
+    """Even-odd containment test of many points against one polygon.
+    Points exactly on an edge may fall either way.
+
+    Args:
+        points(array): (M, 2) points
+        polygon(array): (K, 2) polygon
+
+    Examples:
+        >>> square = [(0, 0), (2, 0), (2, 2), (0, 2)]
+        >>> print(points_in_polygon([(1, 1), (3, 1)], square).tolist())
+        [True, False]
+
+    Returns:
+        array: (M,) bools
+    """
+
+    pts  = np.asarray(points, dtype=float).reshape(-1, 2)
+    poly = np.asarray(polygon, dtype=float)
+
+    px = pts[:, 0, None]
+    py = pts[:, 1, None]
+    x1 = poly[:, 0]
+    y1 = poly[:, 1]
+    x2 = np.roll(x1, -1)
+    y2 = np.roll(y1, -1)
+
+    # Edges that straddle the horizontal ray through each point
+    straddle = (y1 > py) != (y2 > py)
+    dy       = np.where(y2 == y1, 1, y2 - y1)
+    cross_x  = x1 + (py - y1) * (x2 - x1) / dy
+
+    return np.count_nonzero(straddle & (px < cross_x), axis=1) % 2 == 1
+
+
+def points_in_polygons(points, polygons):
+    """Containment test of many points against many polygons.
+
+    Args:
+        points(array): (M, 2) points
+        polygons(list): (K, 2) polygons, K may differ
+
+    Returns:
+        array: (P, M) bools
+    """
+
+    pts = np.asarray(points, dtype=float).reshape(-1, 2)
+
+    return np.array([points_in_polygon(pts, polygon) for polygon in polygons]).reshape(-1, len(pts))
+
+
+def _orientation(ax, ay, bx, by, cx, cy):
+    return np.sign((bx - ax) * (cy - ay) - (by - ay) * (cx - ax))
+
+
+def _on_segment(ax, ay, bx, by, cx, cy):
+    return (np.minimum(ax, bx) <= cx) & (cx <= np.maximum(ax, bx)) & \
+           (np.minimum(ay, by) <= cy) & (cy <= np.maximum(ay, by))
+
+
+def segments_intersect(a, b):
+    """Pairwise segment intersection, including touching and
+    collinear overlap. Inputs broadcast, so `a[:, None]` against
+    `b[None, :]` tests every pair.
+
+    Args:
+        a(array): (..., 2, 2) segments
+        b(array): (..., 2, 2) segments
+
+    Examples:
+        >>> a = [((0, 0), (2, 2)), ((0, 0), (1, 0))]
+        >>> b = [((0, 2), (2, 0)), ((2, 1), (3, 1))]
+        >>> print(segments_intersect(a, b).tolist())
+        [True, False]
+
+    Returns:
+        array: bools
+    """
+
+    a = np.asarray(a, dtype=float)
+    b = np.asarray(b, dtype=float)
+
+    p1x, p1y = a[..., 0, 0], a[..., 0, 1]
+    p2x, p2y = a[..., 1, 0], a[..., 1, 1]
+    q1x, q1y = b[..., 0, 0], b[..., 0, 1]
+    q2x, q2y = b[..., 1, 0], b[..., 1, 1]
+
+    o1 = _orientation(p1x, p1y, p2x, p2y, q1x, q1y)
+    o2 = _orientation(p1x, p1y, p2x, p2y, q2x, q2y)
+    o3 = _orientation(q1x, q1y, q2x, q2y, p1x, p1y)
+    o4 = _orientation(q1x, q1y, q2x, q2y, p2x, p2y)
+
+    proper = (o1 * o2 < 0) & (o3 * o4 < 0)
+
+    touching = ((o1 == 0) & _on_segment(p1x, p1y, p2x, p2y, q1x, q1y)) | \
+               ((o2 == 0) & _on_segment(p1x, p1y, p2x, p2y, q2x, q2y)) | \
+               ((o3 == 0) & _on_segment(q1x, q1y, q2x, q2y, p1x, p1y)) | \
+               ((o4 == 0) & _on_segment(q1x, q1y, q2x, q2y, p2x, p2y))
+
+    return proper | touching
+
+
+def convex_hull(points):
+    """Convex hull by Andrew's monotone chain.
+
+    Args:
+        points(array): (M, 2) points
+
+    Examples:
+        >>> print(convex_hull([(0, 0), (1, 1), (2, 0), (1, 0.5), (1, -1)]).tolist())
+        [[0.0, 0.0], [1.0, -1.0], [2.0, 0.0], [1.0, 1.0]]
+
+    Returns:
+        array: (H, 2) counter-clockwise hull vertices
+    """
+
+    pts   = np.unique(np.asarray(points, dtype=float).reshape(-1, 2), axis=0)
+    order = pts.tolist()
+
+    if len(order) < 3:
+        return pts
+
+    def half(sequence):
+        chain = []
+
+        for x, y in sequence:
+            while len(chain) >= 2:
+                (ax, ay), (bx, by) = chain[-2], chain[-1]
+
+                if (bx - ax) * (y - ay) - (by - ay) * (x - ax) > 0:
+                    break
+
+                chain.pop()
+
+            chain.append((x, y))
+
+        return chain
+
+    lower = half(order)
+    upper = half(reversed(order))
+
+    return np.array(lower[:-1] + upper[:-1])
@@ -1,14 +1,46 @@
-import copy
+import ctypes
 import math
 
-from pybox.math import vec2d, util
+from pybox.math import backend, vec2d, util
 
 
 class Matrix:
+    """Row-major matrix, 4x4 by default.
+    Elements are kept in one flat list, so element (r, c)
+    is `_matx[r * cols + c]`.
+
+    Note:
+        `translate`, `rotate`, `scale` and `shear` update the
+        matrix in place and return it, so calls can be chained.
+        4x4 products use an unrolled multiply.
+
+    Args:
+        rows(int): number of rows (optional)
+        cols(int): number of columns (optional)
+
+    Examples:
+        >>> m1 = Matrix().translate(10, 20)
+        >>> print(m1 * vec2d.Vec2D(1, 2))
+        (11, 22)
+        >>> print(m1.getColumn(3))
+        [10, 20, 0, 1]
+    """
+
     def __init__(self, rows = 4, cols = 4):
         self._matx = Matrix.identity(rows, cols)
         self._rows = rows
         self._cols = cols
+        self._inverse = None
+
+    @classmethod
+    def _from_values(cls, rows, cols, values):
+        matrix = cls.__new__(cls)
+        matrix._matx = values
+        matrix._rows = rows
+        matrix._cols = cols
+        matrix._inverse = None
+
+        return matrix
 
     def clone(self):
         """Copy object.
@@ -17,71 +49,86 @@ class Matrix:
             Matrix: copy of this Matrix
         """
 
-        return copy.deepcopy(self)
+        return self._from_values(self._rows, self._cols, list(self._matx))
 
     def translate(self, tx, ty, tz=0):
         assert self._rows == 4 and self._cols == 4, 'Translations require a 4x4 matrix.'
 
-        tmp = Matrix()
-        tmp._matx = Matrix.identity(4, 4)
+        self._inverse = None
 
-        tmp._matx[0][3] = tx
-        tmp._matx[1][3] = ty
-        tmp._matx[2][3] = tz
+        m = self._matx
 
-        self._matx = Matrix.mul(self, tmp)
+        for i in (0, 4, 8, 12):
+            m[i + 3] += m[i] * tx + m[i + 1] * ty + m[i + 2] * tz
 
         return self
 
     def scale(self, sx, sy, sz=1):
         assert self._rows == 4 and self._cols == 4, 'Scaling require a 4x4 matrix.'
 
-        tmp = Matrix()
-        tmp._matx = Matrix.identity(4, 4)
+        self._inverse = None
 
-        tmp._matx[0][0] = sx
-        tmp._matx[1][1] = sy
-        tmp._matx[2][2] = sz
+        m = self._matx
 
-        self._matx = Matrix.mul(self, tmp)
+        for i in (0, 4, 8, 12):
+            m[i]     *= sx
+            m[i + 1] *= sy
+            m[i + 2] *= sz
 
         return self
 
     def rotate(self, angle, x=0, y=0, z=1):
         assert self._rows == 4 and self._cols == 4, 'Rotations require a 4x4 matrix.'
 
-        tmp = Matrix()
-        tmp._matx = Matrix.identity(4, 4)
+        self._inverse = None
 
+        m = self._matx
         r = math.radians(angle)
         c = math.cos(r)
         s = math.sin(r)
+
+        if x == 0 and y == 0 and z == 1:
+            for i in (0, 4, 8, 12):
+                a, b = m[i], m[i + 1]
+
+                m[i]     = a * c + b * s
+                m[i + 1] = b * c - a * s
+
+            return self
+
         o = 1.0 - c
 
-        tmp._matx[0][0] = x * o + c
-        tmp._matx[0][1] = x * y * o - z * s
-        tmp._matx[0][2] = x * z * o + y * s
-        tmp._matx[1][0] = y * x * o + z * s
-        tmp._matx[1][1] = y * o + c
-        tmp._matx[1][2] = y * z * o - x * s
-        tmp._matx[2][0] = x * z * o - y * s
-        tmp._matx[2][1] = y * z * o + x * s
-        tmp._matx[2][2] = z * o + c
+        r00 = x * x * o + c
+        r01 = x * y * o - z * s
+        r02 = x * z * o + y * s
+        r10 = y * x * o + z * s
+        r11 = y * y * o + c
+        r12 = y * z * o - x * s
+        r20 = x * z * o - y * s
+        r21 = y * z * o + x * s
+        r22 = z * z * o + c
+
+        for i in (0, 4, 8, 12):
+            a, b, d = m[i], m[i + 1], m[i + 2]
 
-        self._matx = Matrix.mul(self, tmp)
+            m[i]     = a * r00 + b * r10 + d * r20
+            m[i + 1] = a * r01 + b * r11 + d * r21
+            m[i + 2] = a * r02 + b * r12 + d * r22
 
         return self
 
     def shear(self, kx, ky):
         assert self._rows == 4 and self._cols == 4, 'Shearing require a 4x4 matrix.'
 
-        tmp = Matrix()
-        tmp._matx = Matrix.identity(4, 4)
+        self._inverse = None
+
+        m = self._matx
 
-        tmp._matx[0][1] = kx
-        tmp._matx[1][0] = ky
+        for i in (0, 4, 8, 12):
+            a, b = m[i], m[i + 1]
 
-        self._matx = Matrix.mul(self, tmp)
+            m[i]     = a + b * ky
+            m[i + 1] = a * kx + b
 
         return self
 
@@ -89,37 +136,71 @@ class Matrix:
         return self.rotate(math.radians(180))
 
     def transpose(self):
-        tmp = Matrix()
-
-        col0 = self.getColumn(0)
-        col1 = self.getColumn(1)
-        col2 = self.getColumn(2)
-        col3 = self.getColumn(3)
-
-        tmp._matx[0][0] = col0[0]
-        tmp._matx[0][1] = col0[1]
-        tmp._matx[0][2] = col0[2]
-        tmp._matx[0][3] = col0[3]
-        tmp._matx[1][0] = col1[0]
-        tmp._matx[1][1] = col1[1]
-        tmp._matx[1][2] = col1[2]
-        tmp._matx[1][3] = col1[3]
-        tmp._matx[2][0] = col2[0]
-        tmp._matx[2][1] = col2[1]
-        tmp._matx[2][2] = col2[2]
-        tmp._matx[2][3] = col2[3]
-        tmp._matx[3][0] = col3[0]
-        tmp._matx[3][1] = col3[1]
-        tmp._matx[3][2] = col3[2]
-        tmp._matx[3][3] = col3[3]
-
-        return tmp
+        return self._from_values(self._cols, self._rows, self._column_major())
 
     def inverse(self):
-        raise NotImplementedError
+        """Inverse of this Matrix.
+        The result is cached until the matrix changes, so
+        repeated calls only pay for the copy.
+
+        Raises:
+            ArithmeticError: Matrix is not square or is singular.
+
+        Examples:
+            >>> m1 = Matrix().translate(10, 20).scale(2, 4)
+            >>> print(m1.inverse() * vec2d.Vec2D(12, 24))
+            (1.0, 1.0)
+
+        Return:
+            Matrix: new Matrix
+        """
+
+        if self._inverse is None:
+            if self._rows != self._cols:
+                raise ArithmeticError('Only square matrices can be inverted.')
+
+            if self._rows != 4:
+                values = _inverse_generic(self._matx, self._rows)
+            elif self._isAffine():
+                values = _inverse_affine4(self._matx)
+            else:
+                values = _inverse4(self._matx)
+
+            self._inverse = Matrix._from_values(self._rows, self._cols, values)
+
+        return self._inverse.clone()
 
     def determinant(self):
-        raise NotImplementedError
+        """Determinant of this Matrix.
+
+        Raises:
+            ArithmeticError: Matrix is not square.
+
+        Return:
+            float
+        """
+
+        if self._rows != self._cols:
+            raise ArithmeticError('Only square matrices have a determinant.')
+
+        m = self._matx
+
+        if self._rows != 4:
+            return _determinant_generic(m, self._rows)
+
+        if self._isAffine():
+            return m[0] * (m[5] * m[10] - m[6] * m[9]) \
+                 - m[1] * (m[4] * m[10] - m[6] * m[8]) \
+                 + m[2] * (m[4] * m[9]  - m[5] * m[8])
+
+        s, c = _minors4(m)
+
+        return s[0] * c[5] - s[1] * c[4] + s[2] * c[3] + s[3] * c[2] - s[4] * c[1] + s[5] * c[0]
+
+    def _isAffine(self):
+        m = self._matx
+
+        return m[12] == 0 and m[13] == 0 and m[14] == 0 and m[15] == 1
 
     def getRow(self, r):
         """Get a list of element in the `r` row.
@@ -131,7 +212,9 @@ class Matrix:
             List
         """
 
-        return self._matx[r]
+        start = r * self._cols
+
+        return self._matx[start:start + self._cols]
 
     def getColumn(self, c):
         """Get a list of element in the `c` column.
@@ -143,7 +226,54 @@ class Matrix:
             List
         """
 
-        return [self._matx[r][c] for r in range(self._rows)]
+        return self._matx[c::self._cols]
+
+    def as_ctypes(self):
+        """Copy the elements into a new ctypes float array,
+        in the column-major order OpenGL expects.
+
+        Examples:
+            >>> m1 = Matrix().translate(10, 20)
+            >>> print(list(m1.as_ctypes())[12:])
+            [10.0, 20.0, 0.0, 1.0]
+
+        Return:
+            ctypes.Array
+        """
+
+        return (ctypes.c_float * len(self._matx))(*self._column_major())
+
+    @property
+    def buffer(self):
+        """Read-only column-major view of the elements.
+
+        Return:
+            memoryview
+        """
+
+        return memoryview(self.as_ctypes()).cast('B').cast('f').toreadonly()
+
+    def _column_major(self):
+        m = self._matx
+
+        if self._rows == 4 and self._cols == 4:
+            return [
+                m[0], m[4], m[8],  m[12],
+                m[1], m[5], m[9],  m[13],
+                m[2], m[6], m[10], m[14],
+                m[3], m[7], m[11], m[15]
+            ]
+
+        return [m[r * self._cols + c] for c in range(self._cols) for r in range(self._rows)]
+
+    def __getitem__(self, index):
+        r, c = index
+        return self._matx[r * self._cols + c]
+
+    def __setitem__(self, index, value):
+        r, c = index
+        self._inverse = None
+        self._matx[r * self._cols + c] = value
 
     def __mul__(self, other):
         return Matrix.mul(self, other)
@@ -168,55 +298,52 @@ class Matrix:
         """
 
         if type(b) == vec2d.Vec2D:
+            if a._cols != 4:
+                raise ArithmeticError("Vec2D multiplication requires a 4 column Matrix.")
+
+            m = a._matx
+
             result = vec2d.Vec2D(
-                util.dot(a.getRow(0), [b.x, b.y, 1, 1]),
-                util.dot(a.getRow(1), [b.x, b.y, 1, 1])
+                m[0] * b.x + m[1] * b.y + m[2] + m[3],
+                m[4] * b.x + m[5] * b.y + m[6] + m[7]
             )
 
         elif type(b) == Matrix:
             if a._cols != b._rows:
                 raise ArithmeticError("First Matrix column count doesn't match second Matrix row count.")
 
-            result = Matrix.new(a._rows, b._cols)
+            if a._rows == 4 and a._cols == 4 and b._cols == 4:
+                values = backend.mat4_mul(a._matx, b._matx)
+            else:
+                values = [
+                    util.dot(a.getRow(r), b.getColumn(c))
+                    for r in range(a._rows)
+                    for c in range(b._cols)
+                ]
 
-            for r in range(a._rows):
-                rowValues = a.getRow(r)
-
-                for c in range(b._cols):
-                    result[r][c] = util.dot(rowValues, b.getColumn(c))
+            result = Matrix._from_values(a._rows, b._cols, values)
 
         elif type(b) == int or type(b) == float:
-            result = Matrix.new(a._rows, b._cols)
-
-            for r in range(a._rows):
-                for c in range(a._cols):
-                    result[r][c] = a._matx[r][c] * b
+            result = Matrix._from_values(a._rows, a._cols, [value * b for value in a._matx])
         else:
             raise AttributeError("Attribute either must be a scalar value, Vec2D or another Matrix.")
 
         return result
 
     def __eq__(self, other):
-        equals = True
-
-        for r in range(self._rows):
-            for c in range(self._cols):
-                if self._matx[r][c] != other._matx[r][c]:
-                    equals = False
-
-        return equals
+        return self._rows == other._rows and self._cols == other._cols and self._matx == other._matx
 
     def __ne__(self, other):
         return not self == other
 
     def __repr__(self):
-        raise NotImplementedError
+        return 'Matrix(rows=%s, cols=%s)' % (self._rows, self._cols)
 
     def __str__(self):
         result = ''
 
-        for row in self._matx:
-            result += str(row) + "\n"
+        for r in range(self._rows):
+            result += str(self.getRow(r)) + "\n"
 
         return result
 
@@ -230,10 +357,10 @@ class Matrix:
             cols(int): number of columns
 
         Return:
-            List
+            List: flat, row-major elements
         """
 
-        return [[0 for r in range(rows)] for c in range(cols)]
+        return [0] * (rows * cols)
 
     # Identity Matrix
     @staticmethod
@@ -245,14 +372,154 @@ class Matrix:
             cols(int): number of columns
 
         Return:
-            List
+            List: flat, row-major elements
         """
 
         matrix = Matrix.new(rows, cols)
 
-        for r in range(rows):
-            for c in range(cols):
-                if r == c:
-                    matrix[r][c] = 1
+        for i in range(min(rows, cols)):
+            matrix[i * cols + i] = 1
 
         return matrix
+
+
+def _minors4(m):
+    a00, a01, a02, a03, a10, a11, a12, a13, a20, a21, a22, a23, a30, a31, a32, a33 = m
+
+    s = (
+        a00 * a11 - a10 * a01,
+        a00 * a12 - a10 * a02,
+        a00 * a13 - a10 * a03,
+        a01 * a12 - a11 * a02,
+        a01 * a13 - a11 * a03,
+        a02 * a13 - a12 * a03
+    )
+    c = (
+        a20 * a31 - a30 * a21,
+        a20 * a32 - a30 * a22,
+        a20 * a33 - a30 * a23,
+        a21 * a32 - a31 * a22,
+        a21 * a33 - a31 * a23,
+        a22 * a33 - a32 * a23
+    )
+
+    return s, c
+
+
+def _inverse4(m):
+    a00, a01, a02, a03, a10, a11, a12, a13, a20, a21, a22, a23, a30, a31, a32, a33 = m
+    (s0, s1, s2, s3, s4, s5), (c0, c1, c2, c3, c4, c5) = _minors4(m)
+
+    det = s0 * c5 - s1 * c4 + s2 * c3 + s3 * c2 - s4 * c1 + s5 * c0
+
+    if det == 0:
+        raise ArithmeticError('Matrix is singular and cannot be inverted.')
+
+    inv = 1.0 / det
+
+    return [
+        ( a11 * c5 - a12 * c4 + a13 * c3) * inv,
+        (-a01 * c5 + a02 * c4 - a03 * c3) * inv,
+        ( a31 * s5 - a32 * s4 + a33 * s3) * inv,
+        (-a21 * s5 + a22 * s4 - a23 * s3) * inv,
+
+        (-a10 * c5 + a12 * c2 - a13 * c1) * inv,
+        ( a00 * c5 - a02 * c2 + a03 * c1) * inv,
+        (-a30 * s5 + a32 * s2 - a33 * s1) * inv,
+        ( a20 * s5 - a22 * s2 + a23 * s1) * inv,
+
+        ( a10 * c4 - a11 * c2 + a13 * c0) * inv,
+        (-a00 * c4 + a01 * c2 - a03 * c0) * inv,
+        ( a30 * s4 - a31 * s2 + a33 * s0) * inv,
+        (-a20 * s4 + a21 * s2 - a23 * s0) * inv,
+
+        (-a10 * c3 + a11 * c1 - a12 * c0) * inv,
+        ( a00 * c3 - a01 * c1 + a02 * c0) * inv,
+        (-a30 * s3 + a31 * s1 - a32 * s0) * inv,
+        ( a20 * s3 - a21 * s1 + a22 * s0) * inv
+    ]
+
+
+def _inverse_affine4(m):
+    a00, a01, a02, tx, a10, a11, a12, ty, a20, a21, a22, tz = m[:12]
+
+    i00 = a11 * a22 - a12 * a21
+    i01 = a02 * a21 - a01 * a22
+    i02 = a01 * a12 - a02 * a11
+    i10 = a12 * a20 - a10 * a22
+    i11 = a00 * a22 - a02 * a20
+    i12 = a02 * a10 - a00 * a12
+    i20 = a10 * a21 - a11 * a20
+    i21 = a01 * a20 - a00 * a21
+    i22 = a00 * a11 - a01 * a10
+
+    det = a00 * i00 + a01 * i10 + a02 * i20
+
+    if det == 0:
+        raise ArithmeticError('Matrix is singular and cannot be inverted.')
+
+    inv = 1.0 / det
+
+    i00, i01, i02 = i00 * inv, i01 * inv, i02 * inv
+    i10, i11, i12 = i10 * inv, i11 * inv, i12 * inv
+    i20, i21, i22 = i20 * inv, i21 * inv, i22 * inv
+
+    return [
+        i00, i01, i02, -(i00 * tx + i01 * ty + i02 * tz),
+        i10, i11, i12, -(i10 * tx + i11 * ty + i12 * tz),
+        i20, i21, i22, -(i20 * tx + i21 * ty + i22 * tz),
+        0,   0,   0,   1
+    ]
+
+
+def _eliminate(m, n, inverse):
+    rows = [list(m[r * n:(r + 1) * n]) for r in range(n)]
+    out  = [[1 if r == c else 0 for c in range(n)] for r in range(n)] if inverse else None
+    det  = 1
+
+    for col in range(n):
+        pivot = max(range(col, n), key=lambda r: abs(rows[r][col]))
+
+        if rows[pivot][col] == 0:
+            if inverse:
+                raise ArithmeticError('Matrix is singular and cannot be inverted.')
+
+            return 0
+
+        if pivot != col:
+            rows[col], rows[pivot] = rows[pivot], rows[col]
+            det = -det
+
+            if inverse:
+                out[col], out[pivot] = out[pivot], out[col]
+
+        value = rows[col][col]
+        det  *= value
+
+        # Gauss-Jordan clears the whole column, Gauss only below the pivot
+        start = 0 if inverse else col + 1
+
+        for r in range(start, n):
+            if r == col:
+                continue
+
+            factor = rows[r][col] / value
+
+            if factor:
+                rows[r] = [x - factor * y for x, y in zip(rows[r], rows[col])]
+
+                if inverse:
+                    out[r] = [x - factor * y for x, y in zip(out[r], out[col])]
+
+    if not inverse:
+        return det
+
+    return [out[r][c] / rows[r][r] for r in range(n) for c in range(n)]
+
+
+def _inverse_generic(m, n):
+    return _eliminate(m, n, True)
+
+
+def _determinant_generic(m, n):
+    return _eliminate(m, n, False)
@@ -0,0 +1,285 @@
+import numpy as np
+
+from pybox.math.affine2d import Affine2D
+
+
+class MatrixBatch:
+    """Stack of N transforms, held as one (N, 3, 3) or
+    (N, 4, 4) NumPy array, so thousands of shapes can be
+    composed, inverted and applied in one vectorized pass.
+
+    Note:
+        3x3 batches are 2D affine transforms, using the same
+        layout and rotation units (degrees) as `Affine2D`.
+        Points are always 2D; for 4x4 batches they are mapped
+        as (x, y, 0, 1).
+
+    Raises:
+        AttributeError: Matrices are not an (N, 3, 3) or (N, 4, 4) array.
+
+    Args:
+        matrices(array): (N, 3, 3) or (N, 4, 4) transforms
+        dtype(dtype): float32 or float64 (optional)
+
+    Examples:
+        >>> b1 = MatrixBatch.from_trs([0, 10], [0, 20], sx=2)
+        >>> print(b1.transform_points([(1, 1)]).tolist())
+        [[[2.0, 1.0]], [[12.0, 21.0]]]
+    """
+
+    __slots__ = ('_matrices',)
+
+    def __init__(self, matrices, dtype=np.float64):
+        matrices = np.ascontiguousarray(matrices, dtype=dtype)
+
+        if matrices.ndim != 3 or matrices.shape[1] != matrices.shape[2] or matrices.shape[1] not in (3, 4):
+            raise AttributeError('Matrices must be an (N, 3, 3) or (N, 4, 4) array.')
+
+        self._matrices = matrices
+
+    @classmethod
+    def identity(cls, count, size=3, dtype=np.float64):
+        """Create a batch of identity transforms.
+
+        Args:
+            count(int): number of transforms
+            size(int): 3 or 4 (optional)
+            dtype(dtype): float32 or float64 (optional)
+
+        Returns:
+            MatrixBatch
+        """
+
+        return cls(np.repeat(np.eye(size, dtype=dtype)[None], count, axis=0), dtype)
+
+    @classmethod
+    def from_trs(cls, x, y, rotation=0, sx=1, sy=1, kx=0, ky=0, ox=0, oy=0, dtype=np.float64):
+        """Build 3x3 transforms from position, rotation, scale,
+        shear and origin offset, in the order of `Affine2D.from_trs`.
+        Scalars are broadcast against the arrays.
+
+        Args:
+            x(array): x-coordinates
+            y(array): y-coordinates
+            rotation(array): rotations in degrees (optional)
+            sx(array): x scales (optional)
+            sy(array): y scales (optional)
+            kx(array): x shears (optional)
+            ky(array): y shears (optional)
+            ox(array): x origin offsets (optional)
+            oy(array): y origin offsets (optional)
+            dtype(dtype): float32 or float64 (optional)
+
+        Returns:
+            MatrixBatch
+        """
+
+        x, y, rotation, sx, sy, kx, ky, ox, oy = np.broadcast_arrays(
+            *(np.asarray(value, dtype=dtype) for value in (x, y, rotation, sx, sy, kx, ky, ox, oy))
+        )
+
+        r  = np.radians(rotation)
+        cs = np.cos(r)
+        sn = np.sin(r)
+
+        a = cs * sx - sn * sy * ky
+        b = sn * sx + cs * sy * ky
+        c = cs * sx * kx - sn * sy
+        d = sn * sx * kx + cs * sy
+
+        matrices = np.zeros(x.shape + (3, 3), dtype=dtype)
+        matrices[..., 0, 0] = a
+        matrices[..., 0, 1] = c
+        matrices[..., 0, 2] = x - a * ox - c * oy
+        matrices[..., 1, 0] = b
+        matrices[..., 1, 1] = d
+        matrices[..., 1, 2] = y - b * ox - d * oy
+        matrices[..., 2, 2] = 1
+
+        return cls(matrices.reshape(-1, 3, 3), dtype)
+
+    @classmethod
+    def from_groups(cls, groups, dtype=np.float64):
+        """Build 3x3 transforms from `TransformGroup`s.
+
+        Args:
+            groups(list): transform groups
+            dtype(dtype): float32 or float64 (optional)
+
+        Returns:
+            MatrixBatch
+        """
+
+        values = np.array(
+            [(g.x, g.y, g.rotation, g.sx, g.sy, g.kx, g.ky) for g in groups],
+            dtype=dtype
+        ).reshape(-1, 7)
+
+        return cls.from_trs(*values.T, dtype=dtype)
+
+    @classmethod
+    def from_affines(cls, affines, dtype=np.float64):
+        """Build 3x3 transforms from `Affine2D`s.
+
+        Args:
+            affines(list): transforms
+            dtype(dtype): float32 or float64 (optional)
+
+        Returns:
+            MatrixBatch
+        """
+
+        values   = np.array([t.values for t in affines], dtype=dtype).reshape(-1, 6)
+        matrices = np.zeros((len(values), 3, 3), dtype=dtype)
+
+        matrices[:, 0, 0] = values[:, 0]
+        matrices[:, 1, 0] = values[:, 1]
+        matrices[:, 0, 1] = values[:, 2]
+        matrices[:, 1, 1] = values[:, 3]
+        matrices[:, 0, 2] = values[:, 4]
+        matrices[:, 1, 2] = values[:, 5]
+        matrices[:, 2, 2] = 1
+
+        return cls(matrices, dtype)
+
+    def affine(self, index):
+        """Transform at `index` as an `Affine2D`.
+
+        Args:
+            index(int): transform index
+
+        Returns:
+            Affine2D
+        """
+
+        m = self._matrices[index]
+
+        return Affine2D(*(float(v) for v in (m[0, 0], m[1, 0], m[0, 1], m[1, 1], m[0, -1], m[1, -1])))
+
+    def multiply(self, other):
+        """Pairwise products `self[i] * other[i]`.
+        A batch of one is broadcast against the other.
+
+        Args:
+            other(MatrixBatch): transforms to apply first
+
+        Returns:
+            MatrixBatch: new MatrixBatch
+        """
+
+        return self._wrap(np.matmul(self._matrices, other._matrices))
+
+    def inverse(self):
+        """Inverse of every transform.
+
+        Raises:
+            ArithmeticError: A transform is singular.
+
+        Returns:
+            MatrixBatch: new MatrixBatch
+        """
+
+        m = self._matrices
+
+        if m.shape[1] == 4:
+            try:
+                return self._wrap(np.linalg.inv(m))
+            except np.linalg.LinAlgError:
+                raise ArithmeticError('Batch contains a singular transform.')
+
+        a, c, tx = m[:, 0, 0], m[:, 0, 1], m[:, 0, 2]
+        b, d, ty = m[:, 1, 0], m[:, 1, 1], m[:, 1, 2]
+
+        det = a * d - b * c
+
+        if not np.all(det):
+            raise ArithmeticError('Batch contains a singular transform.')
+
+        inv_a =  d / det
+        inv_b = -b / det
+        inv_c = -c / det
+        inv_d =  a / det
+
+        out = np.zeros_like(m)
+        out[:, 0, 0] = inv_a
+        out[:, 0, 1] = inv_c
+        out[:, 0, 2] = -(inv_a * tx + inv_c * ty)
+        out[:, 1, 0] = inv_b
+        out[:, 1, 1] = inv_d
+        out[:, 1, 2] = -(inv_b * tx + inv_d * ty)
+        out[:, 2, 2] = 1
+
+        return self._wrap(out)
+
+    def transform_points(self, points, out=None):
+        """Map 2D points through every transform.
+
+        Note:
+            Pass a preallocated `out` buffer to pre-transform
+            vertices for rendering without allocating.
+
+        Args:
+            points(array): (M, 2) points shared by all transforms,
+                or (N, M, 2) points per transform
+            out(array): (N, M, 2) buffer to fill (optional)
+
+        Returns:
+            array: (N, M, 2) transformed points
+        """
+
+        points = np.asarray(points, dtype=self._matrices.dtype)
+        linear = self._matrices[:, :2, :2]
+        offset = self._matrices[:, None, :2, -1]
+
+        if points.ndim == 2:
+            result = np.einsum('nij,mj->nmi', linear, points, out=out)
+        else:
+            result = np.einsum('nij,nmj->nmi', linear, points, out=out)
+
+        result += offset
+
+        return result
+
+    def as_gl(self):
+        """Column-major 4x4 matrices for `glLoadMatrixf`.
+
+        Returns:
+            array: (N, 16) float32
+        """
+
+        m = self._matrices
+
+        if m.shape[1] == 4:
+            gl = m
+        else:
+            gl = np.zeros((len(m), 4, 4), dtype=m.dtype)
+            gl[:, :2, :2] = m[:, :2, :2]
+            gl[:, :2, 3]  = m[:, :2, 2]
+            gl[:, 2, 2]   = 1
+            gl[:, 3, 3]   = 1
+
+        return np.ascontiguousarray(gl.transpose(0, 2, 1), dtype=np.float32).reshape(-1, 16)
+
+    @classmethod
+    def _wrap(cls, matrices):
+        batch = cls.__new__(cls)
+        batch._matrices = matrices
+
+        return batch
+
+    @property
+    def matrices(self):
+        """(N, 3, 3) or (N, 4, 4) array. Not a copy."""
+        return self._matrices
+
+    def __matmul__(self, other):
+        return self.multiply(other)
+
+    def __getitem__(self, index):
+        return self._wrap(self._matrices[index].reshape(-1, *self._matrices.shape[1:]))
+
+    def __len__(self):
+        return len(self._matrices)
+
+    def __repr__(self):
+        return 'MatrixBatch(count=%s, size=%s)' % (len(self), self._matrices.shape[1])
@@ -1,20 +1,183 @@
 from pybox.math.matrix import Matrix
 
 class Transform:
+    """Translation, rotation, scale and shear components
+    composed lazily into a 4x4 `Matrix`.
+
+    Note:
+        The matrix and its inverse are only rebuilt when they are
+        read after a component changed. `version` goes up on every
+        change, so callers can cache work derived from the matrix.
+
+        `translate`, `rotate`, `scale`, `shear` and `apply` are
+        applied after the components, as with `Matrix`.
+
+    Args:
+        x(float): x translation (optional)
+        y(float): y translation (optional)
+        z(float): z translation (optional)
+        angle(float): rotation in degrees (optional)
+        sx(float): x scale (optional)
+        sy(float): y scale (optional)
+        sz(float): z scale (optional)
+        kx(float): x shear (optional)
+        ky(float): y shear (optional)
+
+    Examples:
+        >>> t1 = Transform(x=10, y=20)
+        >>> v1 = t1.version
+        >>> t1.x = 10
+        >>> t1.version == v1
+        True
+        >>> t1.x = 15
+        >>> print(t1.matrix.getColumn(3))
+        [15, 20, 1, 1]
+    """
+
     def __init__(self, x=0, y=0, z=1, angle=0, sx=1, sy=1, sz=1, kx=0, ky=0):
-        self._matrix = Matrix() \
-            .translate(x, y, z) \
-            .rotate(angle) \
-            .scale(sx, sy, sz) \
-            .shear(kx, ky)
+        self._x     = x
+        self._y     = y
+        self._z     = z
+        self._angle = angle
+        self._sx    = sx
+        self._sy    = sy
+        self._sz    = sz
+        self._kx    = kx
+        self._ky    = ky
+        self._local = None
+
+        self._matrix  = None
+        self._inverse = None
+        self._version = 0
+
+    def _set(self, name, value):
+        if getattr(self, name) != value:
+            setattr(self, name, value)
+            self.invalidate()
+
+    def invalidate(self):
+        """Mark the cached matrices as stale."""
+
+        self._matrix   = None
+        self._inverse  = None
+        self._version += 1
+
+    @property
+    def x(self):
+        return self._x
+
+    @x.setter
+    def x(self, value):
+        self._set('_x', value)
+
+    @property
+    def y(self):
+        return self._y
+
+    @y.setter
+    def y(self, value):
+        self._set('_y', value)
+
+    @property
+    def z(self):
+        return self._z
+
+    @z.setter
+    def z(self, value):
+        self._set('_z', value)
+
+    @property
+    def angle(self):
+        return self._angle
+
+    @angle.setter
+    def angle(self, value):
+        self._set('_angle', value)
+
+    @property
+    def sx(self):
+        return self._sx
+
+    @sx.setter
+    def sx(self, value):
+        self._set('_sx', value)
+
+    @property
+    def sy(self):
+        return self._sy
+
+    @sy.setter
+    def sy(self, value):
+        self._set('_sy', value)
+
+    @property
+    def sz(self):
+        return self._sz
+
+    @sz.setter
+    def sz(self, value):
+        self._set('_sz', value)
+
+    @property
+    def kx(self):
+        return self._kx
+
+    @kx.setter
+    def kx(self, value):
+        self._set('_kx', value)
+
+    @property
+    def ky(self):
+        return self._ky
+
+    @ky.setter
+    def ky(self, value):
+        self._set('_ky', value)
+
+    @property
+    def version(self):
+        return self._version
 
     @property
     def matrix(self):
+        """Composed matrix. Read only, not a copy.
+
+        Note:
+            Assigning a matrix replaces the whole transform: x, y, z,
+            angle, shear and scale are reset to their defaults and the
+            assigned matrix (copied) becomes the local matrix.
+        """
+
+        if self._matrix is None:
+            matrix = Matrix() \
+                .translate(self._x, self._y, self._z) \
+                .rotate(self._angle) \
+                .scale(self._sx, self._sy, self._sz) \
+                .shear(self._kx, self._ky)
+
+            if self._local is not None:
+                matrix = matrix * self._local
+
+            self._matrix = matrix
+
         return self._matrix
 
     @matrix.setter
     def matrix(self, value):
-        self._matrix = self._matrix
+        # Components reset, so the composed matrix equals `value`
+        self._x = self._y = self._z = self._angle = self._kx = self._ky = 0
+        self._sx = self._sy = self._sz = 1
+        self._local = value.clone()
+
+        self.invalidate()
+
+    def _local_matrix(self):
+        if self._local is None:
+            self._local = Matrix()
+
+        self.invalidate()
+
+        return self._local
 
     def apply(self, other):
         """Multiplies this transform's matrix with anothers.
@@ -23,10 +186,10 @@ class Transform:
             other(Transform): Transform to apply to this one.
 
         Return:
-            Transform: new Transform
+            Transform: this Transform
         """
 
-        self._matrix = self._matrix * other._matrix
+        self._local = self._local_matrix() * other.matrix
 
         return self
 
@@ -37,31 +200,66 @@ class Transform:
             Transform: copy of this Transform
         """
 
-        transform = Transform()
-        transform._matrix = self._matrix.clone()
+        transform = Transform(
+            self._x, self._y, self._z, self._angle,
+            self._sx, self._sy, self._sz, self._kx, self._ky
+        )
+
+        if self._local is not None:
+            transform._local = self._local.clone()
 
         return transform
 
     def translate(self, tx, ty, tz=0):
-        self._matrix.translate(tx, ty, tz)
+        self._local_matrix().translate(tx, ty, tz)
 
     def scale(self, sx, sy, sz=1):
-        self._matrix.scale(sx, sy, sz)
+        self._local_matrix().scale(sx, sy, sz)
 
     def rotate(self, angle, x=0, y=0, z=1):
-        self._matrix.rotate(angle, x, y, z)
+        self._local_matrix().rotate(angle, x, y, z)
 
     def shear(self, kx, ky):
-        self._matrix.shear(kx, ky)
+        self._local_matrix().shear(kx, ky)
 
     def reflect(self):
-        self._matrix.reflect()
+        self._local_matrix().reflect()
 
     def inverse(self):
-        self._matrix.inverse()
+        """Inverse of the composed matrix. Cached until the
+        transform changes; callers get a copy they may modify.
+
+        Raises:
+            ArithmeticError: Transform has a zero scale or a singular shear.
+
+        Return:
+            Matrix
+        """
+
+        if self._inverse is None:
+            det = 1 - self._kx * self._ky
+
+            if det == 0 or 0 in (self._sx, self._sy, self._sz):
+                raise ArithmeticError('Transform is singular and cannot be inverted.')
+
+            inverse = Matrix()
+            inverse[0, 0], inverse[0, 1] = 1 / det, -self._kx / det
+            inverse[1, 0], inverse[1, 1] = -self._ky / det, 1 / det
+
+            inverse \
+                .scale(1 / self._sx, 1 / self._sy, 1 / self._sz) \
+                .rotate(-self._angle) \
+                .translate(-self._x, -self._y, -self._z)
+
+            if self._local is not None:
+                inverse = self._local.inverse() * inverse
+
+            self._inverse = inverse
+
+        return self._inverse.clone()
 
     def __repr__(self):
-        raise NotImplementedError
+        return 'Transform(x=%s, y=%s, angle=%s, sx=%s, sy=%s)' % (self._x, self._y, self._angle, self._sx, self._sy)
 
     def __str__(self):
-        return str(self._matrix)
\ No newline at end of file
+        return str(self.matrix)
@@ -0,0 +1,327 @@
+"""Polygon triangulation and convex decomposition.
+Results are cached per vertex list, so shapes that are rebuilt
+with the same outline pay for the triangulation once.
+
+Note:
+    Polygons are lists of (x, y) tuples in either winding, and
+    must be simple (no self-intersections). Holes must lie inside
+    the outer polygon and not touch each other. Collinear and
+    repeated vertices are dropped; other bad input is not fully
+    checked, but raises ArithmeticError where clipping gets stuck.
+"""
+
+from pybox.containers.lrucache import LRUCache
+
+_cache = LRUCache(capacity=1024)
+
+
+def triangulate(vertices, holes=None):
+    """Triangulate a polygon by ear clipping.
+
+    Args:
+        vertices(list): (x, y) outer vertices
+        holes(list): lists of (x, y) hole vertices (optional)
+
+    Raises:
+        ArithmeticError: A hole is outside the polygon, or the
+            polygon cannot be clipped (self-intersecting).
+
+    Examples:
+        >>> print(triangulate([(0, 0), (2, 0), (2, 2), (0, 2)]))
+        (3, 0, 1, 1, 2, 3)
+
+    Returns:
+        tuple: flat triangle indices into `vertices` followed by
+            the vertices of each hole, counter-clockwise
+    """
+
+    key = ('triangulate', _key(vertices), tuple(_key(hole) for hole in holes or ()))
+
+    result = _cache.get(key)
+
+    if result is None:
+        result = _triangulate(key[1], key[2])
+        _cache.put(key, result)
+
+    return result
+
+
+def decompose(vertices, holes=None):
+    """Split a polygon into convex polygons (Hertel-Mehlhorn).
+    Produces at most four times the optimal number of parts.
+
+    Args:
+        vertices(list): (x, y) outer vertices
+        holes(list): lists of (x, y) hole vertices (optional)
+
+    Examples:
+        >>> parts = decompose([(0, 0), (2, 0), (2, 1), (1, 1), (1, 2), (0, 2)])
+        >>> print(len(parts))
+        2
+
+    Returns:
+        list: counter-clockwise convex polygons as lists of (x, y)
+    """
+
+    key = ('decompose', _key(vertices), tuple(_key(hole) for hole in holes or ()))
+
+    result = _cache.get(key)
+
+    if result is None:
+        points  = list(key[1]) + [point for hole in key[2] for point in hole]
+        indices = _triangulate(key[1], key[2])
+        result  = tuple(
+            tuple(points[i] for i in part)
+            for part in _merge_convex(points, indices)
+        )
+        _cache.put(key, result)
+
+    return [list(part) for part in result]
+
+
+def fan(count):
+    """Triangle fan indices around vertex 0, for convex outlines.
+
+    Args:
+        count(int): number of vertices
+
+    Examples:
+        >>> print(fan(5))
+        (0, 1, 2, 0, 2, 3, 0, 3, 4)
+
+    Returns:
+        tuple: flat triangle indices
+    """
+
+    key    = ('fan', count)
+    result = _cache.get(key)
+
+    if result is None:
+        result = tuple(i for n in range(1, count - 1) for i in (0, n, n + 1))
+        _cache.put(key, result)
+
+    return result
+
+
+def clear_cache():
+    """Forget all cached results."""
+    _cache.clear()
+
+
+def _key(vertices):
+    return tuple((float(x), float(y)) for x, y in vertices)
+
+
+def _area(points, ring):
+    area = 0
+
+    for i in range(len(ring)):
+        x1, y1 = points[ring[i - 1]]
+        x2, y2 = points[ring[i]]
+        area  += x1 * y2 - x2 * y1
+
+    return area / 2
+
+
+def _cross(o, a, b):
+    return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+
+def _in_triangle(p, a, b, c):
+    return _cross(a, b, p) >= 0 and _cross(b, c, p) >= 0 and _cross(c, a, p) >= 0
+
+
+def _triangulate(outer, holes):
+    points = list(outer) + [point for hole in holes for point in hole]
+    ring   = list(range(len(outer)))
+
+    if _area(points, ring) < 0:
+        ring.reverse()
+
+    start = len(outer)
+    rings = []
+
+    for hole in holes:
+        hole_ring = list(range(start, start + len(hole)))
+        start    += len(hole)
+
+        if _area(points, hole_ring) > 0:
+            hole_ring.reverse()
+
+        rings.append(hole_ring)
+
+    # Bridge holes from right to left into the outer ring
+    rings.sort(key=lambda r: max(points[i][0] for i in r), reverse=True)
+
+    for n, hole_ring in enumerate(rings):
+        ring = _bridge(points, ring, hole_ring, rings[n + 1:])
+
+    return tuple(_clip_ears(points, ring))
+
+
+def _bridge(points, ring, hole, holes):
+    m       = max(range(len(hole)), key=lambda k: (points[hole[k]][0], -points[hole[k]][1]))
+    m_point = points[hole[m]]
+    m_prev  = points[hole[m - 1]]
+    m_next  = points[hole[(m + 1) % len(hole)]]
+
+    # The bridge may not cross the ring, its earlier bridges or any hole
+    edges = [
+        (points[r[k - 1]], points[r[k]])
+        for r in [ring, hole] + holes
+        for k in range(len(r))
+    ]
+
+    order = sorted(
+        range(len(ring)),
+        key=lambda k: (points[ring[k]][0] - m_point[0]) ** 2 + (points[ring[k]][1] - m_point[1]) ** 2
+    )
+
+    for k in order:
+        point = points[ring[k]]
+
+        if point == m_point:
+            continue
+
+        # Bridged vertices appear twice in the ring; only the copy
+        # whose wedge faces the hole can take the bridge
+        if not _locally_inside(points[ring[k - 1]], point, points[ring[(k + 1) % len(ring)]], m_point):
+            continue
+
+        if not _locally_inside(m_prev, m_point, m_next, point):
+            continue
+
+        if any(_crosses(m_point, point, a, b) for a, b in edges):
+            continue
+
+        rotated = hole[m:] + hole[:m]
+
+        return ring[:k + 1] + rotated + [hole[m], ring[k]] + ring[k + 1:]
+
+    raise ArithmeticError('Hole is not inside the polygon.')
+
+
+def _locally_inside(prev, point, next, q):
+    # Is q inside the interior wedge of the ring at point (interior on the left)
+    if _cross(prev, point, next) >= 0:
+        return _cross(prev, point, q) > 0 and _cross(point, next, q) > 0
+
+    return _cross(prev, point, q) > 0 or _cross(point, next, q) > 0
+
+
+def _on_segment(a, b, p):
+    return min(a[0], b[0]) <= p[0] <= max(a[0], b[0]) and min(a[1], b[1]) <= p[1] <= max(a[1], b[1])
+
+
+def _crosses(p, q, a, b):
+    # Segments pq and ab meet anywhere but at a shared endpoint
+    if a == p or a == q or b == p or b == q:
+        return False
+
+    d1 = _cross(p, q, a)
+    d2 = _cross(p, q, b)
+    d3 = _cross(a, b, p)
+    d4 = _cross(a, b, q)
+
+    if ((d1 > 0 and d2 < 0) or (d1 < 0 and d2 > 0)) and ((d3 > 0 and d4 < 0) or (d3 < 0 and d4 > 0)):
+        return True
+
+    return (d1 == 0 and _on_segment(p, q, a)) or (d2 == 0 and _on_segment(p, q, b)) or \
+           (d3 == 0 and _on_segment(a, b, p)) or (d4 == 0 and _on_segment(a, b, q))
+
+
+def _clip_ears(points, ring):
+    ring      = list(ring)
+    triangles = []
+
+    xs = [points[i][0] for i in ring]
+    ys = [points[i][1] for i in ring]
+
+    # Twice the area a vertex may span and still count as collinear
+    tolerance = 1e-9 * max(max(xs) - min(xs), max(ys) - min(ys)) ** 2
+
+    while len(ring) > 3:
+        count   = len(ring)
+        clipped = False
+
+        for k in range(count):
+            i0, i1, i2 = ring[k - 1], ring[k], ring[(k + 1) % count]
+            a, b, c    = points[i0], points[i1], points[i2]
+
+            if _cross(a, b, c) <= 0:
+                continue
+
+            if any(
+                _in_triangle(points[j], a, b, c)
+                for j in ring
+                if points[j] != a and points[j] != b and points[j] != c
+            ):
+                continue
+
+            triangles += (i0, i1, i2)
+            del ring[k]
+            clipped = True
+            break
+
+        if not clipped:
+            # Without an ear only collinear or repeated vertices may be
+            # left; they span no area, so dropping them loses nothing
+            crosses = [abs(_cross(points[ring[k - 1]], points[ring[k]], points[ring[(k + 1) % count]])) for k in range(count)]
+            k       = crosses.index(min(crosses))
+
+            if crosses[k] > tolerance:
+                raise ArithmeticError('Polygon is self-intersecting or its holes overlap.')
+
+            del ring[k]
+
+    if len(ring) == 3:
+        area = _cross(*(points[i] for i in ring))
+
+        if area < -tolerance:
+            raise ArithmeticError('Polygon is self-intersecting or its holes overlap.')
+
+        if area > 0:
+            triangles += ring
+
+    return triangles
+
+
+def _is_convex(points, poly):
+    count = len(poly)
+
+    return all(
+        _cross(points[poly[k - 1]], points[poly[k]], points[poly[(k + 1) % count]]) >= -1e-12
+        for k in range(count)
+    )
+
+
+def _merge_convex(points, indices):
+    polys = [list(indices[i:i + 3]) for i in range(0, len(indices), 3)]
+
+    while True:
+        edges = {}
+
+        for pi, poly in enumerate(polys):
+            for k in range(len(poly)):
+                edges[(poly[k - 1], poly[k])] = pi
+
+        for (a, b), pi in edges.items():
+            pj = edges.get((b, a))
+
+            if pj is None or pj == pi:
+                continue
+
+            # Walk pi from b round to a, then pj from a round to b
+            p = polys[pi]
+            q = polys[pj]
+            p = p[p.index(b):] + p[:p.index(b)]
+            q = q[q.index(a):] + q[:q.index(a)]
+
+            merged = p + q[1:-1]
+
+            if _is_convex(points, merged):
+                polys[pi] = merged
+                del polys[pj]
+                break
+        else:
+            return polys
@@ -0,0 +1,407 @@
+"""Batched tweening.
+Every running tween is one row of a few NumPy arrays (start,
+end, duration, elapsed and easing id), so a frame advances
+thousands of animations with a handful of vectorized steps.
+The results are then written back in a single pass over the
+targets, which are plain Python objects.
+"""
+
+import numpy as np
+
+_SCALAR = 0
+_VECTOR = 1
+_TUPLE  = 2
+_COLOR  = 3
+
+
+def _linear(t):
+    return t
+
+
+def _in_quad(t):
+    return t * t
+
+
+def _out_quad(t):
+    return t * (2 - t)
+
+
+def _in_out_quad(t):
+    return np.where(t < 0.5, 2 * t * t, 1 - 2 * (1 - t) ** 2)
+
+
+def _in_cubic(t):
+    return t ** 3
+
+
+def _out_cubic(t):
+    return 1 - (1 - t) ** 3
+
+
+def _in_out_cubic(t):
+    return np.where(t < 0.5, 4 * t ** 3, 1 - 4 * (1 - t) ** 3)
+
+
+def _in_sine(t):
+    return 1 - np.cos(t * np.pi / 2)
+
+
+def _out_sine(t):
+    return np.sin(t * np.pi / 2)
+
+
+def _in_out_sine(t):
+    return (1 - np.cos(t * np.pi)) / 2
+
+
+EASINGS = {
+    'linear':       _linear,
+    'in_quad':      _in_quad,
+    'out_quad':     _out_quad,
+    'in_out_quad':  _in_out_quad,
+    'in_cubic':     _in_cubic,
+    'out_cubic':    _out_cubic,
+    'in_out_cubic': _in_out_cubic,
+    'in_sine':      _in_sine,
+    'out_sine':     _out_sine,
+    'in_out_sine':  _in_out_sine
+}
+
+_EASING_IDS = {name: i for i, name in enumerate(EASINGS)}
+_EASING_FNS = list(EASINGS.values())
+
+
+_TUPLE_KINDS = {
+    'color': _COLOR,
+    'tuple': _TUPLE
+}
+
+
+def _is_color(value):
+    return len(value) in (3, 4) and all(type(v) is int and 0 <= v <= 255 for v in value)
+
+
+class Tween:
+    """Handle for an animation running on a `TweenEngine`.
+
+    Args:
+        engine(TweenEngine): owning engine
+        target(object): animated object
+        attribute(str): animated attribute
+        kind(int): how values are written back
+        dims(int): number of components
+        vector(Vec2D): animated Vec2D, for Vec2D attributes
+        callback(callable): called with `target` when done
+    """
+
+    __slots__ = ('_engine', '_index', '_kind', '_dims', '_vector', 'target', 'attribute', 'callback')
+
+    def __init__(self, engine, target, attribute, kind, dims, vector, callback):
+        self._engine = engine
+        self._index  = None
+        self._kind   = kind
+        self._dims   = dims
+        self._vector = vector
+
+        self.target    = target
+        self.attribute = attribute
+        self.callback  = callback
+
+    def cancel(self):
+        """Alias for `TweenEngine.cancel(tween)`."""
+        return self._engine.cancel(self)
+
+    @property
+    def active(self):
+        """True until the tween finishes or is cancelled."""
+        return self._index is not None
+
+    @property
+    def progress(self):
+        """Elapsed fraction of the duration, 1.0 once done."""
+
+        if self._index is None:
+            return 1.0
+
+        engine = self._engine
+
+        return min(1.0, float(engine._elapsed[self._index] / engine._duration[self._index]))
+
+    def __repr__(self):
+        return 'Tween(target=%s, attribute=%s)' % (self.target, self.attribute)
+
+
+class TweenEngine:
+    """Runs many tweens as one vectorized batch.
+    Tweens animate a `Vec2D` attribute in place (such as
+    `Entity2D.position`), a number (such as `rotation`) or a
+    tuple of up to four numbers (such as `Shape2D.color`).
+
+    Note:
+        Easing and interpolation are vectorized; the write-back
+        is one Python loop over the running tweens. Vec2Ds are
+        written directly, everything else goes through `setattr`
+        so property setters (such as `Shape2D.color`) still run.
+        The Vec2D read when the tween starts is the one updated,
+        so targets must not replace it while tweening.
+
+        Colors are rounded back to ints; other tuples become
+        floats. Pass `kind` to say which one a tuple is; without
+        it, an attribute named `color` is a color, and otherwise
+        three or four ints in 0-255 are taken to be one. Bools
+        cannot be tweened.
+
+        Starting a tween on an attribute that is already being
+        tweened cancels the old one. Callbacks run after all
+        values of the step are written, so they may start new
+        tweens.
+
+    Args:
+        capacity(int): initial number of rows (optional)
+
+    Examples:
+        >>> class Box:
+        ...     angle = 0.0
+        >>> b1 = Box()
+        >>> e1 = TweenEngine()
+        >>> t1 = e1.to(b1, 'angle', 90, 2.0)
+        >>> e1.advance(0.5)
+        0
+        >>> print(b1.angle)
+        22.5
+        >>> e1.advance(2.0)
+        1
+        >>> print(b1.angle)
+        90.0
+    """
+
+    def __init__(self, capacity=64):
+        self._tweens  = []
+        self._running = {}
+        self._count   = 0
+        self._colors  = 0
+
+        self._start    = np.zeros((capacity, 4))
+        self._delta    = np.zeros((capacity, 4))
+        self._end      = np.zeros((capacity, 4))
+        self._duration = np.ones(capacity)
+        self._elapsed  = np.zeros(capacity)
+        self._easing   = np.zeros(capacity, dtype=np.intp)
+
+    def clear(self):
+        """Cancel all running tweens, leaving values where they are."""
+
+        for tween in self._tweens:
+            tween._index = None
+
+        self._tweens.clear()
+        self._running.clear()
+        self._count  = 0
+        self._colors = 0
+
+    def to(self, target, attribute, value, duration, easing='linear', callback=None, kind=None):
+        """Animate `target.attribute` from its current value to
+        `value` over `duration` seconds.
+
+        Raises:
+            AttributeError: Duration is not positive, the easing or
+                kind is unknown or the value cannot be tweened.
+
+        Args:
+            target(object): object to animate
+            attribute(str): attribute name
+            value(mixed): final value, same shape as the current one
+            duration(float): seconds
+            easing(str): name from `EASINGS` (optional)
+            callback(callable): called with `target` when done (optional)
+            kind(str): 'color' or 'tuple', for tuple values (optional)
+
+        Returns:
+            Tween: handle for cancelling
+        """
+
+        if duration <= 0:
+            raise AttributeError('Duration must be positive, you entered: {}'.format(duration))
+
+        if easing not in _EASING_IDS:
+            raise AttributeError('Unknown easing: {}'.format(easing))
+
+        if kind is not None and kind not in _TUPLE_KINDS:
+            raise AttributeError('Unknown kind: {}'.format(kind))
+
+        current = getattr(target, attribute)
+        vector  = None
+
+        if kind is not None and not isinstance(current, (tuple, list)):
+            raise AttributeError('Cannot tween {} as a {}'.format(current, kind))
+
+        if hasattr(current, 'set') and hasattr(current, 'x'):
+            kind   = _VECTOR
+            vector = current
+            start  = (current.x, current.y)
+            end    = (value.x, value.y) if hasattr(value, 'x') else tuple(value)
+        elif isinstance(current, (tuple, list)):
+            if kind is not None:
+                kind = _TUPLE_KINDS[kind]
+            elif attribute == 'color' or _is_color(current):
+                kind = _COLOR
+            else:
+                kind = _TUPLE
+
+            start = tuple(current)
+            end   = tuple(value)
+        else:
+            kind  = _SCALAR
+            start = (current,)
+            end   = (value,)
+
+        if len(start) != len(end) or len(start) > 4 or \
+                any(isinstance(v, bool) for v in start + end):
+            raise AttributeError('Cannot tween {} to {}'.format(current, value))
+
+        previous = self._running.get((id(target), attribute))
+
+        if previous is not None:
+            self.cancel(previous)
+
+        if self._count == len(self._elapsed):
+            self._grow()
+
+        index = self._count
+        dims  = len(start)
+
+        self._start[index, :dims] = start
+        self._end[index, :dims]   = end
+        self._delta[index]        = self._end[index] - self._start[index]
+        self._duration[index]     = duration
+        self._elapsed[index]      = 0.0
+        self._easing[index]       = _EASING_IDS[easing]
+
+        tween = Tween(self, target, attribute, kind, dims, vector, callback)
+        tween._index = index
+
+        self._tweens.append(tween)
+        self._running[(id(target), attribute)] = tween
+        self._count  += 1
+        self._colors += kind == _COLOR
+
+        return tween
+
+    def cancel(self, tween):
+        """Stop a running tween, leaving the value where it is.
+
+        Args:
+            tween(Tween): handle from `to`
+
+        Returns:
+            bool: False if the tween already finished or was cancelled
+        """
+
+        if tween._index is None:
+            return False
+
+        self._remove(tween._index)
+
+        return True
+
+    def advance(self, dt):
+        """Move every tween forward by `dt` seconds and write
+        the new values to their targets.
+
+        Args:
+            dt(float): elapsed seconds
+
+        Returns:
+            int: number of tweens finished
+        """
+
+        n = self._count
+
+        if n == 0:
+            return 0
+
+        elapsed = self._elapsed[:n]
+        elapsed += dt
+
+        t      = np.minimum(elapsed / self._duration[:n], 1.0)
+        easing = self._easing[:n]
+        eased  = np.empty(n)
+
+        for eid in np.unique(easing):
+            mask        = easing == eid
+            eased[mask] = _EASING_FNS[eid](t[mask])
+
+        done   = t >= 1.0
+        values = self._start[:n] + self._delta[:n] * eased[:, None]
+
+        # Land exactly on the end value, whatever the easing rounding
+        values[done] = self._end[:n][done]
+
+        if self._colors:
+            # Round every row at once; only color rows read it
+            rounded = np.rint(values).astype(np.int64).tolist()
+
+        for i, row in enumerate(values.tolist()):
+            tween = self._tweens[i]
+            kind  = tween._kind
+
+            if kind == _VECTOR:
+                vector   = tween._vector
+                vector.x = row[0]
+                vector.y = row[1]
+            elif kind == _SCALAR:
+                setattr(tween.target, tween.attribute, row[0])
+            elif kind == _COLOR:
+                setattr(tween.target, tween.attribute, tuple(rounded[i][:tween._dims]))
+            else:
+                setattr(tween.target, tween.attribute, tuple(row[:tween._dims]))
+
+        if not done.any():
+            return 0
+
+        finished = [self._tweens[i] for i in np.flatnonzero(done)]
+
+        for tween in finished:
+            self._remove(tween._index)
+
+        for tween in finished:
+            if tween.callback is not None:
+                tween.callback(tween.target)
+
+        return len(finished)
+
+    def _grow(self):
+        capacity = max(1, len(self._elapsed)) * 2
+
+        for name in ('_start', '_delta', '_end', '_duration', '_elapsed', '_easing'):
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    def _remove(self, index):
+        # Swap the last row into the hole to keep rows packed
+        last  = self._count - 1
+        tween = self._tweens[index]
+
+        if index != last:
+            moved = self._tweens[last]
+
+            for array in (self._start, self._delta, self._end, self._duration, self._elapsed, self._easing):
+                array[index] = array[last]
+
+            self._tweens[index] = moved
+            moved._index = index
+
+        self._tweens.pop()
+        self._count  -= 1
+        self._colors -= tween._kind == _COLOR
+
+        del self._running[(id(tween.target), tween.attribute)]
+        tween._index = None
+
+    def __len__(self):
+        return self._count
+
+    def __contains__(self, tween):
+        return tween._index is not None and tween._engine is self
@@ -1,4 +1,4 @@
-from pybox.math import vec2d
+from pybox.math import backend, vec2d
 
 
 def clamp(value, low, high):
@@ -19,10 +19,7 @@ def clamp(value, low, high):
         mixed
     """
 
-    true_min = min(low, high)
-    true_max = max(low, high)
-
-    return max(true_min, min(value, true_max))
+    return backend.clamp(value, low, high)
 
 def dot(a, b):
     """Calculate the dot product of two lists.
@@ -48,4 +45,4 @@ def dot(a, b):
     if len(a) != len(b):
         raise AttributeError('Length of first iterables does not match length of second.')
 
-    return sum(i * j for i, j in zip(a, b))
\ No newline at end of file
+    return backend.dot(a, b)
\ No newline at end of file
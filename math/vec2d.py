@@ -1,6 +1,8 @@
-import copy
 import math
+import operator
+
 from . import util
+from pybox.containers.pool import Pool
 
 class Vec2D:
     """Vec2D data structure.
@@ -10,10 +12,94 @@ class Vec2D:
         y(mixed): y-coordinate
     """
 
+    __slots__ = ('x', 'y')
+
     def __init__(self, x=0, y=0):
         self.x = x
         self.y = y
 
+    @classmethod
+    def acquire(cls, x=0, y=0):
+        """Get a Vec2D from the shared pool.
+        Pair with `release` in hot loops to avoid allocating.
+        Subclasses get a new, unpooled instance.
+
+        Examples:
+            >>> v1 = Vec2D.acquire(1, 2)
+            >>> print(v1)
+            (1, 2)
+            >>> v1.release()
+
+        Args:
+            x(mixed): x-coordinate
+            y(mixed): y-coordinate
+
+        Returns:
+            Vec2D
+        """
+
+        if cls is not Vec2D:
+            # The shared pool only holds base instances
+            return cls(x, y)
+
+        return pool.acquire(x, y)
+
+    def release(self):
+        """Return this Vec2D to the shared pool.
+        It must not be used afterwards.
+
+        Raises:
+            AttributeError: Not acquired, or already released.
+        """
+
+        if type(self) is Vec2D:
+            pool.release(self)
+
+    def set(self, x, y):
+        """Set both coordinates in place.
+
+        Args:
+            x(mixed): x-coordinate
+            y(mixed): y-coordinate
+
+        Examples:
+            >>> v1 = Vec2D(1, 2)
+            >>> v1 = v1.set(3, 4)
+            >>> print(v1)
+            (3, 4)
+
+        Returns:
+            Vec2D
+        """
+
+        self.x = x
+        self.y = y
+
+        return self
+
+    def add_scaled(self, other, factor):
+        """Add another vector scaled by factor, in place.
+        Same as `self += other * factor` without the temporary.
+
+        Args:
+            other(Vec2D): other vector
+            factor(float): scale factor
+
+        Examples:
+            >>> v1 = Vec2D(1, 2)
+            >>> v1 = v1.add_scaled(Vec2D(3, 4), 0.5)
+            >>> print(v1)
+            (2.5, 4.0)
+
+        Returns:
+            Vec2D
+        """
+
+        self.x += other.x * factor
+        self.y += other.y * factor
+
+        return self
+
     def unpack(self):
         """Alias for `tuple()`."""
         return self.tuple()
@@ -35,6 +121,21 @@ class Vec2D:
 
         return self.x, self.y
 
+    def freeze(self):
+        """Immutable, hashable copy.
+
+        Examples:
+            >>> v1 = Vec2D(1, 2)
+            >>> visited = {v1.freeze()}
+            >>> print(Vec2D(1, 2).freeze() in visited)
+            True
+
+        Returns:
+            FrozenVec2D
+        """
+
+        return FrozenVec2D(self.x, self.y)
+
     def copy(self):
         """Copy object.
 
@@ -50,7 +151,7 @@ class Vec2D:
             Vec2D
         """
 
-        return copy.deepcopy(self)
+        return Vec2D(self.x, self.y)
 
     def scale(self, factor):
         """Scale Vec2D by factor.
@@ -414,7 +515,7 @@ class Vec2D:
         if type(other) == Vec2D:
             return Vec2D(self.x * other.x, self.y * other.y)
 
-        return self.copy().scale(other)
+        return Vec2D(self.x * other, self.y * other)
 
     def __truediv__(self, other):
         """Divide two vectors and return the resulting new Vec2D.
@@ -435,11 +536,81 @@ class Vec2D:
         if other == 0:
             raise ZeroDivisionError("Right-hand side Vec2D contains a 0. Cannot divide by 0.")
 
-        newVec2D = self.copy()
-        newVec2D.x /= other
-        newVec2D.y /= other
+        return Vec2D(self.x / other, self.y / other)
+
+    def __iadd__(self, other):
+        """Add another Vec2D to this one in place.
+
+        Args:
+            other(Vec2D): other vector
+
+        Returns:
+            Vec2D: this Vec2D
+        """
+
+        self.x += other.x
+        self.y += other.y
 
-        return newVec2D
+        return self
+
+    def __isub__(self, other):
+        """Subtract another Vec2D from this one in place.
+
+        Args:
+            other(Vec2D): other vector
+
+        Returns:
+            Vec2D: this Vec2D
+        """
+
+        self.x -= other.x
+        self.y -= other.y
+
+        return self
+
+    def __imul__(self, other):
+        """Multiply this Vec2D in place.
+
+        Args:
+            other(mixed): other vector or scalar
+
+        Returns:
+            Vec2D: this Vec2D
+        """
+
+        if type(other) == Vec2D:
+            self.x *= other.x
+            self.y *= other.y
+        else:
+            self.x *= other
+            self.y *= other
+
+        return self
+
+    def __itruediv__(self, other):
+        """Divide this Vec2D in place.
+
+        Args:
+            other(mixed): other vector or scalar
+
+        Returns:
+            Vec2D: this Vec2D
+        """
+
+        if type(other) == Vec2D:
+            if other.x == 0 or other.y == 0:
+                raise ZeroDivisionError("Right-hand side Vec2D contains a 0. Cannot divide by 0.")
+
+            self.x /= other.x
+            self.y /= other.y
+        else:
+            if other == 0:
+                raise ZeroDivisionError("Right-hand side Vec2D contains a 0. Cannot divide by 0.")
+
+            self.x /= other
+            self.y /= other
+
+        return self
 
     def __lt__(self, other):
         """Test if lhs Vec2D is less than rhs Vec2D.
@@ -534,3 +705,189 @@ class Vec2D:
 
     def __str__(self):
         return '({}, {})'.format(self.x, self.y)
+
+
+class FrozenVec2D(tuple):
+    """Immutable, hashable 2D vector.
+    An (x, y) tuple with vector arithmetic, for use as a dict
+    or set key. Hashes and compares equal to the plain tuple.
+
+    Args:
+        x(mixed): x-coordinate
+        y(mixed): y-coordinate
+
+    Examples:
+        >>> v1 = FrozenVec2D(1, 2)
+        >>> print(v1 + FrozenVec2D(3, 4), v1 * 2)
+        (4, 6) (2, 4)
+        >>> print(v1 == (1, 2), {v1: 'foo'}[(1, 2)])
+        True foo
+        >>> print((1, 1) + v1, sum([v1, v1]))
+        (2, 3) (2, 4)
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, x=0, y=0):
+        return tuple.__new__(cls, (x, y))
+
+    def __getnewargs__(self):
+        return tuple(self)
+
+    x = property(operator.itemgetter(0))
+    y = property(operator.itemgetter(1))
+
+    def thaw(self):
+        """Mutable copy.
+
+        Returns:
+            Vec2D
+        """
+
+        return Vec2D(self[0], self[1])
+
+    def length(self):
+        return math.hypot(self[0], self[1])
+
+    def distance(self, other):
+        return math.hypot(other[0] - self[0], other[1] - self[1])
+
+    def dot(self, other):
+        return self[0] * other[0] + self[1] * other[1]
+
+    def __add__(self, other):
+        return FrozenVec2D(self[0] + other[0], self[1] + other[1])
+
+    def __sub__(self, other):
+        return FrozenVec2D(self[0] - other[0], self[1] - other[1])
+
+    def __radd__(self, other):
+        # sum() starts from 0
+        if other == 0:
+            return self
+
+        return FrozenVec2D(other[0] + self[0], other[1] + self[1])
+
+    def __rsub__(self, other):
+        return FrozenVec2D(other[0] - self[0], other[1] - self[1])
+
+    def __mul__(self, other):
+        if isinstance(other, tuple):
+            return FrozenVec2D(self[0] * other[0], self[1] * other[1])
+
+        return FrozenVec2D(self[0] * other, self[1] * other)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if isinstance(other, tuple):
+            return FrozenVec2D(self[0] / other[0], self[1] / other[1])
+
+        return FrozenVec2D(self[0] / other, self[1] / other)
+
+    def __neg__(self):
+        return FrozenVec2D(-self[0], -self[1])
+
+    def __repr__(self):
+        return 'FrozenVec2D(x=%s, y=%s)' % self
+
+    def __str__(self):
+        return '({}, {})'.format(self[0], self[1])
+
+
+class Cell2D(FrozenVec2D):
+    """Integer grid cell, interned.
+    Equal cells are usually the same object, so grid keys
+    cost no allocation once a cell has been seen.
+
+    Note:
+        At most `INTERN_LIMIT` cells are interned; beyond that,
+        new cells are created normally. They still compare and
+        hash equal to interned ones. Non-integer coordinates are
+        floored, the same as `from_point`.
+
+    Args:
+        cx(int): column
+        cy(int): row
+
+    Examples:
+        >>> c1 = Cell2D.from_point(25.0, -3.5, 10)
+        >>> print(c1, c1 is Cell2D(2, -1))
+        (2, -1) True
+    """
+
+    __slots__ = ()
+
+    INTERN_LIMIT = 65536
+
+    _interned = {}
+
+    def __new__(cls, cx=0, cy=0):
+        key  = (math.floor(cx), math.floor(cy))
+        cell = cls._interned.get(key)
+
+        if cell is None:
+            cell = tuple.__new__(cls, key)
+
+            if len(cls._interned) < cls.INTERN_LIMIT:
+                cls._interned[key] = cell
+
+        return cell
+
+    @classmethod
+    def from_point(cls, x, y, size):
+        """Cell containing a point.
+
+        Args:
+            x(float): x-coordinate
+            y(float): y-coordinate
+            size(float): cell size
+
+        Returns:
+            Cell2D
+        """
+
+        return cls(math.floor(x / size), math.floor(y / size))
+
+    @classmethod
+    def clear_interned(cls):
+        """Forget all interned cells."""
+        cls._interned.clear()
+
+    def origin(self, size):
+        """Lower-left corner of the cell.
+
+        Args:
+            size(float): cell size
+
+        Returns:
+            FrozenVec2D
+        """
+
+        return FrozenVec2D(self[0] * size, self[1] * size)
+
+    def neighbours(self):
+        """The eight surrounding cells.
+
+        Returns:
+            list
+        """
+
+        cx, cy = self
+
+        return [
+            Cell2D(cx + dx, cy + dy)
+            for dy in (-1, 0, 1)
+            for dx in (-1, 0, 1)
+            if dx or dy
+        ]
+
+    def __repr__(self):
+        return 'Cell2D(cx=%s, cy=%s)' % self
+
+
+def _reset(v, x=0, y=0):
+    v.x = x
+    v.y = y
+
+pool = Pool(Vec2D, _reset, capacity=4096)
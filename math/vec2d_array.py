@@ -0,0 +1,432 @@
+import numpy as np
+
+from pybox.math.vec2d import Vec2D
+
+
+class Vec2DArray:
+    """Batch of 2D vectors, stored as structure of arrays.
+    Holds contiguous `x` and `y` NumPy arrays and applies
+    the `Vec2D` API to every vector at once.
+
+    Note:
+        Like `Vec2D`, `scale`, `rotate`, `normalize`, `limit`
+        and `clamp` work in place and return the batch, while
+        operators return a new batch. Scalars, `Vec2D`s and
+        per-vector arrays all broadcast as operands.
+
+        Unlike `Vec2D`, `normalize` does not round and `lerp`
+        does not range-check `norm`.
+
+    Args:
+        x(array): x-coordinates
+        y(array): y-coordinates
+        dtype(dtype): float32 or float64 (optional)
+
+    Examples:
+        >>> a1 = Vec2DArray([1, 3], [2, 4])
+        >>> print(len(a1), a1[1])
+        2 (3.0, 4.0)
+        >>> print(a1.length())
+        [2.23606798 5.        ]
+    """
+
+    __slots__ = ('x', 'y')
+
+    def __init__(self, x, y, dtype=np.float64):
+        self.x = np.ascontiguousarray(x, dtype=dtype)
+        self.y = np.ascontiguousarray(y, dtype=dtype)
+
+        if self.x.shape != self.y.shape or self.x.ndim != 1:
+            raise AttributeError('x and y must be 1D arrays of the same length.')
+
+    @classmethod
+    def _wrap(cls, x, y):
+        batch = cls.__new__(cls)
+        batch.x = x
+        batch.y = y
+
+        return batch
+
+    @classmethod
+    def zeros(cls, count, dtype=np.float64):
+        """Create a batch of zero vectors.
+
+        Args:
+            count(int): number of vectors
+            dtype(dtype): float32 or float64 (optional)
+
+        Returns:
+            Vec2DArray
+        """
+
+        return cls._wrap(np.zeros(count, dtype), np.zeros(count, dtype))
+
+    @classmethod
+    def from_vectors(cls, vectors, dtype=np.float64):
+        """Create a batch from Vec2Ds or (x, y) tuples.
+
+        Args:
+            vectors(iterable): vectors
+            dtype(dtype): float32 or float64 (optional)
+
+        Returns:
+            Vec2DArray
+        """
+
+        points = [(v.x, v.y) if isinstance(v, Vec2D) else v for v in vectors]
+
+        return cls.from_interleaved(np.asarray(points, dtype=dtype).reshape(-1, 2), dtype)
+
+    @classmethod
+    def from_interleaved(cls, data, dtype=np.float64):
+        """Create a batch from an x0, y0, x1, y1, ... buffer.
+
+        Args:
+            data(array): flat or (n, 2) coordinates
+            dtype(dtype): float32 or float64 (optional)
+
+        Returns:
+            Vec2DArray
+        """
+
+        data = np.asarray(data).reshape(-1, 2)
+
+        return cls(data[:, 0], data[:, 1], dtype)
+
+    def interleaved(self, out=None):
+        """Write the vectors as x0, y0, x1, y1, ... pairs.
+
+        Note:
+            Pass a preallocated `out` buffer, for example a
+            vertex list's array, to fill it without allocating.
+
+        Args:
+            out(array): (n, 2) or flat buffer to fill (optional)
+
+        Examples:
+            >>> a1 = Vec2DArray([1, 3], [2, 4])
+            >>> print(a1.interleaved().ravel())
+            [1. 2. 3. 4.]
+
+        Returns:
+            array: (n, 2) view of the filled buffer
+        """
+
+        if out is None:
+            out = np.empty((len(self), 2), dtype=self.x.dtype)
+
+        pairs = out.reshape(-1, 2)
+        pairs[:, 0] = self.x
+        pairs[:, 1] = self.y
+
+        return pairs
+
+    def copy(self):
+        """Copy object.
+
+        Returns:
+            Vec2DArray
+        """
+
+        return self._wrap(self.x.copy(), self.y.copy())
+
+    def set(self, x, y):
+        """Set all coordinates in place.
+
+        Args:
+            x(mixed): x-coordinates
+            y(mixed): y-coordinates
+
+        Returns:
+            Vec2DArray
+        """
+
+        self.x[...] = x
+        self.y[...] = y
+
+        return self
+
+    def add_scaled(self, other, factor):
+        """Add other vectors scaled by factor, in place.
+
+        Args:
+            other(mixed): other vectors
+            factor(mixed): scale factor(s)
+
+        Returns:
+            Vec2DArray
+        """
+
+        ox, oy = _xy(other)
+
+        self.x += ox * factor
+        self.y += oy * factor
+
+        return self
+
+    def scale(self, factor):
+        """Scale vectors by factor, in place.
+
+        Args:
+            factor(mixed): scale factor(s)
+
+        Returns:
+            Vec2DArray
+        """
+
+        self.x *= factor
+        self.y *= factor
+
+        return self
+
+    def rotate(self, angle):
+        """Rotate vectors by delta heading, in place.
+
+        Args:
+            angle(mixed): delta heading(s) in radians
+
+        Returns:
+            Vec2DArray
+        """
+
+        c = np.cos(angle)
+        s = np.sin(angle)
+        x = self.x.copy()
+
+        self.x *= c
+        self.x -= s * self.y
+        self.y *= c
+        self.y += s * x
+
+        return self
+
+    def length(self):
+        """Lengths of the vectors.
+
+        Returns:
+            array
+        """
+
+        return np.hypot(self.x, self.y)
+
+    def lengthSq(self):
+        """Squared lengths of the vectors.
+
+        Returns:
+            array
+        """
+
+        return self.x * self.x + self.y * self.y
+
+    def heading(self):
+        """Angles of the vectors.
+
+        Returns:
+            array
+        """
+
+        return np.arctan2(self.y, self.x)
+
+    def distance(self, other):
+        """Distances to other vectors.
+
+        Args:
+            other(mixed): other vectors
+
+        Returns:
+            array
+        """
+
+        ox, oy = _xy(other)
+
+        return np.hypot(ox - self.x, oy - self.y)
+
+    def dot(self, other):
+        """Dot products with other vectors.
+
+        Args:
+            other(mixed): other vectors
+
+        Returns:
+            array
+        """
+
+        ox, oy = _xy(other)
+
+        return self.x * ox + self.y * oy
+
+    def cross(self, other):
+        """Cross products with other vectors.
+
+        Args:
+            other(mixed): other vectors
+
+        Returns:
+            array
+        """
+
+        ox, oy = _xy(other)
+
+        return self.x * oy - self.y * ox
+
+    def normalize(self):
+        """Normalize vectors to unit length, in place.
+        Zero vectors are left unchanged.
+
+        Returns:
+            Vec2DArray
+        """
+
+        length = self.length()
+        length[length == 0] = 1
+
+        return self.scale(1 / length)
+
+    def setMagnitude(self, mag):
+        """Set new magnitudes, keeping headings, in place.
+
+        Args:
+            mag(mixed): new magnitude(s)
+
+        Returns:
+            Vec2DArray
+        """
+
+        length = self.length()
+        factor = np.divide(mag, length, out=np.zeros_like(length), where=length > 0)
+
+        return self.scale(factor)
+
+    def limit(self, value):
+        """Limit magnitudes by max value, in place.
+
+        Args:
+            value(mixed): max value(s)
+
+        Returns:
+            Vec2DArray
+        """
+
+        length = self.length()
+        factor = np.divide(value, length, out=np.ones_like(length), where=length > value)
+
+        return self.scale(factor)
+
+    def clamp(self, low, high):
+        """Clamp magnitudes between min/max values, in place.
+
+        Args:
+            low(mixed): lower limit(s)
+            high(mixed): upper limit(s)
+
+        Returns:
+            Vec2DArray
+        """
+
+        return self.setMagnitude(np.clip(self.length(), np.minimum(low, high), np.maximum(low, high)))
+
+    def lerp(self, other, norm):
+        """Linear interpolation towards other vectors.
+
+        Args:
+            other(mixed): other vectors
+            norm(mixed): interpolation percentage(s)
+
+        Returns:
+            Vec2DArray: new batch
+        """
+
+        ox, oy = _xy(other)
+
+        return self._wrap(self.x + (ox - self.x) * norm, self.y + (oy - self.y) * norm)
+
+    def __getitem__(self, index):
+        """Vector(s) by index.
+
+        Note:
+            An integer gives a `Vec2D` copy. A slice gives a
+            batch viewing the same memory. An index array or
+            boolean mask gives a copied batch; write back
+            through `__setitem__` with the same index.
+        """
+
+        if isinstance(index, (int, np.integer)):
+            return Vec2D(float(self.x[index]), float(self.y[index]))
+
+        return self._wrap(self.x[index], self.y[index])
+
+    def __setitem__(self, index, value):
+        vx, vy = _xy(value)
+
+        self.x[index] = vx
+        self.y[index] = vy
+
+    def __iter__(self):
+        for x, y in zip(self.x.tolist(), self.y.tolist()):
+            yield Vec2D(x, y)
+
+    def __len__(self):
+        return len(self.x)
+
+    def __add__(self, other):
+        ox, oy = _xy(other)
+        return self._wrap(self.x + ox, self.y + oy)
+
+    def __sub__(self, other):
+        ox, oy = _xy(other)
+        return self._wrap(self.x - ox, self.y - oy)
+
+    def __mul__(self, other):
+        ox, oy = _xy(other)
+        return self._wrap(self.x * ox, self.y * oy)
+
+    def __truediv__(self, other):
+        ox, oy = _xy(other)
+        return self._wrap(self.x / ox, self.y / oy)
+
+    def __iadd__(self, other):
+        ox, oy = _xy(other)
+        self.x += ox
+        self.y += oy
+        return self
+
+    def __isub__(self, other):
+        ox, oy = _xy(other)
+        self.x -= ox
+        self.y -= oy
+        return self
+
+    def __imul__(self, other):
+        ox, oy = _xy(other)
+        self.x *= ox
+        self.y *= oy
+        return self
+
+    def __itruediv__(self, other):
+        ox, oy = _xy(other)
+        self.x /= ox
+        self.y /= oy
+        return self
+
+    def __repr__(self):
+        return 'Vec2DArray(x=%s, y=%s)' % (self.x, self.y)
+
+    def __str__(self):
+        return '{}'.format(self.interleaved().tolist())
+
+
+def _xy(other):
+    """Split an operand into x and y parts.
+    Scalars and per-vector arrays apply to both axes.
+    """
+
+    if isinstance(other, Vec2DArray):
+        return other.x, other.y
+
+    if isinstance(other, Vec2D):
+        return other.x, other.y
+
+    if isinstance(other, tuple):
+        return other[0], other[1]
+
+    return other, other
@@ -2,6 +2,7 @@ import copy
 import pyglet
 
 from math import radians
+from pybox.containers.pool import Pool
 from pybox.math import util, vec2d
 
 class AABB:
@@ -17,6 +18,33 @@ class AABB:
         self._right  = right
         self._top    = top
 
+    @classmethod
+    def acquire(cls, left, bottom, right, top):
+        """Get an AABB from the shared pool.
+        Pair with `release` in hot loops to avoid allocating.
+        Subclasses get a new, unpooled instance.
+
+        Returns:
+            AABB
+        """
+
+        if cls is not AABB:
+            # The shared pool only holds base instances
+            return cls(left, bottom, right, top)
+
+        return pool.acquire(left, bottom, right, top)
+
+    def release(self):
+        """Return this AABB to the shared pool.
+        It must not be used afterwards.
+
+        Raises:
+            AttributeError: Not acquired, or already released.
+        """
+
+        if type(self) is AABB:
+            pool.release(self)
+
     def area(self):
         """Returns area of AABB.
 
@@ -206,15 +234,22 @@ class AABB:
     def compute(vertices, transform):
         xmin = float('inf')
         ymin = float('inf')
-        xmax = 0
-        ymax = 0
+        xmax = float('-inf')
+        ymax = float('-inf')
+
+        for x, y in transform.transform_points(vertices):
+            xmin = min(xmin, x)
+            xmax = max(xmax, x)
+            ymin = min(ymin, y)
+            ymax = max(ymax, y)
+
+        return AABB(xmin, ymin, xmax, ymax)
 
-        for x, y in vertices:
-            vertex = transform * vec2d.Vec2D(x, y)
 
-            xmin = min(xmin, vertex.x)
-            xmax = max(xmax, vertex.x)
-            ymin = min(ymin, vertex.y)
-            ymax = max(ymax, vertex.y)
+def _reset(aabb, left, bottom, right, top):
+    aabb._left   = left
+    aabb._bottom = bottom
+    aabb._right  = right
+    aabb._top    = top
 
-        return AABB(xmin, ymin, xmax, ymax)
\ No newline at end of file
+pool = Pool(AABB, _reset, capacity=1024)
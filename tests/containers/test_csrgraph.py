@@ -0,0 +1,132 @@
+import os
+import random
+import tempfile
+import unittest
+from pybox.containers.csrgraph import CSRGraph, CSRGraphBuilder
+from pybox.containers.pqueue import PQueue
+
+
+def shortest_paths(graph, source):
+    dist  = {source: 0}
+    queue = PQueue([(source, 0)])
+
+    while not queue.isEmpty():
+        node, cost = queue.dequeue()
+
+        if cost > dist[node]:
+            continue
+
+        for target, weight in graph.neighbours(node):
+            if target not in dist or cost + weight < dist[target]:
+                dist[target] = cost + weight
+                queue.enqueue((target, cost + weight))
+
+    return dist
+
+
+class CSRGraphTest(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(11)
+
+        self.adjacency = {node: [] for node in range(200)}
+
+        for i in range(1000):
+            source = rng.randrange(200)
+            self.adjacency[source].append((rng.randrange(200), float(rng.randint(1, 9))))
+
+        self.g1 = CSRGraph.from_adjacency(self.adjacency)
+
+    def tearDown(self):
+        pass
+
+    def test_build(self):
+        self.assertEqual(len(self.g1), 200)
+        self.assertEqual(self.g1.edge_count, 1000)
+
+        for node, edges in self.adjacency.items():
+            self.assertEqual(list(self.g1.neighbours(node)), edges)
+            self.assertEqual(self.g1.degree(node), len(edges))
+
+    def test_builder(self):
+        b1 = CSRGraphBuilder(5)
+        b1.add_undirected_edge(0, 1, 3.0)
+        b1.add_edge(1, 2)
+
+        self.assertEqual(b1.add_node(), 5)
+
+        g2 = b1.build()
+
+        self.assertEqual(len(g2), 6)
+        self.assertEqual(list(g2.neighbours(1)), [(0, 3.0), (2, 1.0)])
+        self.assertEqual(list(g2.neighbours(4)), [])
+
+    def test_save_load(self):
+        fd, path = tempfile.mkstemp()
+        os.close(fd)
+
+        try:
+            self.g1.save(path)
+
+            for use_mmap in (True, False):
+                g2 = CSRGraph.load(path, use_mmap)
+
+                self.assertEqual(len(g2), len(self.g1))
+                self.assertEqual(list(g2.offsets), list(self.g1.offsets))
+                self.assertEqual(list(g2.targets), list(self.g1.targets))
+                self.assertEqual(list(g2.weights), list(self.g1.weights))
+
+                g2.close()
+        finally:
+            os.remove(path)
+
+    def test_close_exported(self):
+        fd, path = tempfile.mkstemp()
+        os.close(fd)
+
+        try:
+            self.g1.save(path)
+
+            g2 = CSRGraph.load(path)
+            arrays = g2.as_numpy()
+
+            with self.assertRaises(BufferError):
+                g2.close()
+
+            self.assertEqual(list(g2.neighbours(1)), list(self.g1.neighbours(1)))
+
+            del arrays
+            view = memoryview(g2.targets)
+
+            with self.assertRaises(BufferError):
+                g2.close()
+
+            self.assertEqual(list(g2.targets), list(self.g1.targets))
+
+            view.release()
+            g2.close()
+
+            self.assertIsNone(g2.offsets)
+        finally:
+            os.remove(path)
+
+    def test_loadException(self):
+        fd, path = tempfile.mkstemp()
+        os.write(fd, b'\0' * 64)
+        os.close(fd)
+
+        try:
+            with self.assertRaises(ValueError):
+                CSRGraph.load(path)
+        finally:
+            os.remove(path)
+
+    def test_shortest_paths(self):
+        dist = shortest_paths(self.g1, 0)
+
+        for node, cost in dist.items():
+            for target, weight in self.adjacency[node]:
+                self.assertLessEqual(dist[target], cost + weight)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+import unittest
+from pybox.containers.lrucache import LRUCache
+
+
+class LRUCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.evicted = []
+        self.c1 = LRUCache()
+        self.c2 = LRUCache(3, on_evict=lambda key, value: self.evicted.append(key))
+
+    def tearDown(self):
+        pass
+
+    def test_get_put(self):
+        self.c1.put('foo', 1)
+
+        self.assertEqual(self.c1.get('foo'), 1)
+        self.assertEqual(self.c1.get('bar'), None)
+        self.assertEqual(self.c1.get('bar', 2), 2)
+        self.assertEqual(self.c1.hits, 1)
+        self.assertEqual(self.c1.misses, 2)
+
+    def test_unbounded(self):
+        for i in range(100):
+            self.c1.put(i, i)
+
+        self.assertEqual(len(self.c1), 100)
+
+    def test_evict(self):
+        for key in 'abcd':
+            self.c2.put(key, key)
+
+        self.assertEqual(self.evicted, ['a'])
+        self.assertFalse('a' in self.c2)
+
+    def test_replace(self):
+        v1 = ['foo']
+        self.c2.put('a', v1)
+        self.c2.put('a', v1)
+
+        self.assertEqual(self.evicted, [])
+
+        self.c2.put('a', ['bar'])
+
+        self.assertEqual(self.evicted, ['a'])
+        self.assertEqual(self.c2.get('a'), ['bar'])
+        self.assertEqual(self.c2.cost, 1)
+
+    def test_recency(self):
+        for key in 'abc':
+            self.c2.put(key, key)
+
+        self.c2.get('a')
+        self.c2.put('d', 'd')
+
+        self.assertEqual(self.evicted, ['b'])
+        self.assertTrue('a' in self.c2)
+
+    def test_cost(self):
+        self.c2.put('a', 'a', cost=2)
+        self.c2.put('b', 'b', cost=1)
+        self.c2.put('a', 'a', cost=1)
+
+        self.assertEqual(self.c2.cost, 2)
+        self.assertEqual(self.evicted, [])
+
+        self.c2.put('c', 'c', cost=2)
+
+        self.assertEqual(self.evicted, ['b'])
+        self.assertEqual(self.c2.cost, 3)
+
+    def test_oversized(self):
+        self.c2.put('a', 'a', cost=5)
+
+        self.assertTrue('a' in self.c2)
+
+        self.c2.put('b', 'b')
+
+        self.assertEqual(self.evicted, ['a'])
+
+    def test_remove(self):
+        self.c2.put('a', 'a')
+
+        self.assertEqual(self.c2.remove('a'), 'a')
+        self.assertEqual(self.c2.remove('a'), None)
+        self.assertEqual(self.c2.cost, 0)
+        self.assertEqual(self.evicted, [])
+
+    def test_clear(self):
+        self.c2.put('a', 'a')
+        self.c2.put('b', 'b')
+        self.c2.clear()
+
+        self.assertEqual(len(self.c2), 0)
+        self.assertEqual(self.evicted, ['a', 'b'])
+
+
+if __name__ == '__main__':
+    unittest.main()
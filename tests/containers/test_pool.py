@@ -0,0 +1,71 @@
+import unittest
+from pybox.containers.pool import Pool
+
+
+class Item:
+    def __init__(self, value=0):
+        self.value = value
+
+def reset(item, value=0):
+    item.value = value
+
+
+class PoolTest(unittest.TestCase):
+    def setUp(self):
+        self.p1 = Pool(Item, reset)
+        self.p2 = Pool(Item, reset, capacity=2)
+
+    def tearDown(self):
+        pass
+
+    def test_acquire(self):
+        i1 = self.p1.acquire(5)
+
+        self.assertEqual(i1.value, 5)
+        self.assertEqual(self.p1.misses, 1)
+        self.assertEqual(self.p1.in_use, 1)
+
+    def test_release(self):
+        i1 = self.p1.acquire(5)
+        self.p1.release(i1)
+        i2 = self.p1.acquire(7)
+
+        self.assertTrue(i1 is i2)
+        self.assertEqual(i2.value, 7)
+        self.assertEqual(self.p1.hits, 1)
+        self.assertEqual(self.p1.misses, 1)
+
+    def test_capacity(self):
+        items = [self.p2.acquire() for i in range(4)]
+
+        for item in items:
+            self.p2.release(item)
+
+        self.assertEqual(self.p2.available, 2)
+        self.assertEqual(self.p2.in_use, 0)
+        self.assertEqual(self.p2.high_water, 4)
+
+    def test_double_release(self):
+        i1 = self.p1.acquire()
+        self.p1.release(i1)
+
+        with self.assertRaises(AttributeError):
+            self.p1.release(i1)
+
+        with self.assertRaises(AttributeError):
+            self.p1.release(Item())
+
+        self.assertEqual(self.p1.in_use, 0)
+        self.assertIsNot(self.p1.acquire(), self.p1.acquire())
+
+    def test_clear(self):
+        self.p1.release(self.p1.acquire())
+        self.p1.clear()
+
+        self.assertEqual(self.p1.stats, {
+            'available': 0, 'in_use': 0, 'hits': 0, 'misses': 0, 'high_water': 0
+        })
+
+
+if __name__ == '__main__':
+    unittest.main()
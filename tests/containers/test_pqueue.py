@@ -1,5 +1,6 @@
 import unittest
-from pybox.containers.pqueue import PQueue
+import random
+from pybox.containers.pqueue import PQueue, IndexedPQueue
 
 
 class PQueueTest(unittest.TestCase):
@@ -52,6 +53,24 @@ class PQueueTest(unittest.TestCase):
         self.assertEqual(q3Value, ('foo', 1))
         self.assertEqual(len(q3), 2)
 
+    def test_fifo_ties(self):
+        q3 = PQueue([('a', 1), ('b', 0), ('c', 1)])
+        q3.enqueue(('d', 1))
+        q3.enqueue(('e', 0))
+
+        values = [q3.dequeue()[0] for i in range(len(q3))]
+
+        self.assertEqual(values, ['b', 'e', 'a', 'c', 'd'])
+
+    def test_heap_order(self):
+        priorities = [(i * 7919) % 1000 for i in range(1000)]
+        q3 = PQueue([(i, p) for i, p in enumerate(priorities)])
+
+        result = [q3.dequeue()[1] for i in range(len(q3))]
+
+        self.assertEqual(result, sorted(priorities))
+        self.assertTrue(q3.isEmpty())
+
     def test_peek(self):
         self.assertEqual(self.q1.peek(), None)
         self.assertEqual(self.q2.peek(), ('foo', 1))
@@ -61,5 +80,82 @@ class PQueueTest(unittest.TestCase):
         self.assertFalse(self.q2.isEmpty())
 
 
+class IndexedPQueueTest(unittest.TestCase):
+    def setUp(self):
+        self.q1 = IndexedPQueue()
+        self.q2 = IndexedPQueue([('baz', 3), ('foo', 1), ('bar', 2)])
+
+    def tearDown(self):
+        pass
+
+    def test_init(self):
+        q3 = IndexedPQueue([('foo', 3), ('foo', 1)])
+
+        self.assertEqual(len(self.q1), 0)
+        self.assertEqual(len(self.q2), 3)
+        self.assertEqual(len(q3), 1)
+        self.assertEqual(q3.peek(), ('foo', 1))
+
+    def test_contains(self):
+        self.assertTrue('foo' in self.q2)
+        self.assertFalse('qux' in self.q2)
+
+        self.q2.dequeue()
+
+        self.assertFalse('foo' in self.q2)
+
+    def test_enqueue_existing(self):
+        self.q2.enqueue(('baz', 0))
+
+        self.assertEqual(len(self.q2), 3)
+        self.assertEqual(self.q2.dequeue(), ('baz', 0))
+
+    def test_update(self):
+        self.q2.update('foo', 5)
+        self.q2.update('baz', 1)
+
+        self.assertEqual(self.q2.priority('foo'), 5)
+        self.assertEqual(self.q2.elements, [('baz', 1), ('bar', 2), ('foo', 5)])
+
+        with self.assertRaises(KeyError):
+            self.q2.update('qux', 1)
+
+    def test_remove(self):
+        self.assertEqual(self.q2.remove('foo'), ('foo', 1))
+        self.assertEqual(len(self.q2), 2)
+        self.assertEqual(self.q2.peek(), ('bar', 2))
+
+        with self.assertRaises(KeyError):
+            self.q2.remove('foo')
+
+    def test_clear(self):
+        self.q2.clear()
+
+        self.assertTrue(self.q2.isEmpty())
+        self.assertFalse('foo' in self.q2)
+
+    def test_random_operations(self):
+        rng      = random.Random(42)
+        expected = {}
+
+        for i in range(2000):
+            key = rng.randrange(200)
+            op  = rng.random()
+
+            if op < 0.5:
+                expected[key] = rng.randrange(1000)
+                self.q1.enqueue((key, expected[key]))
+            elif op < 0.75 and key in expected:
+                self.assertEqual(self.q1.remove(key), (key, expected.pop(key)))
+            elif not self.q1.isEmpty():
+                key, priority = self.q1.dequeue()
+
+                self.assertEqual(priority, min(expected.values()))
+                self.assertEqual(expected.pop(key), priority)
+
+        self.assertEqual(len(self.q1), len(expected))
+        self.assertEqual([p for k, p in self.q1.elements], sorted(expected.values()))
+
+
 if __name__ == '__main__':
     unittest.main()
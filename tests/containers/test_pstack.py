@@ -0,0 +1,59 @@
+import unittest
+from pybox.containers.pstack import PStack
+
+
+class PStackTest(unittest.TestCase):
+    def setUp(self):
+        self.s1 = PStack()
+        self.s2 = PStack([1, 2, 3, 4, 5])
+
+    def tearDown(self):
+        pass
+
+    def test_init(self):
+        self.assertEqual(len(self.s1), 0)
+        self.assertEqual(len(self.s2), 5)
+
+    def test_clear(self):
+        s3 = self.s2.clear()
+
+        self.assertEqual(len(s3), 0)
+        self.assertEqual(len(self.s2), 5)
+
+    def test_push(self):
+        s3 = self.s1.push(1).push(2).push(3)
+
+        self.assertEqual(len(s3), 3)
+        self.assertEqual(s3.peek(), 3)
+        self.assertTrue(self.s1.isEmpty())
+
+    def test_pop(self):
+        self.assertTrue(self.s1.pop() is self.s1)
+
+        s3 = self.s2.pop()
+
+        self.assertEqual(s3.peek(), 4)
+        self.assertEqual(len(s3), 4)
+        self.assertEqual(self.s2.peek(), 5)
+
+    def test_snapshots(self):
+        s3 = self.s2.pop().push(6)
+        s4 = s3.push_many([7, 8])
+
+        self.assertEqual(list(self.s2), [5, 4, 3, 2, 1])
+        self.assertEqual(list(s3), [6, 4, 3, 2, 1])
+        self.assertEqual(list(s4), [8, 7, 6, 4, 3, 2, 1])
+        self.assertTrue(s4.pop().pop() is not s3)
+        self.assertEqual(s4.pop().pop().elements, s3.elements)
+
+    def test_peek(self):
+        self.assertEqual(self.s1.peek(), None)
+        self.assertEqual(self.s2.peek(), 5)
+
+    def test_isEmpty(self):
+        self.assertTrue(self.s1.isEmpty())
+        self.assertFalse(self.s2.isEmpty())
+
+
+if __name__ == '__main__':
+    unittest.main()
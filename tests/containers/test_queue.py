@@ -45,6 +45,24 @@ class QueueTest(unittest.TestCase):
         self.assertEqual(q1Value, 1)
         self.assertEqual(len(self.q1), 2)
 
+    def test_enqueue_many(self):
+        self.q1.enqueue_many([1, 2, 3])
+        self.q2.enqueue_many(range(6, 9))
+
+        self.assertEqual(len(self.q1), 3)
+        self.assertEqual(self.q2.dequeue_many(8), [1, 2, 3, 4, 5, 6, 7, 8])
+
+    def test_dequeue_many(self):
+        self.assertEqual(self.q1.dequeue_many(3), [])
+        self.assertEqual(self.q2.dequeue_many(2), [1, 2])
+        self.assertEqual(self.q2.dequeue_many(10), [3, 4, 5])
+        self.assertTrue(self.q2.isEmpty())
+
+    def test_drain(self):
+        self.assertEqual(self.q1.drain(), [])
+        self.assertEqual(self.q2.drain(), [1, 2, 3, 4, 5])
+        self.assertEqual(len(self.q2), 0)
+
     def test_peek(self):
         self.assertEqual(self.q1.peek(), None)
         self.assertEqual(self.q2.peek(), 1)
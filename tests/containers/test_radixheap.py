@@ -0,0 +1,85 @@
+import random
+import unittest
+from pybox.containers.pqueue import PQueue
+from pybox.containers.radixheap import RadixHeap
+
+
+class RadixHeapTest(unittest.TestCase):
+    def setUp(self):
+        self.q1 = RadixHeap()
+        self.q2 = RadixHeap([('baz', 3), ('foo', 1)])
+
+    def tearDown(self):
+        pass
+
+    def test_init(self):
+        self.assertEqual(len(self.q1), 0)
+        self.assertEqual(len(self.q2), 2)
+
+    def test_clear(self):
+        self.q2.clear()
+
+        self.assertEqual(len(self.q2), 0)
+        self.assertEqual(self.q2.dequeue(), None)
+
+    def test_enqueueException(self):
+        with self.assertRaises(Exception):
+            self.q1.enqueue('foo')
+
+        with self.assertRaises(Exception):
+            self.q1.enqueue(('foo', 1.5))
+
+        self.q2.dequeue()
+
+        with self.assertRaises(Exception):
+            self.q2.enqueue(('bar', 0))
+
+    def test_dequeue(self):
+        self.assertEqual(self.q1.dequeue(), None)
+        self.assertEqual(self.q2.dequeue(), ('foo', 1))
+        self.assertEqual(self.q2.dequeue(), ('baz', 3))
+
+    def test_fifo_ties(self):
+        q3 = RadixHeap([('a', 5), ('b', 2), ('c', 5)])
+
+        self.assertEqual(q3.dequeue(), ('b', 2))
+
+        q3.enqueue(('d', 5))
+        q3.enqueue(('e', 2))
+
+        values = [q3.dequeue()[0] for i in range(len(q3))]
+
+        self.assertEqual(values, ['e', 'a', 'c', 'd'])
+
+    def test_matches_pqueue(self):
+        rng = random.Random(7)
+        q3  = PQueue()
+        q4  = RadixHeap()
+        low = 0
+
+        for i in range(5000):
+            if rng.random() < 0.6 or q3.isEmpty():
+                element = (i, low + rng.randrange(50))
+                q3.enqueue(element)
+                q4.enqueue(element)
+            else:
+                self.assertEqual(q4.peek(), q3.peek())
+
+                element = q3.dequeue()
+                low     = element[1]
+
+                self.assertEqual(q4.dequeue(), element)
+
+        self.assertEqual(q4.elements, q3.elements)
+
+    def test_peek(self):
+        self.assertEqual(self.q1.peek(), None)
+        self.assertEqual(self.q2.peek(), ('foo', 1))
+
+    def test_isEmpty(self):
+        self.assertTrue(self.q1.isEmpty())
+        self.assertFalse(self.q2.isEmpty())
+
+
+if __name__ == '__main__':
+    unittest.main()
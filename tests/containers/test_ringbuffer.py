@@ -0,0 +1,86 @@
+import unittest
+from pybox.containers.ringbuffer import RingBuffer
+
+
+class RingBufferTest(unittest.TestCase):
+    def setUp(self):
+        self.r1 = RingBuffer(3)
+        self.r2 = RingBuffer(5, [1, 2, 3, 4, 5])
+
+    def tearDown(self):
+        pass
+
+    def test_init(self):
+        self.assertEqual(len(self.r1), 0)
+        self.assertEqual(len(self.r2), 5)
+        self.assertEqual(self.r1.capacity, 3)
+
+    def test_initException(self):
+        with self.assertRaises(AttributeError):
+            RingBuffer(0)
+
+        with self.assertRaises(AttributeError):
+            RingBuffer(3, policy='grow')
+
+    def test_clear(self):
+        self.r2.clear()
+
+        self.assertEqual(len(self.r2), 0)
+        self.assertEqual(self.r2.peek(), None)
+
+    def test_enqueue_dequeue(self):
+        self.r1.enqueue(1)
+        self.r1.enqueue(2)
+
+        self.assertEqual(self.r1.dequeue(), 1)
+        self.assertEqual(self.r1.dequeue(), 2)
+        self.assertEqual(self.r1.dequeue(), None)
+
+    def test_overwrite(self):
+        for i in range(7):
+            self.assertTrue(self.r1.enqueue(i))
+
+        self.assertEqual(list(self.r1), [4, 5, 6])
+        self.assertEqual(self.r1.dequeue(), 4)
+
+    def test_drop(self):
+        r3 = RingBuffer(2, [1, 2], policy='drop')
+
+        self.assertFalse(r3.enqueue(3))
+        self.assertEqual(list(r3), [1, 2])
+
+    def test_raise(self):
+        r3 = RingBuffer(2, [1, 2], policy='raise')
+
+        with self.assertRaises(OverflowError):
+            r3.enqueue(3)
+
+        r3.dequeue()
+        r3.enqueue(3)
+
+        self.assertEqual(list(r3), [2, 3])
+
+    def test_getitem(self):
+        self.r2.enqueue(6)
+
+        self.assertEqual(self.r2[0], 2)
+        self.assertEqual(self.r2[-1], 6)
+
+        with self.assertRaises(IndexError):
+            self.r2[5]
+
+    def test_peek(self):
+        self.assertEqual(self.r1.peek(), None)
+        self.assertEqual(self.r2.peek(), 1)
+
+    def test_isEmpty(self):
+        self.assertTrue(self.r1.isEmpty())
+        self.assertFalse(self.r2.isEmpty())
+
+    def test_isFull(self):
+        self.assertFalse(self.r1.isFull())
+        self.assertTrue(self.r2.isFull())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import random
+import unittest
+from pybox.containers.sparseset import SparseSet
+
+
+class SparseSetTest(unittest.TestCase):
+    def setUp(self):
+        self.s1 = SparseSet()
+        self.s2 = SparseSet([3, 1, 4, 15, 9])
+
+    def tearDown(self):
+        pass
+
+    def test_init(self):
+        self.assertEqual(len(self.s1), 0)
+        self.assertEqual(len(self.s2), 5)
+
+    def test_clear(self):
+        self.s2.clear()
+
+        self.assertEqual(len(self.s2), 0)
+        self.assertFalse(3 in self.s2)
+
+    def test_add(self):
+        self.assertTrue(self.s1.add(1000, 'foo'))
+        self.assertFalse(self.s1.add(1000, 'bar'))
+        self.assertEqual(self.s1.get(1000), 'bar')
+        self.assertEqual(len(self.s1), 1)
+
+        with self.assertRaises(IndexError):
+            self.s1.add(-1)
+
+    def test_contains(self):
+        self.assertTrue(15 in self.s2)
+        self.assertFalse(2 in self.s2)
+        self.assertFalse(-1 in self.s2)
+        self.assertFalse(100 in self.s2)
+
+    def test_remove(self):
+        self.s2.add(4, 'foo')
+
+        self.assertEqual(self.s2.remove(4), 'foo')
+        self.assertEqual(self.s2.ids, [3, 1, 9, 15])
+        self.assertFalse(4 in self.s2)
+
+        with self.assertRaises(KeyError):
+            self.s2.remove(4)
+
+    def test_random_operations(self):
+        rng      = random.Random(5)
+        expected = {}
+
+        for i in range(3000):
+            id = rng.randrange(500)
+
+            if rng.random() < 0.6:
+                self.s1.add(id, i)
+                expected[id] = i
+            elif id in expected:
+                self.assertEqual(self.s1.remove(id), expected.pop(id))
+
+        self.assertEqual(dict(self.s1.items()), expected)
+        self.assertEqual(sorted(self.s1), sorted(expected))
+
+        for id in range(500):
+            self.assertEqual(id in self.s1, id in expected)
+
+    def test_isEmpty(self):
+        self.assertTrue(self.s1.isEmpty())
+        self.assertFalse(self.s2.isEmpty())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -47,6 +47,24 @@ class StackTest(unittest.TestCase):
         self.assertEqual(s1Value, 3)
         self.assertEqual(len(self.s1), 2)
 
+    def test_push_many(self):
+        self.s1.push_many([1, 2, 3])
+
+        self.assertEqual(len(self.s1), 3)
+        self.assertEqual(self.s1.peek(), 3)
+
+    def test_pop_many(self):
+        self.assertEqual(self.s1.pop_many(2), [])
+        self.assertEqual(self.s2.pop_many(2), [5, 4])
+        self.assertEqual(self.s2.pop_many(0), [])
+        self.assertEqual(self.s2.pop_many(10), [3, 2, 1])
+        self.assertTrue(self.s2.isEmpty())
+
+    def test_iter(self):
+        self.assertEqual(list(self.s2), [5, 4, 3, 2, 1])
+        self.assertEqual(self.s2.elements, [5, 4, 3, 2, 1])
+        self.assertEqual(str(self.s2), '[5, 4, 3, 2, 1]')
+
     def test_peek(self):
         self.assertEqual(self.s1.peek(), None)
         self.assertEqual(self.s2.peek(), 5)
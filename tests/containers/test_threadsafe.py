@@ -0,0 +1,99 @@
+import asyncio
+import threading
+import unittest
+from pybox.containers.threadsafe import LockedQueue, LockedPQueue, AsyncQueue, AsyncPQueue
+
+
+class LockedQueueTest(unittest.TestCase):
+    def setUp(self):
+        self.q1 = LockedQueue()
+        self.q2 = LockedQueue([1, 2, 3, 4, 5])
+
+    def tearDown(self):
+        pass
+
+    def test_init(self):
+        self.assertEqual(len(self.q1), 0)
+        self.assertEqual(len(self.q2), 5)
+
+    def test_dequeue(self):
+        self.assertEqual(self.q1.dequeue(), None)
+        self.assertEqual(self.q1.dequeue(block=True, timeout=0.01), None)
+        self.assertEqual(self.q2.dequeue(), 1)
+
+    def test_drain(self):
+        self.assertEqual(self.q1.drain(), [])
+        self.assertEqual(self.q2.drain(2), [1, 2])
+        self.assertEqual(self.q2.drain(), [3, 4, 5])
+
+    def test_producers(self):
+        def produce(start):
+            for i in range(start, start + 1000):
+                self.q1.enqueue(i)
+
+        threads = [threading.Thread(target=produce, args=(i * 1000,)) for i in range(4)]
+
+        for thread in threads:
+            thread.start()
+
+        received = []
+
+        while len(received) < 4000:
+            value = self.q1.dequeue(block=True, timeout=5)
+            self.assertIsNotNone(value)
+            received.append(value)
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(sorted(received), list(range(4000)))
+        self.assertTrue(self.q1.isEmpty())
+
+    def test_pqueue(self):
+        q3 = LockedPQueue([('baz', 3), ('foo', 1)])
+        q3.enqueue(('bar', 2))
+
+        self.assertEqual(q3.peek(), ('foo', 1))
+        self.assertEqual(q3.drain(), [('foo', 1), ('bar', 2), ('baz', 3)])
+
+
+class AsyncQueueTest(unittest.TestCase):
+    def test_dequeue(self):
+        q1 = AsyncQueue([1])
+
+        self.assertEqual(asyncio.run(q1.dequeue()), 1)
+        self.assertTrue(q1.isEmpty())
+
+    def test_wait_for_thread(self):
+        q1 = AsyncQueue()
+
+        async def consume():
+            threading.Timer(0.01, q1.enqueue, args=('foo',)).start()
+
+            return await asyncio.wait_for(q1.dequeue(), 5)
+
+        self.assertEqual(asyncio.run(consume()), 'foo')
+
+    def test_cancel(self):
+        q1 = AsyncQueue()
+
+        async def consume():
+            waiter = asyncio.ensure_future(q1.dequeue())
+            await asyncio.sleep(0)
+            waiter.cancel()
+
+            q1.enqueue('foo')
+
+            return await asyncio.wait_for(q1.dequeue(), 5)
+
+        self.assertEqual(asyncio.run(consume()), 'foo')
+
+    def test_drain(self):
+        q1 = AsyncPQueue([('baz', 3), ('foo', 1), ('bar', 2)])
+
+        self.assertEqual(q1.drain(2), [('foo', 1), ('bar', 2)])
+        self.assertEqual(len(q1), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+import random
+import unittest
+from pybox.containers.timerwheel import TimerWheel
+
+
+class TimerWheelTest(unittest.TestCase):
+    def setUp(self):
+        self.fired = []
+        self.w1 = TimerWheel(resolution=0.1)
+
+    def tearDown(self):
+        pass
+
+    def test_schedule(self):
+        self.w1.schedule(0.3, self.fired.append, 'foo')
+        self.w1.schedule(0.1, self.fired.append, 'bar')
+
+        self.assertEqual(len(self.w1), 2)
+        self.assertEqual(self.w1.advance(0.2), 1)
+        self.assertEqual(self.fired, ['bar'])
+        self.assertEqual(self.w1.advance(0.1), 1)
+        self.assertEqual(self.fired, ['bar', 'foo'])
+        self.assertEqual(len(self.w1), 0)
+
+    def test_batch(self):
+        for i in range(100):
+            self.w1.schedule(0.5, self.fired.append, i)
+
+        self.assertEqual(self.w1.advance(1.0), 100)
+        self.assertEqual(self.fired, list(range(100)))
+
+    def test_kwargs(self):
+        self.w1.schedule(0.1, lambda value=None: self.fired.append(value), value='foo')
+        self.w1.advance(0.1)
+
+        self.assertEqual(self.fired, ['foo'])
+
+    def test_cancel(self):
+        t1 = self.w1.schedule(0.1, self.fired.append, 'foo')
+        t2 = self.w1.schedule(0.1, self.fired.append, 'bar')
+
+        self.assertTrue(t1.cancel())
+        self.assertFalse(self.w1.cancel(t1))
+
+        self.w1.advance(0.1)
+
+        self.assertEqual(self.fired, ['bar'])
+        self.assertFalse(t2.active)
+        self.assertFalse(t2.cancel())
+
+    def test_cancel_from_callback(self):
+        timers = []
+        timers.append(self.w1.schedule(0.1, lambda: timers[1].cancel()))
+        timers.append(self.w1.schedule(0.1, self.fired.append, 'foo'))
+
+        self.assertEqual(self.w1.advance(0.1), 1)
+        self.assertEqual(self.fired, [])
+
+    def test_clear(self):
+        t1 = self.w1.schedule(0.1, self.fired.append, 'foo')
+        self.w1.clear()
+        self.w1.advance(1)
+
+        self.assertEqual(len(self.w1), 0)
+        self.assertFalse(t1.active)
+        self.assertEqual(self.fired, [])
+
+    def test_slotsException(self):
+        with self.assertRaises(AttributeError):
+            TimerWheel(slots=100)
+
+    def test_cascade(self):
+        rng      = random.Random(3)
+        w2       = TimerWheel(resolution=1, slots=4, levels=3)
+        expected = {}
+        fired    = {}
+
+        def fire(key):
+            fired[key] = w2.time
+
+        for tick in range(300):
+            for i in range(3):
+                delay = rng.randrange(1, 200)
+                key   = (tick, i)
+                timer = w2.schedule(delay, fire, key)
+
+                expected[key] = (tick + delay, timer)
+
+            for key in rng.sample(sorted(expected), 2):
+                if expected[key][1].cancel():
+                    del expected[key]
+
+            w2.advance(1)
+
+        w2.advance(300)
+
+        self.assertEqual(len(w2), 0)
+        self.assertEqual(fired, {key: when for key, (when, timer) in expected.items()})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import unittest
+from pybox.math.affine2d import Affine2D
+from pybox.math.matrix import Matrix
+from pybox.math.vec2d import Vec2D
+
+
+class Affine2DTest(unittest.TestCase):
+    def setUp(self):
+        self.t1 = Affine2D().translate(3, -2).rotate(30).scale(2, 0.5).shear(0.2, 0.1)
+        self.m1 = Matrix().translate(3, -2).rotate(30).scale(2, 0.5).shear(0.2, 0.1)
+
+    def assertPointEqual(self, p1, p2):
+        self.assertAlmostEqual(p1[0], p2[0])
+        self.assertAlmostEqual(p1[1], p2[1])
+
+    def test_init(self):
+        t1 = Affine2D()
+
+        self.assertEqual(t1.values, (1, 0, 0, 1, 0, 0))
+
+    def test_matches_matrix(self):
+        for x, y in [(0, 0), (1, 2), (-3.5, 4)]:
+            v1 = self.m1 * Vec2D(x, y)
+            self.assertPointEqual(self.t1.transform_point(x, y), (v1.x, v1.y))
+
+        m2 = self.t1.to_matrix()
+
+        for i, value in enumerate(self.m1.as_ctypes()):
+            self.assertAlmostEqual(m2.as_ctypes()[i], value, places=5)
+            self.assertAlmostEqual(self.t1.as_ctypes()[i], value, places=5)
+
+    def test_compose(self):
+        t2 = Affine2D().rotate(45).translate(1, 1)
+        t3 = self.t1 * t2
+
+        for x, y in [(0, 0), (1, 2), (-3.5, 4)]:
+            self.assertPointEqual(t3.transform_point(x, y), self.t1.transform_point(*t2.transform_point(x, y)))
+
+        t4 = self.t1.clone().apply(t2)
+        self.assertEqual(t3, t4)
+
+    def test_invert(self):
+        inverse = self.t1.invert()
+        identity = self.t1 * inverse
+
+        for actual, expected in zip(identity.values, (1, 0, 0, 1, 0, 0)):
+            self.assertAlmostEqual(actual, expected)
+
+        with self.assertRaises(ArithmeticError):
+            Affine2D().scale(0, 1).invert()
+
+    def test_transform_points(self):
+        points = [(0, 0), (1, 2), (-3.5, 4)]
+        result = self.t1.transform_points(points)
+
+        for p1, (x, y) in zip(result, points):
+            self.assertPointEqual(p1, self.t1.transform_point(x, y))
+
+    def test_from_trs(self):
+        t1 = Affine2D.from_trs(10, 20, 90, 2, 2, ox=1, oy=0)
+
+        self.assertPointEqual(t1.transform_point(1, 0), (10, 20))
+        self.assertPointEqual(t1.transform_point(2, 0), (10, 22))
+
+    def test_mul_vec2d(self):
+        v1 = Affine2D().translate(1, 2) * Vec2D(3, 4)
+
+        self.assertEqual(v1, Vec2D(4, 6))
+
+if __name__ == '__main__':
+    unittest.main()
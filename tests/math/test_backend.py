@@ -0,0 +1,131 @@
+import unittest
+from pybox.math import backend, util
+from pybox.math.affine2d import Affine2D
+from pybox.math.matrix import Matrix
+
+
+DOT_CASES = [
+    ([1, 2, 3], [3, 4, 6]),
+    ([0.5, -1.25], [4, 2]),
+    ([], [])
+]
+
+CLAMP_CASES = [
+    (35, 1, 10),
+    (-2.5, 0, 1),
+    (0.5, 1, 0),
+    (7, 7, 7)
+]
+
+MATRICES = [
+    Matrix()._matx,
+    Matrix().translate(3, -2, 1).rotate(30).scale(2, 0.5, 4)._matx,
+    [float(i) for i in range(16)]
+]
+
+POINTS = [(0, 0), (1, 2), (-3.5, 4), (1e6, -1e-6)]
+
+AFFINES = [
+    Affine2D().values,
+    Affine2D.from_trs(10, -5, 30, 2, 0.5, kx=0.2, ky=0.1).values
+]
+
+
+class BackendTest(unittest.TestCase):
+    def tearDown(self):
+        backend.use('python')
+
+    def results(self):
+        return {
+            'dot': [backend.dot(a, b) for a, b in DOT_CASES],
+            'clamp': [backend.clamp(*args) for args in CLAMP_CASES],
+            'mat4_mul': [backend.mat4_mul(a, b) for a in MATRICES for b in MATRICES],
+            'transform_points': [backend.transform_points(t, POINTS) for t in AFFINES]
+        }
+
+    def assertNested(self, actual, expected):
+        if isinstance(expected, (list, tuple)):
+            self.assertEqual(len(actual), len(expected))
+
+            for a, e in zip(actual, expected):
+                self.assertNested(a, e)
+        else:
+            self.assertAlmostEqual(actual, expected, delta=1e-9 * max(1, abs(expected)))
+
+    def test_identical_results(self):
+        backend.use('python')
+        expected = self.results()
+
+        for name in backend.available():
+            with self.subTest(backend=name):
+                backend.use(name)
+
+                for kernel, values in self.results().items():
+                    self.assertNested(values, expected[kernel])
+
+    def test_dispatch(self):
+        calls = []
+
+        class Kernels:
+            @staticmethod
+            def dot(a, b):
+                calls.append('dot')
+                return 0
+
+            clamp = mat4_mul = transform_points = staticmethod(lambda *args: None)
+
+        backend.register('test', lambda: Kernels)
+        self.addCleanup(backend._loaders.pop, 'test')
+        backend.use('test')
+
+        self.assertEqual(backend.current(), 'test')
+        self.assertEqual(util.dot([1], [2]), 0)
+        self.assertEqual(calls, ['dot'])
+
+        backend.use('python')
+        self.assertEqual(util.dot([1], [2]), 2)
+
+    def test_available(self):
+        names = backend.available()
+
+        self.assertIn('python', names)
+        self.assertNotIn('missing', names)
+
+    def test_invalid(self):
+        with self.assertRaises(AttributeError):
+            backend.use('missing')
+
+        backend.register('partial', lambda: object())
+        self.addCleanup(backend._loaders.pop, 'partial')
+
+        with self.assertRaises(AttributeError):
+            backend.use('partial')
+
+        self.assertEqual(backend.current(), 'python')
+
+    def test_compiled(self):
+        if 'compiled' not in backend.available():
+            with self.assertRaises(ImportError):
+                backend.use('compiled')
+
+            self.skipTest('compiled kernels are not built')
+
+        backend.use('compiled')
+
+        self.assertEqual(backend.current(), 'compiled')
+        self.assertEqual(backend.transform_points(AFFINES[1], []), [])
+
+        with self.assertRaises(ValueError):
+            backend.mat4_mul([1, 2], MATRICES[0])
+
+    def test_matrix_uses_backend(self):
+        a = Matrix().translate(1, 2).rotate(45)
+        b = Matrix().scale(2, 3)
+        expected = a * b
+
+        for name in backend.available():
+            backend.use(name)
+            self.assertNested((a * b)._matx, expected._matx)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+import random
+import unittest
+
+import numpy as np
+
+from pybox.math import geometry
+
+
+def point_in_polygon(x, y, polygon):
+    inside = False
+
+    for i in range(len(polygon)):
+        x1, y1 = polygon[i]
+        x2, y2 = polygon[(i + 1) % len(polygon)]
+
+        if (y1 > y) != (y2 > y) and x < x1 + (y - y1) * (x2 - x1) / (y2 - y1):
+            inside = not inside
+
+    return inside
+
+
+class GeometryTest(unittest.TestCase):
+    def setUp(self):
+        self.square = [(0, 0), (4, 0), (4, 4), (0, 4)]
+        self.concave = [(0, 0), (6, 0), (6, 6), (3, 2), (0, 6)]
+
+    def test_signed_area(self):
+        self.assertEqual(geometry.signed_area(self.square), 16)
+        self.assertEqual(geometry.signed_area(self.square[::-1]), -16)
+
+        areas = geometry.signed_area([self.square, [(0, 0), (1, 0), (0, 1), (0, 0)]])
+        np.testing.assert_allclose(areas, [16, 0.5])
+
+    def test_centroid(self):
+        np.testing.assert_allclose(geometry.centroid(self.square), [2, 2])
+        np.testing.assert_allclose(geometry.centroid([(0, 0), (3, 0), (0, 3)]), [1, 1])
+
+        batch = geometry.centroid([self.square, [(0, 0), (1, 1), (2, 2), (3, 3)]])
+        np.testing.assert_allclose(batch, [[2, 2], [1.5, 1.5]])
+
+    def test_points_in_polygon(self):
+        rng    = random.Random(7)
+        points = [(rng.uniform(-1, 7), rng.uniform(-1, 7)) for i in range(500)]
+
+        for polygon in (self.square, self.concave):
+            expected = [point_in_polygon(x, y, polygon) for x, y in points]
+            self.assertListEqual(geometry.points_in_polygon(points, polygon).tolist(), expected)
+
+        self.assertFalse(geometry.points_in_polygon([(3, 4)], self.concave)[0])
+        self.assertTrue(geometry.points_in_polygon([(3, 1)], self.concave)[0])
+
+    def test_points_in_polygons(self):
+        result = geometry.points_in_polygons([(1, 1), (5.5, 5)], [self.square, self.concave])
+
+        self.assertListEqual(result.tolist(), [[True, False], [True, True]])
+
+    def test_segments_intersect(self):
+        a = [
+            ((0, 0), (2, 2)),
+            ((0, 0), (1, 0)),
+            ((0, 0), (2, 0)),
+            ((0, 0), (2, 0)),
+            ((0, 0), (1, 1))
+        ]
+        b = [
+            ((0, 2), (2, 0)),
+            ((2, 1), (3, 1)),
+            ((1, 0), (3, 0)),
+            ((2, 0), (2, 5)),
+            ((2, 2), (3, 3))
+        ]
+
+        result = geometry.segments_intersect(a, b)
+        self.assertListEqual(result.tolist(), [True, False, True, True, False])
+
+        pairs = geometry.segments_intersect(np.array(a)[:, None], np.array(b)[None, :])
+        self.assertEqual(pairs.shape, (5, 5))
+        self.assertListEqual(np.diagonal(pairs).tolist(), result.tolist())
+
+    def test_convex_hull(self):
+        rng    = random.Random(3)
+        points = [(rng.uniform(0, 10), rng.uniform(0, 10)) for i in range(200)]
+        hull   = geometry.convex_hull(points + [(0, 0), (10, 0), (10, 10), (0, 10)])
+
+        self.assertListEqual(hull.tolist(), [[0, 0], [10, 0], [10, 10], [0, 10]])
+        self.assertGreater(geometry.signed_area(hull), 0)
+
+        hull = geometry.convex_hull(points)
+        pts  = np.array(points)
+
+        for (ax, ay), (bx, by) in zip(hull, np.roll(hull, -1, axis=0)):
+            cross = (bx - ax) * (pts[:, 1] - ay) - (by - ay) * (pts[:, 0] - ax)
+            self.assertTrue(np.all(cross >= -1e-9))
+
+if __name__ == '__main__':
+    unittest.main()
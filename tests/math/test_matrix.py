@@ -1,21 +1,181 @@
 import unittest
 from pybox.math.matrix import Matrix
+from pybox.math.vec2d import Vec2D
+
+
+def naive_mul(a, b):
+    return [
+        [sum(a[r, k] * b[k, c] for k in range(4)) for c in range(4)]
+        for r in range(4)
+    ]
+
+
+def temp_matrix(values):
+    matrix = Matrix()
+
+    for r in range(4):
+        for c in range(4):
+            matrix[r, c] = values[r][c]
+
+    return matrix
 
 
 class Vector2Test(unittest.TestCase):
     def test_new(self):
         mat = Matrix()
 
-        self.assertListEqual(mat.matrix[0], [1, 0, 0])
-        self.assertListEqual(mat.matrix[1], [0, 1, 0])
-        self.assertListEqual(mat.matrix[2], [0, 0, 1])
+        self.assertListEqual(mat.getRow(0), [1, 0, 0, 0])
+        self.assertListEqual(mat.getRow(1), [0, 1, 0, 0])
+        self.assertListEqual(mat.getRow(2), [0, 0, 1, 0])
+        self.assertListEqual(mat.getRow(3), [0, 0, 0, 1])
 
     def test_identity(self):
-        mat = Matrix.identity()
+        mat = Matrix.identity(3, 3)
+
+        self.assertListEqual(mat[0:3], [1, 0, 0])
+        self.assertListEqual(mat[3:6], [0, 1, 0])
+        self.assertListEqual(mat[6:9], [0, 0, 1])
+
+    def test_mul_matrix(self):
+        a = Matrix().translate(3, -2).rotate(30).scale(2, 0.5)
+        b = Matrix().shear(0.2, 0.1).translate(1, 4, 2)
+
+        result = a * b
+
+        self.assertIsInstance(result, Matrix)
+
+        for r, row in enumerate(naive_mul(a, b)):
+            for c, value in enumerate(row):
+                self.assertAlmostEqual(result[r, c], value)
+
+    def test_mul_generic(self):
+        a = Matrix(2, 3)
+        b = Matrix(3, 2)
+        a[0, 2] = 5
+
+        result = a * b
+
+        self.assertListEqual(result.getRow(0), [1, 0])
+        self.assertListEqual(result.getRow(1), [0, 1])
+
+        with self.assertRaises(ArithmeticError):
+            a * a
+
+    def test_mul_scalar(self):
+        result = Matrix() * 2
+
+        self.assertListEqual(result.getRow(0), [2, 0, 0, 0])
+
+    def test_inplace_matches_product(self):
+        ops = [
+            ('translate', (3, -2, 1)),
+            ('rotate', (30,)),
+            ('rotate', (45, 1, 0, 0)),
+            ('scale', (2, 0.5, 3)),
+            ('shear', (0.2, 0.1))
+        ]
+
+        for name, args in ops:
+            base = Matrix().translate(1, 2).rotate(10)
+            step = Matrix()
+
+            if name == 'translate':
+                values = [[1, 0, 0, args[0]], [0, 1, 0, args[1]], [0, 0, 1, args[2]], [0, 0, 0, 1]]
+            elif name == 'scale':
+                values = [[args[0], 0, 0, 0], [0, args[1], 0, 0], [0, 0, args[2], 0], [0, 0, 0, 1]]
+            elif name == 'shear':
+                values = [[1, args[0], 0, 0], [args[1], 1, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]]
+            else:
+                step.rotate(*args)
+                values = [step.getRow(r) for r in range(4)]
+
+            expected = naive_mul(base, temp_matrix(values))
+            getattr(base, name)(*args)
+
+            for r in range(4):
+                for c in range(4):
+                    self.assertAlmostEqual(base[r, c], expected[r][c])
+
+    def test_mul_vec2d(self):
+        v1 = Matrix().translate(10, 20).rotate(90) * Vec2D(1, 0)
+
+        self.assertAlmostEqual(v1.x, 10)
+        self.assertAlmostEqual(v1.y, 21)
+
+    def test_as_ctypes(self):
+        mat = Matrix().translate(10, 20).scale(2, 3)
+        data = list(mat.as_ctypes())
+
+        self.assertEqual(len(data), 16)
+        self.assertListEqual(data[0:4], [2, 0, 0, 0])
+        self.assertListEqual(data[12:16], [10, 20, 0, 1])
+        self.assertListEqual(mat.buffer.tolist(), data)
+
+    def test_transpose_clone(self):
+        mat = Matrix().translate(10, 20)
+        copy = mat.clone()
+
+        self.assertEqual(mat, copy)
+        self.assertListEqual(mat.transpose().getRow(3), [10, 20, 0, 1])
+
+        copy.scale(2, 2)
+        self.assertNotEqual(mat, copy)
+
+    def assertIdentity(self, matrix):
+        size = matrix._rows
+
+        for r in range(size):
+            for c in range(size):
+                self.assertAlmostEqual(matrix[r, c], 1 if r == c else 0)
+
+    def test_inverse_affine(self):
+        mat = Matrix().translate(3, -2, 1).rotate(30).rotate(20, 1, 0, 0).scale(2, 0.5, 4).shear(0.2, 0.1)
+
+        self.assertIdentity(mat * mat.inverse())
+        self.assertIdentity(mat.inverse() * mat)
+
+    def test_inverse_general(self):
+        mat = temp_matrix([[2, 0, 1, 3], [1, 1, 0, 2], [0, 4, 1, 1], [1, 0, 2, 5]])
+
+        self.assertAlmostEqual(mat.determinant(), 24)
+        self.assertIdentity(mat * mat.inverse())
+
+    def test_inverse_generic_size(self):
+        mat = Matrix(3, 3)
+        mat[0, 1] = 2
+        mat[2, 0] = -1
+        mat[1, 1] = 3
+
+        self.assertAlmostEqual(mat.determinant(), 3)
+        self.assertIdentity(mat * mat.inverse())
+
+        with self.assertRaises(ArithmeticError):
+            Matrix(2, 3).inverse()
+
+    def test_inverse_singular(self):
+        with self.assertRaises(ArithmeticError):
+            Matrix().scale(0, 1).inverse()
+
+        with self.assertRaises(ArithmeticError):
+            temp_matrix([[1, 2, 3, 4]] * 4).inverse()
+
+        self.assertEqual(Matrix().scale(0, 1).determinant(), 0)
+
+    def test_inverse_cache(self):
+        mat = Matrix().translate(10, 20)
+        inv = mat.inverse()
+
+        self.assertEqual(inv[0, 3], -10)
+        self.assertIsNot(mat.inverse(), inv)
+
+        inv.scale(5, 5)
+        self.assertEqual(mat.inverse()[0, 0], 1)
+
+        mat.translate(5, 0)
+        self.assertEqual(mat.inverse()[0, 3], -15)
 
-        self.assertListEqual(mat[0], [1, 0, 0])
-        self.assertListEqual(mat[1], [0, 1, 0])
-        self.assertListEqual(mat[2], [0, 0, 1])
+        mat[1, 3] = 0
+        self.assertEqual(mat.inverse()[1, 3], 0)
 
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    unittest.main()
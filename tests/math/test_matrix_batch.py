@@ -0,0 +1,95 @@
+import unittest
+
+import numpy as np
+
+from pybox.math.affine2d import Affine2D
+from pybox.math.matrix import Matrix
+from pybox.math.matrix_batch import MatrixBatch
+
+
+class MatrixBatchTest(unittest.TestCase):
+    def setUp(self):
+        self.params = [
+            (0, 0, 0, 1, 1, 0, 0),
+            (10, -5, 30, 2, 0.5, 0.2, 0.1),
+            (-3, 7, 135, 1.5, 3, 0, 0.4)
+        ]
+        self.affines = [Affine2D.from_trs(x, y, r, sx, sy, kx=kx, ky=ky) for x, y, r, sx, sy, kx, ky in self.params]
+        self.b1 = MatrixBatch.from_trs(*np.array(self.params).T)
+
+    def test_from_trs(self):
+        self.assertEqual(len(self.b1), 3)
+        self.assertEqual(self.b1.matrices.shape, (3, 3, 3))
+
+        for i, affine in enumerate(self.affines):
+            np.testing.assert_allclose(self.b1.affine(i).values, affine.values, atol=1e-12)
+
+        b2 = MatrixBatch.from_trs([1, 2], [3, 4], 0, ox=1, oy=1)
+        np.testing.assert_allclose(b2.matrices[:, :2, 2], [[0, 2], [1, 3]])
+
+    def test_from_affines(self):
+        b2 = MatrixBatch.from_affines(self.affines)
+
+        np.testing.assert_allclose(b2.matrices, self.b1.matrices, atol=1e-12)
+
+    def test_multiply(self):
+        b2 = self.b1 @ self.b1.inverse()
+
+        np.testing.assert_allclose(b2.matrices, MatrixBatch.identity(3).matrices, atol=1e-12)
+
+        b3 = self.b1 @ MatrixBatch.from_trs(1, 2)
+        for i, affine in enumerate(self.affines):
+            np.testing.assert_allclose(b3.affine(i).values, affine.clone().translate(1, 2).values, atol=1e-12)
+
+    def test_inverse(self):
+        inverse = self.b1.inverse()
+
+        for i, affine in enumerate(self.affines):
+            np.testing.assert_allclose(inverse.affine(i).values, affine.invert().values, atol=1e-12)
+
+        with self.assertRaises(ArithmeticError):
+            MatrixBatch.from_trs([0, 1], [0, 1], sx=[1, 0]).inverse()
+
+    def test_inverse_4x4(self):
+        matrix = Matrix().translate(1, 2, 3).rotate(20, 1, 0, 0).scale(2, 3, 4)
+        values = np.array(matrix._matx, dtype=float).reshape(4, 4)
+        batch  = MatrixBatch(np.stack([values, np.eye(4)]))
+
+        np.testing.assert_allclose(
+            batch.inverse().matrices[0],
+            np.array(matrix.inverse()._matx, dtype=float).reshape(4, 4),
+            atol=1e-12
+        )
+
+    def test_transform_points(self):
+        points = [(0, 0), (1, 2), (-3, 0.5)]
+        result = self.b1.transform_points(points)
+
+        self.assertEqual(result.shape, (3, 3, 2))
+
+        for i, affine in enumerate(self.affines):
+            np.testing.assert_allclose(result[i], affine.transform_points(points), atol=1e-12)
+
+        per_instance = np.arange(18, dtype=float).reshape(3, 3, 2)
+        out = np.empty((3, 3, 2))
+        result = self.b1.transform_points(per_instance, out=out)
+
+        self.assertIs(result, out)
+        for i, affine in enumerate(self.affines):
+            np.testing.assert_allclose(out[i], affine.transform_points(per_instance[i].tolist()), atol=1e-12)
+
+    def test_as_gl(self):
+        gl = self.b1.as_gl()
+
+        self.assertEqual(gl.shape, (3, 16))
+        self.assertEqual(gl.dtype, np.float32)
+
+        for i, affine in enumerate(self.affines):
+            np.testing.assert_allclose(gl[i], list(affine.as_ctypes()), atol=1e-6)
+
+    def test_invalid(self):
+        with self.assertRaises(AttributeError):
+            MatrixBatch(np.zeros((2, 2, 3)))
+
+if __name__ == '__main__':
+    unittest.main()
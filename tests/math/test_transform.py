@@ -0,0 +1,85 @@
+import unittest
+from pybox.math.matrix import Matrix
+from pybox.math.transform import Transform
+
+
+class TransformTest(unittest.TestCase):
+    def setUp(self):
+        self.t1 = Transform(3, -2, 1, 30, 2, 0.5, 4, 0.2, 0.1)
+
+    def assertIdentity(self, matrix):
+        identity = Matrix()
+
+        for r in range(4):
+            for c in range(4):
+                self.assertAlmostEqual(matrix[r, c], identity[r, c])
+
+    def test_matrix_matches_eager(self):
+        expected = Matrix() \
+            .translate(3, -2, 1) \
+            .rotate(30) \
+            .scale(2, 0.5, 4) \
+            .shear(0.2, 0.1)
+
+        self.assertEqual(self.t1.matrix, expected)
+
+    def test_matrix_is_cached(self):
+        m1 = self.t1.matrix
+
+        self.assertIs(self.t1.matrix, m1)
+
+        self.t1.x = 3
+        self.assertIs(self.t1.matrix, m1)
+
+        self.t1.x = 5
+        self.assertIsNot(self.t1.matrix, m1)
+        self.assertEqual(self.t1.matrix[0, 3], 5)
+
+    def test_version(self):
+        v1 = self.t1.version
+
+        self.t1.angle = 30
+        self.assertEqual(self.t1.version, v1)
+
+        self.t1.angle = 45
+        self.t1.translate(1, 1)
+        self.assertEqual(self.t1.version, v1 + 2)
+
+    def test_explicit_ops(self):
+        expected = self.t1.matrix.clone().translate(1, 2).rotate(15)
+
+        self.t1.translate(1, 2)
+        self.t1.rotate(15)
+
+        for r in range(4):
+            for c in range(4):
+                self.assertAlmostEqual(self.t1.matrix[r, c], expected[r, c])
+
+    def test_matrix_setter(self):
+        m1 = Matrix().translate(7, 8)
+        self.t1.matrix = m1
+
+        self.assertEqual(self.t1.matrix, m1)
+        self.assertIsNot(self.t1.matrix, m1)
+        self.assertEqual((self.t1.x, self.t1.y, self.t1.sx), (0, 0, 1))
+
+    def test_inverse(self):
+        self.assertIdentity(self.t1.matrix * self.t1.inverse())
+        self.assertIsNot(self.t1.inverse(), self.t1.inverse())
+
+        inverse = self.t1.inverse()
+        inverse.translate(5, 5)
+        self.assertIdentity(self.t1.matrix * self.t1.inverse())
+
+        with self.assertRaises(ArithmeticError):
+            Transform(sx=0).inverse()
+
+    def test_clone(self):
+        t2 = self.t1.clone()
+        t2.x = 10
+
+        self.assertEqual(self.t1.x, 3)
+        self.assertNotEqual(self.t1.matrix, t2.matrix)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,168 @@
+import math
+import random
+import unittest
+
+import numpy as np
+
+from pybox.math import geometry, triangulate
+from pybox.math.geometry import signed_area as area
+
+
+def star(rng, count, radius=(5, 10), cx=0, cy=0):
+    polygon = []
+
+    for k in range(count):
+        angle = 2 * math.pi * (k + rng.uniform(0, 0.5)) / count
+        r     = rng.uniform(*radius)
+        polygon.append((cx + r * math.cos(angle), cy + r * math.sin(angle)))
+
+    return polygon
+
+
+def crossing(a, b):
+    ea = np.array([(a[i - 1], a[i]) for i in range(len(a))])
+    eb = np.array([(b[i - 1], b[i]) for i in range(len(b))])
+
+    return geometry.segments_intersect(ea[:, None], eb[None, :]).any()
+
+
+def disjoint(a, b):
+    return not crossing(a, b) and \
+        not geometry.points_in_polygon(a[:1], b)[0] and \
+        not geometry.points_in_polygon(b[:1], a)[0]
+
+
+def random_holes(rng, outer, attempts):
+    holes = []
+
+    for i in range(attempts):
+        hole = star(rng, rng.randint(3, 7), (0.2, 1.5), rng.uniform(-8, 8), rng.uniform(-8, 8))
+
+        if rng.random() < 0.5:
+            hole.reverse()
+
+        inside = geometry.points_in_polygon(hole, outer).all() and not crossing(hole, outer)
+
+        if inside and all(disjoint(hole, other) for other in holes):
+            holes.append(hole)
+
+    return holes
+
+
+def circle(cx, cy, r, count):
+    return [
+        (cx + r * math.cos(2 * math.pi * k / count), cy + r * math.sin(2 * math.pi * k / count))
+        for k in range(count)
+    ]
+
+
+class TriangulateTest(unittest.TestCase):
+    def setUp(self):
+        triangulate.clear_cache()
+
+        self.rng    = random.Random(5)
+        self.square = [(0, 0), (4, 0), (4, 4), (0, 4)]
+
+    def assertTriangulation(self, outer, holes=None):
+        points  = outer + [point for hole in holes or () for point in hole]
+        indices = triangulate.triangulate(outer, holes)
+
+        self.assertEqual(len(indices) % 3, 0)
+        self.assertEqual(len(indices) // 3, len(outer) - 2 + sum(len(hole) + 2 for hole in holes or ()))
+
+        triangles = [[points[i] for i in indices[k:k + 3]] for k in range(0, len(indices), 3)]
+
+        for triangle in triangles:
+            self.assertGreater(area(triangle), 0)
+
+        expected = abs(area(outer)) - sum(abs(area(hole)) for hole in holes or ())
+        self.assertAlmostEqual(sum(area(triangle) for triangle in triangles), expected)
+
+    def test_convex(self):
+        self.assertEqual(triangulate.triangulate(self.square), (3, 0, 1, 1, 2, 3))
+        self.assertTriangulation(circle(0, 0, 5, 30))
+
+    def test_concave(self):
+        for i in range(50):
+            polygon = star(self.rng, self.rng.randint(3, 40))
+            self.assertTriangulation(polygon if i % 2 else polygon[::-1])
+
+    def test_holes(self):
+        for i in range(50):
+            outer = star(self.rng, self.rng.randint(8, 40))
+            holes = [circle(1.5, 0, 1, self.rng.randint(3, 8))]
+
+            if i % 2:
+                holes.append(circle(-2, 0.5, 1, 5)[::-1])
+
+            self.assertTriangulation(outer, holes)
+
+    def test_many_holes(self):
+        counts = set()
+
+        for i in range(200):
+            outer = star(self.rng, self.rng.randint(3, 30), (4, 10))
+            holes = random_holes(self.rng, outer if i % 2 else outer[::-1], self.rng.randint(2, 12))
+            counts.add(len(holes))
+
+            self.assertTriangulation(outer if i % 2 else outer[::-1], holes)
+
+        self.assertTrue({2, 3, 4} <= counts, counts)
+
+    def test_bridge_duplicates(self):
+        outer = [(-3, -3), (3, -3), (3, 3), (-3, 3)]
+        holes = [
+            [(-0.89, 0.25), (-1.31, 0.29), (-1.42, -0.25), (-0.9, -0.18)],
+            [(1.3, 0.18), (0.99, 0.04), (1.4, -0.36)]
+        ]
+
+        self.assertTriangulation(outer, holes)
+
+        parts = triangulate.decompose(outer, holes)
+        self.assertAlmostEqual(sum(area(part) for part in parts), area(outer) - sum(abs(area(hole)) for hole in holes))
+
+    def test_degenerate(self):
+        indices = triangulate.triangulate([(0, 0), (1, 0), (2, 0), (2, 2), (0, 2)])
+
+        self.assertEqual(len(indices), 9)
+
+        with self.assertRaises(ArithmeticError):
+            triangulate.triangulate([(0, 0), (2, 2), (2, 0), (0, 2)])
+
+    def test_hole_outside(self):
+        with self.assertRaises(ArithmeticError):
+            triangulate.triangulate(self.square, [circle(10, 2, 1, 4)])
+
+    def test_decompose(self):
+        for i in range(30):
+            outer = star(self.rng, self.rng.randint(3, 30))
+            holes = [circle(1.5, 0, 1, 6)] if i % 2 else None
+            parts = triangulate.decompose(outer, holes)
+
+            for part in parts:
+                for k in range(len(part)):
+                    a, b, c = part[k - 1], part[k], part[(k + 1) % len(part)]
+                    self.assertGreaterEqual((b[0] - a[0]) * (c[1] - a[1]) - (b[1] - a[1]) * (c[0] - a[0]), -1e-9)
+
+            expected = abs(area(outer)) - (abs(area(holes[0])) if holes else 0)
+            self.assertAlmostEqual(sum(area(part) for part in parts), expected)
+            self.assertLessEqual(len(parts), len(outer) - 2 + (8 if holes else 0))
+
+        self.assertEqual(len(triangulate.decompose(self.square)), 1)
+
+    def test_cache(self):
+        indices = triangulate.triangulate(self.square)
+
+        self.assertIs(triangulate.triangulate([(0.0, 0.0), (4, 0), (4, 4), (0, 4)]), indices)
+        self.assertIsNot(triangulate.triangulate(self.square[::-1]), indices)
+
+        triangulate.clear_cache()
+        self.assertIsNot(triangulate.triangulate(self.square), indices)
+
+    def test_fan(self):
+        self.assertEqual(triangulate.fan(3), (0, 1, 2))
+        self.assertEqual(triangulate.fan(6), (0, 1, 2, 0, 2, 3, 0, 3, 4, 0, 4, 5))
+        self.assertIs(triangulate.fan(6), triangulate.fan(6))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,216 @@
+import unittest
+
+import numpy as np
+import pyglet
+
+from pybox.app.registry import Registry
+from pybox.app.window import GameWindow
+from pybox.graphics.drawables import shape2d
+from pybox.math import tween
+from pybox.math.vec2d import Vec2D
+
+
+class Sprite:
+    def __init__(self):
+        self.position = Vec2D(0, 0)
+        self.rotation = 0
+        self.cell     = (0, 1000)
+        self.flags    = (True, False)
+        self._color   = (0, 0, 0, 255)
+
+    @property
+    def color(self):
+        return self._color
+
+    @color.setter
+    def color(self, value):
+        self._color = value
+
+
+class TweenEngineTest(unittest.TestCase):
+    def setUp(self):
+        self.engine = tween.TweenEngine(capacity=2)
+        self.sprite = Sprite()
+
+    def test_vector(self):
+        position = self.sprite.position
+        self.engine.to(self.sprite, 'position', Vec2D(10, -20), 2.0)
+
+        self.engine.advance(0.5)
+        self.assertIs(self.sprite.position, position)
+        self.assertEqual((position.x, position.y), (2.5, -5.0))
+
+        self.assertEqual(self.engine.advance(1.5), 1)
+        self.assertEqual((position.x, position.y), (10, -20))
+        self.assertEqual(len(self.engine), 0)
+
+    def test_scalar_and_color(self):
+        self.engine.to(self.sprite, 'rotation', 90, 1.0, easing='in_quad')
+        self.engine.to(self.sprite, 'color', (255, 128, 0, 0), 1.0)
+
+        self.engine.advance(0.5)
+        self.assertAlmostEqual(self.sprite.rotation, 22.5)
+        self.assertEqual(self.sprite.color, (128, 64, 0, 128))
+        self.assertTrue(all(isinstance(v, int) for v in self.sprite.color))
+
+        self.engine.advance(0.5)
+        self.assertEqual(self.sprite.rotation, 90)
+        self.assertEqual(self.sprite.color, (255, 128, 0, 0))
+
+    def test_easings(self):
+        t = np.linspace(0, 1, 11)
+
+        for name, easing in tween.EASINGS.items():
+            values = easing(t)
+
+            self.assertAlmostEqual(values[0], 0, msg=name)
+            self.assertAlmostEqual(values[-1], 1, msg=name)
+
+        with self.assertRaises(AttributeError):
+            self.engine.to(self.sprite, 'rotation', 1, 1.0, easing='bounce')
+
+    def test_many(self):
+        sprites = [Sprite() for i in range(500)]
+        easings = list(tween.EASINGS)
+
+        for i, sprite in enumerate(sprites):
+            self.engine.to(sprite, 'position', (i, 2 * i), 1.0 + i % 7, easing=easings[i % len(easings)])
+
+        self.assertEqual(len(self.engine), 500)
+
+        for i in range(10):
+            self.engine.advance(0.25)
+
+        self.assertEqual(len(self.engine), 500 - sum(1 for i in range(500) if 1.0 + i % 7 <= 2.5))
+
+        for i, sprite in enumerate(sprites):
+            t        = min(2.5 / (1.0 + i % 7), 1.0)
+            expected = tween.EASINGS[easings[i % len(easings)]](np.array(t))
+
+            self.assertAlmostEqual(sprite.position.x, i * expected)
+            self.assertAlmostEqual(sprite.position.y, 2 * i * expected)
+
+    def test_cancel(self):
+        t1 = self.engine.to(self.sprite, 'rotation', 90, 1.0)
+        t2 = self.engine.to(self.sprite, 'position', (10, 10), 1.0)
+
+        self.engine.advance(0.5)
+        self.assertTrue(t1.cancel())
+        self.assertFalse(t1.cancel())
+        self.assertFalse(t1.active)
+        self.assertIn(t2, self.engine)
+
+        self.engine.advance(0.25)
+        self.assertEqual(self.sprite.rotation, 45)
+        self.assertEqual(self.sprite.position.x, 7.5)
+        self.assertEqual(t2.progress, 0.75)
+
+        self.engine.clear()
+        self.assertFalse(t2.active)
+        self.assertEqual(self.engine.advance(1.0), 0)
+
+    def test_replace(self):
+        t1 = self.engine.to(self.sprite, 'rotation', 90, 1.0)
+        self.engine.advance(0.5)
+
+        t2 = self.engine.to(self.sprite, 'rotation', 0, 1.0)
+
+        self.assertFalse(t1.active)
+        self.assertEqual(len(self.engine), 1)
+
+        self.engine.advance(0.5)
+        self.assertEqual(self.sprite.rotation, 22.5)
+
+    def test_callback(self):
+        done = []
+
+        def chain(target):
+            done.append(target)
+            self.engine.to(target, 'rotation', 0, 1.0)
+
+        self.engine.to(self.sprite, 'rotation', 10, 1.0, callback=chain)
+
+        self.assertEqual(self.engine.advance(1.0), 1)
+        self.assertEqual(done, [self.sprite])
+        self.assertEqual(len(self.engine), 1)
+
+    def test_int_tuple(self):
+        self.engine.to(self.sprite, 'cell', (3, 0), 2.0)
+        self.engine.advance(0.5)
+
+        self.assertEqual(self.sprite.cell, (0.75, 750.0))
+
+    def test_kind(self):
+        self.sprite.cell = (10, 20, 30)
+        self.engine.to(self.sprite, 'cell', (11, 20, 30), 2.0, kind='tuple')
+        self.engine.advance(0.5)
+
+        self.assertEqual(self.sprite.cell, (10.25, 20.0, 30.0))
+
+        self.sprite.cell = (0, 0, 1000)
+        self.engine.to(self.sprite, 'cell', (3, 0, 1000), 2.0, kind='color')
+        self.engine.advance(0.5)
+
+        self.assertEqual(self.sprite.cell, (1, 0, 1000))
+
+        self.sprite.color = (0.0, 0.0, 0.0)
+        self.engine.to(self.sprite, 'color', (3, 0, 255), 2.0)
+        self.engine.advance(0.5)
+
+        self.assertEqual(self.sprite.color, (1, 0, 64))
+
+    def test_invalid(self):
+        with self.assertRaises(AttributeError):
+            self.engine.to(self.sprite, 'rotation', 1, 0)
+
+        with self.assertRaises(AttributeError):
+            self.engine.to(self.sprite, 'color', (1, 2), 1.0)
+
+        with self.assertRaises(AttributeError):
+            self.engine.to(self.sprite, 'flags', (False, True), 1.0)
+
+        with self.assertRaises(AttributeError):
+            self.engine.to(self.sprite, 'cell', (3, 0), 1.0, kind='vector')
+
+        with self.assertRaises(AttributeError):
+            self.engine.to(self.sprite, 'rotation', 1, 1.0, kind='color')
+
+        with self.assertRaises(AttributeError):
+            self.engine.to(self.sprite, 'position', Vec2D(1, 1), 1.0, kind='tuple')
+
+
+class GameWindowTweenTest(unittest.TestCase):
+    def setUp(self):
+        self.registry = Registry()
+        self.window   = GameWindow(self.registry, width=64, height=64, visible=False)
+        self.batch    = pyglet.graphics.Batch()
+        self.circle   = shape2d.Circle(0, 0, 5, mode="fill", batch=self.batch)
+
+        self.addCleanup(self.window.close)
+        self.addCleanup(self.circle.delete)
+
+    def test_on_update(self):
+        position = self.circle.position
+        tweens   = self.registry.tweens
+
+        tweens.to(self.circle, 'position', (10, 20), 1.0)
+        tweens.to(self.circle, 'rotation', 90, 1.0)
+        tweens.to(self.circle, 'color', (0, 0, 255, 0), 1.0)
+
+        self.window.on_update(0.5)
+
+        self.assertIs(self.circle.position, position)
+        self.assertEqual((position.x, position.y), (5, 10))
+        self.assertEqual(self.circle.rotation, 45)
+        self.assertEqual(self.circle.color, (128, 128, 255, 128))
+        self.assertEqual(list(self.circle._vertex_list.colors[:4]), [128, 128, 255, 128])
+
+        self.window.on_update(0.5)
+
+        self.assertEqual((self.circle.x, self.circle.y), (10, 20))
+        self.assertEqual(self.circle.rotation, 90)
+        self.assertEqual(self.circle.color, (0, 0, 255, 0))
+        self.assertEqual(len(tweens), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,11 +1,12 @@
+import pickle
 import unittest
-from pybox.math.vec2d import Vec2d
+from pybox.math.vec2d import Vec2D, FrozenVec2D, Cell2D
 
 
 class Vector2Test(unittest.TestCase):
     def setUp(self):
-        self.v1 = Vec2d(1, 2)
-        self.v2 = Vec2d(3, 4)
+        self.v1 = Vec2D(1, 2)
+        self.v2 = Vec2D(3, 4)
 
     def tearDown(self):
         pass
@@ -40,9 +41,9 @@ class Vector2Test(unittest.TestCase):
         self.assertAlmostEqual(self.v1.distance(self.v2), 2.828, places=3)
 
     def test_lerp(self):
-        self.assertEqual(self.v1.lerp(self.v2, 0.25), Vec2d(1.5, 2.5))
-        self.assertEqual(self.v1.lerp(self.v2, 0.5), Vec2d(2, 3))
-        self.assertEqual(self.v1.lerp(self.v2, 0.75), Vec2d(2.5, 3.5))
+        self.assertEqual(self.v1.lerp(self.v2, 0.25), Vec2D(1.5, 2.5))
+        self.assertEqual(self.v1.lerp(self.v2, 0.5), Vec2D(2, 3))
+        self.assertEqual(self.v1.lerp(self.v2, 0.75), Vec2D(2.5, 3.5))
 
     def test_lerpException(self):
         with self.assertRaises(Exception) as context:
@@ -51,11 +52,11 @@ class Vector2Test(unittest.TestCase):
             self.assertTrue('Second argument must be a float value between 0 and 1.0.' in context.exception)
 
     def test_normalize(self):
-        v3 = Vec2d(0, 0)
+        v3 = Vec2D(0, 0)
 
-        self.assertAlmostEqual(self.v1.normalize(), Vec2d(0.447, 0.894), places=3)
-        self.assertAlmostEqual(self.v2.normalize(), Vec2d(0.6, 0.8))
-        self.assertEqual(v3.normalize(), Vec2d(0, 0))
+        self.assertAlmostEqual(self.v1.normalize(), Vec2D(0.447, 0.894), places=3)
+        self.assertAlmostEqual(self.v2.normalize(), Vec2D(0.6, 0.8))
+        self.assertEqual(v3.normalize(), Vec2D(0, 0))
 
     def test_dot(self):
         self.assertEqual(self.v1.dot(self.v2), 11)
@@ -92,13 +93,65 @@ class Vector2Test(unittest.TestCase):
         self.assertTrue(v3.x == 3 and v3.y == 2)
 
     def test_divException(self):
-        v1 = Vec2d(2, 4)
-        v2 = Vec2d(0, 0)
+        v1 = Vec2D(2, 4)
+        v2 = Vec2D(0, 0)
 
         with self.assertRaises(ZeroDivisionError) as context:
             v3 = v1 / v2
 
-            self.assertTrue('Right-hand side Vec2d contains a 0. Cannot divide by 0.' in context.exception)
+            self.assertTrue('Right-hand side Vec2D contains a 0. Cannot divide by 0.' in context.exception)
+
+    def test_copy_independent(self):
+        v3 = self.v1.copy()
+        v3.x = 10
+
+        self.assertEqual(self.v1.x, 1)
+
+    def test_slots(self):
+        with self.assertRaises(AttributeError):
+            self.v1.z = 1
+
+    def test_iadd(self):
+        v3 = self.v1
+        v3 += self.v2
+
+        self.assertTrue(v3 is self.v1)
+        self.assertTrue(self.v1.x == 4 and self.v1.y == 6)
+
+        v3 -= self.v2
+
+        self.assertTrue(self.v1.x == 1 and self.v1.y == 2)
+
+    def test_imul(self):
+        v3 = self.v1
+        v3 *= 2
+
+        self.assertTrue(v3 is self.v1)
+        self.assertTrue(self.v1.x == 2 and self.v1.y == 4)
+
+        v3 *= self.v2
+
+        self.assertTrue(self.v1.x == 6 and self.v1.y == 16)
+
+    def test_itruediv(self):
+        v3 = self.v2
+        v3 /= 2
+
+        self.assertTrue(v3 is self.v2)
+        self.assertTrue(self.v2.x == 1.5 and self.v2.y == 2)
+
+        with self.assertRaises(ZeroDivisionError):
+            v3 /= 0
+
+    def test_set(self):
+        self.assertTrue(self.v1.set(5, 6) is self.v1)
+        self.assertTrue(self.v1.x == 5 and self.v1.y == 6)
+
+    def test_add_scaled(self):
+        self.v1.add_scaled(self.v2, 2)
+
+        self.assertTrue(self.v1.x == 7 and self.v1.y == 10)
+        self.assertTrue(self.v2.x == 3 and self.v2.y == 4)
 
     def test_lt(self):
         self.assertTrue(self.v1 < self.v2)
@@ -108,11 +161,124 @@ class Vector2Test(unittest.TestCase):
 
     def test_eq(self):
         self.assertFalse(self.v1 == self.v2)
-        self.assertTrue(self.v1 == Vec2d(1, 2))
+        self.assertTrue(self.v1 == Vec2D(1, 2))
 
     def test_ne(self):
         self.assertTrue(self.v1 != self.v2)
-        self.assertFalse(self.v1 != Vec2d(1, 2))
+        self.assertFalse(self.v1 != Vec2D(1, 2))
+
+
+class PooledVec2DTest(unittest.TestCase):
+    def test_acquire(self):
+        class Sub(Vec2D):
+            pass
+
+        v1 = Sub.acquire(1, 2)
+        self.assertIsInstance(v1, Sub)
+        v1.release()
+
+        v2 = Vec2D.acquire(3, 4)
+        v2.release()
+
+        with self.assertRaises(AttributeError):
+            v2.release()
+
+
+class FrozenVec2DTest(unittest.TestCase):
+    def setUp(self):
+        self.f1 = FrozenVec2D(1, 2)
+        self.f2 = FrozenVec2D(3, 4)
+
+    def test_init(self):
+        self.assertEqual((self.f1.x, self.f1.y), (1, 2))
+        self.assertEqual(FrozenVec2D(), (0, 0))
+
+    def test_immutable(self):
+        with self.assertRaises(AttributeError):
+            self.f1.x = 5
+
+        with self.assertRaises(AttributeError):
+            self.f1.z = 5
+
+    def test_hashable(self):
+        visited = {self.f1, FrozenVec2D(1, 2), self.f2}
+
+        self.assertEqual(len(visited), 2)
+        self.assertIn((1, 2), visited)
+        self.assertEqual(hash(self.f1), hash((1, 2)))
+
+    def test_conversion(self):
+        v1 = self.f1.thaw()
+        v1.x = 10
+
+        self.assertEqual(v1, Vec2D(10, 2))
+        self.assertEqual(self.f1.x, 1)
+        self.assertEqual(Vec2D(3, 4).freeze(), self.f2)
+
+    def test_arithmetic(self):
+        self.assertEqual(self.f1 + self.f2, (4, 6))
+        self.assertEqual(self.f2 - self.f1, (2, 2))
+        self.assertEqual(self.f1 * 3, (3, 6))
+        self.assertEqual(3 * self.f1, (3, 6))
+        self.assertEqual(self.f1 * self.f2, (3, 8))
+        self.assertEqual(self.f2 / 2, (1.5, 2))
+        self.assertEqual(-self.f1, (-1, -2))
+        self.assertIsInstance(self.f1 + self.f2, FrozenVec2D)
+
+    def test_reflected(self):
+        self.assertEqual((3, 4) + self.f1, (4, 6))
+        self.assertEqual((3, 4) - self.f1, (2, 2))
+        self.assertEqual(sum([self.f1, self.f2]), (4, 6))
+        self.assertIsInstance((3, 4) + self.f1, FrozenVec2D)
+        self.assertIsInstance(sum([self.f1, self.f2]), FrozenVec2D)
+        self.assertEqual(Vec2D(3, 4) + self.f1, Vec2D(4, 6))
+        self.assertEqual(Vec2D(3, 4) - self.f1, Vec2D(2, 2))
+
+    def test_measures(self):
+        self.assertAlmostEqual(self.f2.length(), 5)
+        self.assertAlmostEqual(self.f1.distance(self.f2), 2.828, places=3)
+        self.assertEqual(self.f1.dot(self.f2), 11)
+
+    def test_pickle(self):
+        self.assertEqual(pickle.loads(pickle.dumps(self.f1)), self.f1)
+        self.assertIs(pickle.loads(pickle.dumps(Cell2D(7, 8))), Cell2D(7, 8))
+
+
+class Cell2DTest(unittest.TestCase):
+    def setUp(self):
+        Cell2D.clear_interned()
+
+    def tearDown(self):
+        Cell2D.clear_interned()
+
+    def test_interned(self):
+        self.assertIs(Cell2D(1, 2), Cell2D(1, 2))
+        self.assertIs(Cell2D.from_point(15, 29.9, 10), Cell2D(1, 2))
+        self.assertIs(Cell2D.from_point(-0.5, -10, 10), Cell2D(-1, -1))
+        self.assertIs(Cell2D(-0.5, 0.5), Cell2D(-1, 0))
+        self.assertIs(Cell2D(-0.5, 0), Cell2D.from_point(-0.5, 0, 1))
+        self.assertEqual(Cell2D(1, 2), FrozenVec2D(1, 2))
+
+    def test_intern_limit(self):
+        limit = Cell2D.INTERN_LIMIT
+        Cell2D.INTERN_LIMIT = 1
+
+        try:
+            c1 = Cell2D(0, 0)
+
+            self.assertIs(Cell2D(0, 0), c1)
+            self.assertIsNot(Cell2D(1, 1), Cell2D(1, 1))
+            self.assertEqual(Cell2D(1, 1), Cell2D(1, 1))
+        finally:
+            Cell2D.INTERN_LIMIT = limit
+
+    def test_neighbours(self):
+        cells = Cell2D(0, 0).neighbours()
+
+        self.assertEqual(len(cells), 8)
+        self.assertNotIn((0, 0), cells)
+        self.assertIn((1, -1), cells)
+        self.assertEqual(Cell2D(2, 3).origin(10), (20, 30))
 
 
 if __name__ == '__main__':
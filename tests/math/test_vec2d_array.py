@@ -0,0 +1,123 @@
+import math
+import unittest
+
+import numpy as np
+
+from pybox.math.vec2d import Vec2D
+from pybox.math.vec2d_array import Vec2DArray
+
+
+class Vec2DArrayTest(unittest.TestCase):
+    def setUp(self):
+        self.a1 = Vec2DArray([1, 3, 0], [2, 4, 0])
+        self.a2 = Vec2DArray([5, -1, 2], [6, 0.5, -3])
+
+    def tearDown(self):
+        pass
+
+    def assertMatches(self, batch, vectors):
+        self.assertEqual(len(batch), len(vectors))
+
+        for v1, v2 in zip(batch, vectors):
+            self.assertAlmostEqual(v1.x, v2.x)
+            self.assertAlmostEqual(v1.y, v2.y)
+
+    def vectors(self, batch):
+        return [Vec2D(x, y) for x, y in zip(batch.x.tolist(), batch.y.tolist())]
+
+    def test_init(self):
+        self.assertEqual(len(self.a1), 3)
+        self.assertTrue(self.a1.x.flags.c_contiguous)
+        self.assertEqual(self.a1.x.dtype, np.float64)
+        self.assertEqual(Vec2DArray([1], [2], np.float32).y.dtype, np.float32)
+
+        with self.assertRaises(AttributeError):
+            Vec2DArray([1, 2], [3])
+
+    def test_from_vectors(self):
+        a3 = Vec2DArray.from_vectors([Vec2D(1, 2), (3, 4)])
+
+        self.assertEqual(a3.x.tolist(), [1, 3])
+        self.assertEqual(a3.y.tolist(), [2, 4])
+
+    def test_interleaved(self):
+        out = np.zeros(6, dtype=np.float32)
+        pairs = self.a1.interleaved(out)
+
+        self.assertEqual(out.tolist(), [1, 2, 3, 4, 0, 0])
+        self.assertTrue(np.shares_memory(out, pairs))
+
+        a3 = Vec2DArray.from_interleaved(out)
+        self.assertEqual(a3.x.tolist(), self.a1.x.tolist())
+
+    def test_operators(self):
+        for op in ('__add__', '__sub__', '__mul__'):
+            expected = [getattr(v1, op)(v2) for v1, v2 in zip(self.vectors(self.a1), self.vectors(self.a2))]
+            self.assertMatches(getattr(self.a1, op)(self.a2), expected)
+
+        self.assertMatches(self.a1 * 2, [v * 2 for v in self.vectors(self.a1)])
+        self.assertMatches(self.a1 + Vec2D(1, 1), [v + Vec2D(1, 1) for v in self.vectors(self.a1)])
+
+    def test_inplace_operators(self):
+        x = self.a1.x
+
+        self.a1 += self.a2
+        self.a1 *= 2
+
+        self.assertIs(self.a1.x, x)
+        self.assertEqual(self.a1.x.tolist(), [12, 4, 4])
+
+    def test_rotate(self):
+        expected = [v.rotate(math.pi / 3) for v in self.vectors(self.a2)]
+        self.assertMatches(self.a2.rotate(math.pi / 3), expected)
+
+    def test_measures(self):
+        v1s = self.vectors(self.a1)
+        v2s = self.vectors(self.a2)
+
+        np.testing.assert_allclose(self.a1.length(), [v.length() for v in v1s])
+        np.testing.assert_allclose(self.a1.dot(self.a2), [a.dot(b) for a, b in zip(v1s, v2s)])
+        np.testing.assert_allclose(self.a1.cross(self.a2), [a.cross(b) for a, b in zip(v1s, v2s)])
+        np.testing.assert_allclose(self.a1.distance(self.a2), [a.distance(b) for a, b in zip(v1s, v2s)])
+        np.testing.assert_allclose(self.a2.heading(), [v.heading() for v in v2s])
+
+    def test_normalize(self):
+        self.a1.normalize()
+
+        np.testing.assert_allclose(self.a1.length(), [1, 1, 0])
+
+    def test_limit_clamp(self):
+        self.a2.limit(2)
+        np.testing.assert_allclose(self.a2.length(), [2, math.hypot(-1, 0.5), 2])
+
+        self.a1.clamp(3, 4)
+        np.testing.assert_allclose(self.a1.length(), [3, 4, 0])
+
+    def test_lerp(self):
+        a3 = self.a1.lerp(self.a2, 0.5)
+        expected = [a.lerp(b, 0.5) for a, b in zip(self.vectors(self.a1), self.vectors(self.a2))]
+
+        self.assertMatches(a3, expected)
+
+    def test_indexing(self):
+        v1 = self.a1[1]
+        self.assertEqual(v1, Vec2D(3, 4))
+
+        view = self.a1[0:2]
+        view.scale(10)
+        self.assertEqual(self.a1.x.tolist(), [10, 30, 0])
+
+        mask = self.a1.x > 20
+        picked = self.a1[mask]
+        picked.scale(0)
+        self.assertEqual(self.a1.x.tolist(), [10, 30, 0])
+
+        self.a1[mask] = picked
+        self.assertEqual(self.a1.x.tolist(), [10, 0, 0])
+
+        self.a1[2] = Vec2D(7, 8)
+        self.assertEqual(self.a1[2], Vec2D(7, 8))
+
+
+if __name__ == '__main__':
+    unittest.main()